@@ -280,11 +280,13 @@ function resolveUnitAssetMap(unit, assetRegistry) {
 function hydrateUnitsCatalogWithAssets(catalog, options) {
   const source = isPlainObject(options) ? options : {};
   const manifestPath = normalizeString(source.manifestPath);
+  const bundlePath = normalizeString(source.bundlePath);
   const assetRegistry =
     source.assetRegistry && typeof source.assetRegistry.resolveByKey === 'function'
       ? source.assetRegistry
       : createUnitAssetRegistry({
           manifestPath: manifestPath || undefined,
+          bundlePath: bundlePath || undefined,
         });
 
   const sourceCatalog = isPlainObject(catalog) ? catalog : getUnitsCatalog(source);
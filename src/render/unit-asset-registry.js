@@ -7,6 +7,7 @@ const DEFAULT_MANIFEST_PATH = path.resolve(
   __dirname,
   '../../assets/meta/unit-sprite-manifest.json'
 );
+const DEFAULT_BUNDLE_PATH = path.resolve(__dirname, '../../assets/meta/unit-sprite-bundle.json');
 const SUPPORTED_ANIMATIONS = new Set(['idle', 'attack', 'hit', 'die', 'death']);
 
 function normalizeString(value) {
@@ -86,15 +87,113 @@ function loadUnitSpriteManifest(options) {
   };
 }
 
+function loadUnitSpriteBundle(options) {
+  const config = options && typeof options === 'object' ? options : {};
+  const bundlePath = normalizeString(config.bundlePath) || DEFAULT_BUNDLE_PATH;
+
+  if (!fs.existsSync(bundlePath)) {
+    return {
+      bundlePath,
+      bundle: {
+        version: '1.0.0',
+        manifestVersion: '0.1.0',
+        frameFields: {},
+        clips: [],
+        units: {},
+      },
+    };
+  }
+
+  const parsed = JSON.parse(fs.readFileSync(bundlePath, 'utf8'));
+  return {
+    bundlePath,
+    bundle: {
+      version: normalizeString(parsed?.version) || '1.0.0',
+      manifestVersion: normalizeString(parsed?.manifestVersion) || '0.1.0',
+      frameFields: parsed?.frameFields && typeof parsed.frameFields === 'object' ? parsed.frameFields : {},
+      clips: Array.isArray(parsed?.clips) ? parsed.clips : [],
+      units: parsed?.units && typeof parsed.units === 'object' ? parsed.units : {},
+    },
+  };
+}
+
+function expandBundleClip(bundle, clipIndex) {
+  const clip = bundle?.clips?.[clipIndex];
+  if (!clip || typeof clip !== 'object') {
+    return null;
+  }
+
+  const layout = normalizeString(clip.layout) || 'strip';
+  const frameFields = Array.isArray(bundle.frameFields?.[layout]) ? bundle.frameFields[layout] : [];
+  const rows = Array.isArray(clip.cells) ? clip.cells : Array.isArray(clip.frames) ? clip.frames : [];
+  const frames = rows.map((row, index) => {
+    const frame = { index };
+    if (Array.isArray(clip.cells)) {
+      Object.assign(frame, { x: row * clip.frameWidth, y: 0, w: clip.frameWidth, h: clip.frameHeight });
+    } else {
+      frameFields.forEach((field, column) => {
+        frame[field] = row[column];
+      });
+    }
+    frame.durationMs = Array.isArray(clip.durationMs) ? clip.durationMs[index] : clip.durationMs;
+    return frame;
+  });
+
+  const meta = {
+    layout,
+    frameWidth: clip.frameWidth,
+    frameHeight: clip.frameHeight,
+    frameCount: frames.length,
+    fps: clip.fps,
+    loop: clip.loop,
+    anchor: clip.anchor,
+    frames,
+  };
+  if (clip.encoding) {
+    meta.encoding = clip.encoding;
+  }
+  return meta;
+}
+
+function usesDefaultBundle(config) {
+  // An explicit manifest wins; otherwise prefer the compiled bundle whenever it has been built.
+  return !config.manifest && !normalizeString(config.manifestPath) && fs.existsSync(DEFAULT_BUNDLE_PATH);
+}
+
 function createUnitAssetRegistry(options) {
   const config = options && typeof options === 'object' ? options : {};
-  const loaded =
-    config.manifest && typeof config.manifest === 'object'
+  const bundleLoaded =
+    config.bundle && typeof config.bundle === 'object'
+      ? {
+          bundlePath: normalizeString(config.bundlePath) || DEFAULT_BUNDLE_PATH,
+          bundle: config.bundle,
+        }
+      : normalizeString(config.bundlePath) || usesDefaultBundle(config)
+        ? loadUnitSpriteBundle(config)
+        : null;
+  const loaded = bundleLoaded
+    ? {
+        manifestPath: bundleLoaded.bundlePath,
+        manifest: {
+          version: bundleLoaded.bundle.manifestVersion,
+          units: bundleLoaded.bundle.units,
+        },
+      }
+    : config.manifest && typeof config.manifest === 'object'
       ? {
           manifestPath: normalizeString(config.manifestPath) || DEFAULT_MANIFEST_PATH,
           manifest: config.manifest,
         }
       : loadUnitSpriteManifest(config);
+  // Clips are shared by every animation that points at them, so expand each one once.
+  const expandedClips = new Map();
+
+  function bundleMeta(clipIndex) {
+    if (!expandedClips.has(clipIndex)) {
+      expandedClips.set(clipIndex, expandBundleClip(bundleLoaded.bundle, clipIndex));
+    }
+    return expandedClips.get(clipIndex);
+  }
 
   function resolve(unitId, animation) {
     const normalizedUnitId = normalizeString(unitId);
@@ -127,15 +226,21 @@ function createUnitAssetRegistry(options) {
       normalizeString(manifestAnimation.sheetPath) &&
       normalizeString(manifestAnimation.metaPath)
     ) {
+      const value = {
+        key:
+          normalizeString(manifestAnimation.key) || `${normalizedUnitId}.${normalizedAnimation}`,
+        sheetPath: normalizeString(manifestAnimation.sheetPath),
+        metaPath: normalizeString(manifestAnimation.metaPath),
+        source: 'manifest',
+      };
+      const meta = bundleLoaded ? bundleMeta(manifestAnimation.clip) : null;
+      if (meta) {
+        value.source = 'bundle';
+        value.meta = meta;
+      }
       return {
         ok: true,
-        value: {
-          key:
-            normalizeString(manifestAnimation.key) || `${normalizedUnitId}.${normalizedAnimation}`,
-          sheetPath: normalizeString(manifestAnimation.sheetPath),
-          metaPath: normalizeString(manifestAnimation.metaPath),
-          source: 'manifest',
-        },
+        value,
       };
     }
 
@@ -163,6 +268,7 @@ function createUnitAssetRegistry(options) {
   return {
     manifestPath: loaded.manifestPath,
     manifestVersion: normalizeString(loaded.manifest?.version) || '0.1.0',
+    bundled: Boolean(bundleLoaded),
     resolve,
     resolveByKey,
   };
@@ -170,8 +276,11 @@ function createUnitAssetRegistry(options) {
 
 module.exports = {
   DEFAULT_MANIFEST_PATH,
+  DEFAULT_BUNDLE_PATH,
   parseAnimationKey,
   defaultAnimationEntry,
   loadUnitSpriteManifest,
+  loadUnitSpriteBundle,
+  expandBundleClip,
   createUnitAssetRegistry,
 };
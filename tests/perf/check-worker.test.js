@@ -0,0 +1,165 @@
+'use strict';
+
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const childProcess = require('node:child_process');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+
+const {
+  INVALID_PARAMS,
+  METHOD_NOT_FOUND,
+  PARSE_ERROR,
+  countResources,
+  isIdle,
+  normalizeExitCode,
+  parseRequest,
+} = require('../../tools/release-readiness/check-worker');
+
+const WORKER_PATH = path.resolve(__dirname, '../../tools/release-readiness/check-worker.js');
+
+const FIXTURES = {
+  'shared.js': `globalThis.sharedLoads = (globalThis.sharedLoads || 0) + 1;
+module.exports = { loads: () => globalThis.sharedLoads };
+`,
+  'exit-in-try.js': `const shared = require('./shared');
+let entryLoads = 0;
+entryLoads += 1;
+function main() {
+  console.log(\`args=\${process.argv.slice(2).join(',')} shared=\${shared.loads()} entry=\${entryLoads}\`);
+  try {
+    process.exit(Number(process.argv[2]));
+  } catch (error) {
+    process.stderr.write('suppressed\\n');
+    process.exit(1);
+  }
+}
+if (require.main === module) {
+  main();
+}
+`,
+  'async-exit.js': `async function main() {
+  await new Promise((resolve) => setTimeout(resolve, 20));
+  throw new Error('async failure');
+}
+main().catch((error) => {
+  console.error(error.message);
+  process.exit(4);
+});
+`,
+  'exit-code.js': `setTimeout(() => {
+  process.stdout.write('late\\n');
+  process.exitCode = 6;
+}, 20);
+`,
+  'throws.js': `throw new Error('top-level failure');
+`,
+};
+
+function createFixtureDir() {
+  const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'check-worker-'));
+  for (const [name, source] of Object.entries(FIXTURES)) {
+    fs.writeFileSync(path.join(dir, name), source);
+  }
+  return dir;
+}
+
+function runWorker(cwd, requests) {
+  const lines = requests.map((request) => (typeof request === 'string' ? request : JSON.stringify(request)));
+  const result = childProcess.spawnSync(process.execPath, [WORKER_PATH], {
+    cwd,
+    input: `${lines.join('\n')}\n`,
+    encoding: 'utf8',
+  });
+  assert.equal(result.status, 0, result.stderr);
+
+  const responses = new Map();
+  const output = new Map();
+  for (const line of result.stdout.split('\n').filter(Boolean)) {
+    const message = JSON.parse(line);
+    if (message.method === 'output') {
+      const key = message.params.id;
+      output.set(key, `${output.get(key) || ''}${message.params.stream}:${message.params.data}`);
+    } else {
+      responses.set(message.id, message);
+    }
+  }
+  return { responses, output };
+}
+
+function runRequest(id, script, args = []) {
+  return { jsonrpc: '2.0', id, method: 'run', params: { script, args } };
+}
+
+test('parseRequest validates JSON-RPC run requests', () => {
+  assert.deepEqual(parseRequest(JSON.stringify(runRequest(1, 'tools/a.js', ['--x=1']))), {
+    id: 1,
+    script: 'tools/a.js',
+    args: ['--x=1'],
+  });
+  assert.equal(parseRequest('{').error.code, PARSE_ERROR);
+  assert.equal(parseRequest(JSON.stringify({ jsonrpc: '2.0', id: 2, method: 'stop' })).error.code, METHOD_NOT_FOUND);
+  assert.equal(
+    parseRequest(JSON.stringify({ jsonrpc: '2.0', id: 3, method: 'run', params: { script: 'a.js', args: [1] } })).error.code,
+    INVALID_PARAMS
+  );
+});
+
+test('normalizeExitCode mirrors process.exit coercion', () => {
+  assert.equal(normalizeExitCode(undefined), 0);
+  assert.equal(normalizeExitCode(undefined, 3), 3);
+  assert.equal(normalizeExitCode('2'), 2);
+  assert.equal(normalizeExitCode(256 + 7), 7);
+  assert.equal(normalizeExitCode('nope'), 1);
+});
+
+test('isIdle ignores resources that were already open before the run', () => {
+  const baseline = countResources(['PipeWrap', 'Timeout']);
+  assert.equal(isIdle(baseline, countResources(['Timeout', 'PipeWrap'])), true);
+  assert.equal(isIdle(baseline, countResources(['PipeWrap', 'Timeout', 'Timeout'])), false);
+  assert.equal(isIdle(baseline, countResources(['PipeWrap', 'FSReqPromise'])), false);
+});
+
+test('worker runs scripts as main modules and keeps their dependencies cached', () => {
+  const dir = createFixtureDir();
+  try {
+    const { responses, output } = runWorker(dir, [
+      runRequest(1, 'exit-in-try.js', ['3']),
+      runRequest(2, 'exit-in-try.js', ['0']),
+    ]);
+
+    assert.equal(responses.get(1).result.exitCode, 3);
+    assert.equal(responses.get(2).result.exitCode, 0);
+    // The first exit() wins and nothing printed after it reaches the caller.
+    assert.equal(output.get(1), 'stdout:args=3 shared=1 entry=1\n');
+    assert.equal(output.get(2), 'stdout:args=0 shared=1 entry=1\n');
+  } finally {
+    fs.rmSync(dir, { recursive: true, force: true });
+  }
+});
+
+test('worker waits for async work and reports exit codes like a fresh process', () => {
+  const dir = createFixtureDir();
+  try {
+    const { responses, output } = runWorker(dir, [
+      runRequest(1, 'async-exit.js'),
+      runRequest(2, 'exit-code.js'),
+      runRequest(3, 'throws.js'),
+      runRequest(4, 'missing.js'),
+      { jsonrpc: '2.0', id: 5, method: 'stop' },
+    ]);
+
+    assert.equal(responses.get(1).result.exitCode, 4);
+    assert.equal(output.get(1), 'stderr:async failure\n');
+    assert.equal(responses.get(2).result.exitCode, 6);
+    assert.equal(output.get(2), 'stdout:late\n');
+    assert.equal(responses.get(3).result.exitCode, 1);
+    assert.match(output.get(3), /top-level failure/);
+    assert.equal(responses.get(4).result.exitCode, 1);
+    assert.match(output.get(4), /Cannot find module/);
+    assert.equal(responses.get(5).error.code, METHOD_NOT_FOUND);
+  } finally {
+    fs.rmSync(dir, { recursive: true, force: true });
+  }
+});
@@ -2,11 +2,14 @@
 
 const test = require('node:test');
 const assert = require('node:assert/strict');
+const fs = require('node:fs');
 const path = require('node:path');
 
 const {
+  DEFAULT_BUNDLE_PATH,
   parseAnimationKey,
   defaultAnimationEntry,
+  expandBundleClip,
   createUnitAssetRegistry,
 } = require('../../src/render/unit-asset-registry');
 
@@ -58,3 +61,72 @@ test('registry rejects malformed animation key', () => {
   assert.equal(resolved.ok, false);
   assert.equal(resolved.error.code, 'INVALID_ANIMATION_KEY');
 });
+
+test('registry resolves animation metadata from the compiled sprite bundle', () => {
+  const registry = createUnitAssetRegistry({ bundlePath: DEFAULT_BUNDLE_PATH });
+  assert.equal(registry.bundled, true);
+
+  for (const animation of ['idle', 'attack', 'hit', 'die']) {
+    const resolved = registry.resolve('hero_chibi_01', animation);
+    assert.equal(resolved.ok, true);
+    assert.equal(resolved.value.source, 'bundle');
+
+    const meta = JSON.parse(
+      fs.readFileSync(path.resolve(__dirname, '../..', resolved.value.metaPath), 'utf8')
+    );
+    const { layout, ...expanded } = resolved.value.meta;
+    const { version, ...expected } = meta;
+    assert.equal(layout, 'strip');
+    assert.deepEqual(expanded, expected);
+  }
+});
+
+test('registry loads the compiled bundle by default and the manifest when one is given', () => {
+  const registry = createUnitAssetRegistry();
+  assert.equal(registry.bundled, true);
+  assert.equal(registry.resolve('hero_chibi_01', 'idle').value.source, 'bundle');
+
+  const fromManifest = createUnitAssetRegistry({
+    manifestPath: path.resolve(__dirname, '../../assets/meta/unit-sprite-manifest.json'),
+  });
+  assert.equal(fromManifest.bundled, false);
+  assert.equal(fromManifest.resolve('hero_chibi_01', 'idle').value.source, 'manifest');
+});
+
+test('expandBundleClip rebuilds atlas frames from frameFields rows', () => {
+  const meta = expandBundleClip(
+    {
+      frameFields: { atlas: ['sheet', 'x', 'y', 'w', 'h', 'offsetX', 'offsetY'] },
+      clips: [
+        {
+          layout: 'atlas',
+          frameWidth: 64,
+          frameHeight: 64,
+          fps: 10,
+          loop: false,
+          anchor: { x: 0.5, y: 1.0 },
+          durationMs: [100, 200],
+          frames: [
+            [0, 2, 2, 30, 40, 17, 24],
+            [1, 34, 2, 28, 38, 18, 26],
+          ],
+        },
+      ],
+    },
+    0
+  );
+
+  assert.equal(meta.frameCount, 2);
+  assert.deepEqual(meta.frames[1], {
+    index: 1,
+    sheet: 1,
+    x: 34,
+    y: 2,
+    w: 28,
+    h: 38,
+    offsetX: 18,
+    offsetY: 26,
+    durationMs: 200,
+  });
+  assert.equal(expandBundleClip({ clips: [] }, 3), null);
+});
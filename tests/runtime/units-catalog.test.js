@@ -68,6 +68,14 @@ test('hydrateUnitsCatalogWithAssets falls back to convention for non-manifest un
   assert.equal(knight.renderAssets.idle.sheetPath, 'assets/sprites/units/knight_sword/idle.png');
 });
 
+test('hydrateUnitsCatalogWithAssets reads the compiled sprite bundle by default', () => {
+  const hero = hydrateUnitsCatalogWithAssets(loadUnitsCatalog()).byId.hero_chibi_01;
+
+  assert.equal(hero.renderAssets.idle.source, 'bundle');
+  assert.equal(hero.renderAssets.idle.sheetPath, 'assets/sprites/units/hero_chibi_01/idle.png');
+  assert.equal(hero.renderAssets.idle.meta.layout, 'strip');
+});
+
 test('resolveUnitDefinitionId maps runtime instance ids to unit definition ids', () => {
   const catalog = hydrateUnitsCatalogWithAssets(loadUnitsCatalog());
 
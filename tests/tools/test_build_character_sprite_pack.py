@@ -0,0 +1,98 @@
+"""Tests for tools/assets/build-character-sprite-pack.py."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image, ImageChops
+
+from tool_modules import ROOT, load_tool
+
+builder = load_tool("tools/assets/build-character-sprite-pack.py", "build_character_sprite_pack")
+
+HERO_DIR = ROOT / "assets/sprites/units/hero_chibi_01"
+
+
+def hero_key_pose(animation: str, cell: int) -> Image.Image:
+    """One committed frame of the hero, standing in for the (unshipped) key-pose PNG."""
+
+    meta = json.loads((HERO_DIR / f"{animation}.meta.json").read_text(encoding="utf-8"))
+    width, height = meta["frameWidth"], meta["frameHeight"]
+    strip = Image.open(HERO_DIR / f"{animation}.png").convert("RGBA")
+    return strip.crop((cell * width, 0, (cell + 1) * width, height))
+
+
+@unittest.skipIf(builder.np is None, "numpy is not installed")
+class RenderStripTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.source_path = Path(temp_dir.name) / "hit.png"
+        hero_key_pose("hit", 3).save(self.source_path)
+
+    def test_numpy_and_pil_paths_render_identical_pixels(self) -> None:
+        # "die" fades alpha and rotates far enough to clip at the cell edge.
+        for animation in ("die", "attack"):
+            with self.subTest(animation=animation):
+                cells, _ = builder.plan_frames(builder.POSE_SPECS[animation])
+                with_numpy, size = builder.render_strip(self.source_path, cells)
+                with mock.patch.object(builder, "np", None):
+                    without_numpy, pil_size = builder.render_strip(self.source_path, cells)
+
+                self.assertIsNotNone(with_numpy.getbbox())
+                self.assertEqual(size, pil_size)
+                self.assertEqual(with_numpy.mode, without_numpy.mode)
+                self.assertEqual(with_numpy.size, without_numpy.size)
+                self.assertIsNone(ImageChops.difference(with_numpy, without_numpy).getbbox())
+
+
+REST = (-2.0, -10.0, -1.5, 1.00, 1.0)
+PEAK = (2.0, -14.0, 1.5, 1.01, 1.0)
+
+
+class KeyframePlanTest(unittest.TestCase):
+    def test_documented_ping_pong_example(self) -> None:
+        # The example from docs/CHARACTER01_ASSET_PACK.md, "Keyframed poses".
+        spec = builder.PoseSpec(fps=24, loop=True, duration_ms=1000, keyframes=(
+            builder.Keyframe(0.0, REST, "ease-in-out"),
+            builder.Keyframe(0.5, PEAK, "ease-in-out"),
+            builder.Keyframe(1.0, REST),
+        ))
+        cells, frame_cells = builder.plan_frames(spec)
+
+        self.assertEqual(len(frame_cells), 24)
+        self.assertEqual(len(cells), 11)
+        self.assertEqual(frame_cells, frame_cells[:1] + frame_cells[1:][::-1])
+
+    def test_hold_renders_a_single_cell(self) -> None:
+        spec = builder.PoseSpec(fps=12, loop=True, duration_ms=1000, keyframes=(
+            builder.Keyframe(0.0, REST, "hold"),
+            builder.Keyframe(1.0, PEAK),
+        ))
+        cells, frame_cells = builder.plan_frames(spec)
+
+        self.assertEqual(cells, [builder.snap_transform(REST)])
+        self.assertEqual(frame_cells, [0] * 12)
+
+    def test_looping_clip_stops_short_of_its_end(self) -> None:
+        keyframes = (builder.Keyframe(0.0, REST), builder.Keyframe(1.0, PEAK))
+        looping = builder.timeline_transforms(
+            builder.PoseSpec(fps=8, loop=True, duration_ms=500, keyframes=keyframes)
+        )
+        one_shot = builder.timeline_transforms(
+            builder.PoseSpec(fps=8, loop=False, duration_ms=500, keyframes=keyframes)
+        )
+
+        self.assertEqual(len(looping), 4)
+        self.assertEqual(looping[0], builder.snap_transform(REST))
+        # A loop wraps back to at=0.0, so sampling at=1.0 as well would show a pose twice.
+        self.assertNotIn(builder.snap_transform(PEAK), looping)
+        self.assertEqual(one_shot[-1], builder.snap_transform(PEAK))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,390 @@
+"""Tests for the scheduler, stamps, sharding and baseline store in tools/check-release-readiness.py."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tool_modules import load_tool
+
+readiness = load_tool("tools/check-release-readiness.py", "check_release_readiness")
+Check = readiness.Check
+
+
+def python_check(name: str, code: str, **fields) -> Check:
+    return Check(name, [sys.executable, "-c", code], **fields)
+
+
+class SchedulerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cwd = Path(temp_dir.name)
+
+    def run_checks(self, checks: list[Check], jobs: int = 1, **options) -> tuple[int, dict[str, str]]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            code, results = readiness.run_checks(checks, jobs, tail_lines=5, cwd=self.cwd, **options)
+        return code, {result.name: result.status for result in results}
+
+    def logging_check(self, name: str, *depends_on: str, exit_code: int = 0) -> Check:
+        code = f"open('order.log', 'a').write('start {name}\\n'); open('order.log', 'a').write('end {name}\\n')"
+        if exit_code:
+            code += f"; raise SystemExit({exit_code})"
+        return python_check(name, code, depends_on=depends_on)
+
+    def log_lines(self) -> list[str]:
+        return (self.cwd / "order.log").read_text(encoding="utf-8").splitlines()
+
+    def test_dependents_start_after_their_dependencies_finish(self) -> None:
+        checks = [
+            self.logging_check("perf"),
+            self.logging_check("tuning"),
+            self.logging_check("trend", "perf", "tuning"),
+            self.logging_check("proposal", "trend"),
+            self.logging_check("unit tests"),
+        ]
+        code, statuses = self.run_checks(checks, jobs=4)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(set(statuses.values()), {"pass"})
+        lines = self.log_lines()
+        for check in checks:
+            for dependency in check.depends_on:
+                self.assertLess(lines.index(f"end {dependency}"), lines.index(f"start {check.name}"))
+
+    def test_jobs_1_runs_in_declaration_order(self) -> None:
+        checks = [self.logging_check("b"), self.logging_check("a"), self.logging_check("c", "a")]
+        self.run_checks(checks, jobs=1)
+
+        self.assertEqual(self.log_lines(), ["start b", "end b", "start a", "end a", "start c", "end c"])
+
+    def test_failure_cancels_running_checks_and_skips_queued_ones(self) -> None:
+        started_at = time.perf_counter()
+        code, statuses = self.run_checks(
+            [
+                python_check("slow", "import time; time.sleep(30)"),
+                python_check("broken", "import time; time.sleep(0.2); raise SystemExit(2)"),
+                python_check("queued", "pass"),
+                python_check("dependent", "pass", depends_on=("slow",)),
+            ],
+            jobs=2,
+        )
+
+        self.assertEqual(code, 2)
+        self.assertEqual(
+            statuses, {"slow": "cancelled", "broken": "fail", "queued": "skipped", "dependent": "skipped"}
+        )
+        self.assertLess(time.perf_counter() - started_at, 15)
+
+    def test_check_graph_rejects_unknown_dependencies_and_cycles(self) -> None:
+        with self.assertRaisesRegex(RuntimeError, "unknown check"):
+            readiness.validate_check_graph([python_check("a", "pass", depends_on=("missing",))])
+        with self.assertRaisesRegex(RuntimeError, "dependency cycle"):
+            readiness.validate_check_graph(
+                [python_check("a", "pass", depends_on=("b",)), python_check("b", "pass", depends_on=("a",))]
+            )
+        with self.assertRaisesRegex(RuntimeError, "duplicate check names"):
+            readiness.validate_check_graph([python_check("a", "pass"), python_check("a", "pass")])
+
+    def test_non_blocking_failure_fails_the_gate_without_skipping_the_rest(self) -> None:
+        code, statuses = self.run_checks(
+            [
+                python_check("budget", "raise SystemExit(3)", blocking=False),
+                python_check("trend", "pass"),
+                python_check("report", "pass", depends_on=("budget",)),
+            ]
+        )
+
+        self.assertEqual(code, 3)
+        self.assertEqual(statuses, {"budget": "fail", "trend": "pass", "report": "skipped"})
+
+    def test_sprite_budget_runs_last_and_does_not_block(self) -> None:
+        checks = readiness.build_checks(["chapter_1"], allow_missing_baseline=True)
+
+        self.assertEqual(checks[-1].name, readiness.SPRITE_BUDGET_CHECK)
+        self.assertFalse(checks[-1].blocking)
+        self.assertTrue(all(check.blocking for check in checks[:-1]))
+
+
+class CheckStampsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        (self.root / "src").mkdir()
+        (self.root / "src" / "input.txt").write_text("v1", encoding="utf-8")
+        self.check = python_check(
+            "report",
+            "import pathlib; pathlib.Path('out').mkdir(exist_ok=True); "
+            "pathlib.Path('out/report.json').write_text(pathlib.Path('src/input.txt').read_text())",
+            inputs=("src/*.txt",),
+            outputs=("out/report.json",),
+        )
+
+    def run_gate(self, check: Check | None = None) -> str:
+        # A fresh hasher and stamps per run, like separate gate invocations.
+        stamps = readiness.CheckStamps(self.root / "stamps.json", readiness.InputHasher(self.root))
+        stamps.load()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, results = readiness.run_checks([check or self.check], 1, stamps, tail_lines=5, cwd=self.root)
+        return results[0].status
+
+    def test_unchanged_inputs_are_reused(self) -> None:
+        self.assertEqual(self.run_gate(), "pass")
+        self.assertEqual(self.run_gate(), "reused")
+
+    def test_changed_or_added_input_reruns_the_check(self) -> None:
+        self.run_gate()
+        (self.root / "src" / "input.txt").write_text("v2 with another size", encoding="utf-8")
+        self.assertEqual(self.run_gate(), "pass")
+        self.assertEqual((self.root / "out" / "report.json").read_text(encoding="utf-8"), "v2 with another size")
+
+        (self.root / "src" / "extra.txt").write_text("new", encoding="utf-8")
+        self.assertEqual(self.run_gate(), "pass")
+        self.assertEqual(self.run_gate(), "reused")
+
+    def test_changed_command_or_tampered_artifact_reruns_the_check(self) -> None:
+        self.run_gate()
+        (self.root / "out" / "report.json").write_text("stale", encoding="utf-8")
+        self.assertEqual(self.run_gate(), "pass")
+
+        changed = Check(
+            self.check.name, [*self.check.command, "--changed"], inputs=self.check.inputs, outputs=self.check.outputs
+        )
+        self.assertEqual(self.run_gate(changed), "pass")
+
+    def test_failure_forgets_the_stamp(self) -> None:
+        self.run_gate()
+        broken = Check(self.check.name, [sys.executable, "-c", "raise SystemExit(1)"], inputs=self.check.inputs)
+        self.assertIn("report", json.loads((self.root / "stamps.json").read_text(encoding="utf-8"))["checks"])
+        self.assertEqual(self.run_gate(broken), "fail")
+        self.assertNotIn("report", json.loads((self.root / "stamps.json").read_text(encoding="utf-8"))["checks"])
+
+
+class ShardMergeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        patcher = mock.patch.object(readiness, "ROOT", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_shard(
+        self, index: int, count: int, results: dict[str, str], outputs: dict[str, str], name: str = ""
+    ) -> Path:
+        shard_dir = self.root / (name or f"shard-{index}-of-{count}")
+        shard_dir.mkdir()
+        for name, text in outputs.items():
+            (shard_dir / name).write_text(text, encoding="utf-8")
+        payload = {
+            "shardIndex": index,
+            "shardCount": count,
+            "ok": all(status in ("pass", "reused") for status in results.values()),
+            "checks": list(results),
+            "results": [{"name": name, "status": status} for name, status in results.items()],
+        }
+        (shard_dir / f"shard-result.{index}-of-{count}.json").write_text(json.dumps(payload), encoding="utf-8")
+        return shard_dir
+
+    def test_plan_is_deterministic_greedy_longest_first(self) -> None:
+        checks = [Check(name, ["true"]) for name in "abcdef"]
+        durations = {"a": 10.0, "b": 8.0, "c": 5.0, "d": 4.0, "e": 3.0}  # f has no history: median 5.0
+
+        plan = readiness.plan_shards(checks, 2, durations)
+        self.assertEqual([[check.name for check in shard] for shard in plan], [["a", "e", "f"], ["b", "c", "d"]])
+        self.assertEqual(readiness.plan_shards(checks, 2, dict(reversed(durations.items()))), plan)
+        for count in (1, 3, 6, 8):
+            names = [check.name for shard in readiness.plan_shards(checks, count, durations) for check in shard]
+            self.assertEqual(sorted(names), list("abcdef"))
+
+    def test_historical_durations_use_the_median_of_recent_passes(self) -> None:
+        history = self.root / "history"
+        history.mkdir()
+        runs = [{"a": 100, "b": 40}, {"a": 300, "b": 60}, {"a": 200}, {"a": 9000}]
+        for index, run in enumerate(runs):
+            checks = [{"name": name, "status": "pass", "wallMs": wall} for name, wall in run.items()]
+            if index == 2:
+                checks.append({"name": "b", "status": "fail", "wallMs": 1})
+            (history / f"gate-timings.2026010{index}T000000Z.json").write_text(
+                json.dumps({"checks": checks}), encoding="utf-8"
+            )
+
+        self.assertEqual(readiness.load_historical_durations(history, limit=3), {"a": 300.0, "b": 60.0})
+        self.assertEqual(readiness.load_historical_durations(self.root / "missing"), {})
+
+    def test_merge_copies_every_shards_artifacts(self) -> None:
+        sharded = [Check(name, ["true"], outputs=(readiness.artifact(f"{name}.json"),)) for name in ("perf", "tuning")]
+        shard_dirs = [
+            self.write_shard(0, 2, {"perf": "pass"}, {"perf.json": '{"shard": 0}'}),
+            self.write_shard(1, 2, {"tuning": "reused"}, {"tuning.json": '{"shard": 1}'}),
+        ]
+
+        self.assertEqual(readiness.collect_shard_artifacts(shard_dirs, sharded), [])
+        artifact_dir = self.root / readiness.ARTIFACT_DIR
+        self.assertEqual((artifact_dir / "perf.json").read_text(encoding="utf-8"), '{"shard": 0}')
+        self.assertEqual((artifact_dir / "tuning.json").read_text(encoding="utf-8"), '{"shard": 1}')
+
+    def test_merge_rejects_incomplete_or_inconsistent_shards(self) -> None:
+        sharded = [Check(name, ["true"], outputs=(readiness.artifact(f"{name}.json"),)) for name in ("perf", "tuning")]
+        first = self.write_shard(0, 2, {"perf": "pass"}, {"perf.json": "{}"})
+
+        with self.assertRaisesRegex(RuntimeError, "missing shard result"):
+            readiness.collect_shard_artifacts([first], sharded)
+        other_plan = self.write_shard(1, 2, {"other": "pass"}, {})
+        with self.assertRaisesRegex(RuntimeError, "no shard ran: tuning"):
+            readiness.collect_shard_artifacts([first, other_plan], sharded)
+        three_way = self.write_shard(2, 3, {"tuning": "pass"}, {"tuning.json": "{}"})
+        with self.assertRaisesRegex(RuntimeError, "shardCount 3, expected 2"):
+            readiness.collect_shard_artifacts([first, three_way], sharded)
+        no_artifact = self.write_shard(1, 2, {"tuning": "pass"}, {}, name="no-artifact")
+        with self.assertRaisesRegex(RuntimeError, "shard artifact missing for 'tuning'"):
+            readiness.collect_shard_artifacts([first, no_artifact], sharded)
+
+    def test_merge_reports_non_blocking_shard_failures(self) -> None:
+        sharded = [
+            Check("perf", ["true"], outputs=(readiness.artifact("perf.json"),)),
+            Check("budget", ["true"], outputs=(readiness.artifact("budget.json"),), blocking=False),
+        ]
+        shard_dirs = [
+            self.write_shard(0, 2, {"perf": "pass"}, {"perf.json": "{}"}),
+            self.write_shard(1, 2, {"budget": "fail"}, {}),
+        ]
+
+        self.assertEqual(readiness.collect_shard_artifacts(shard_dirs, sharded), ["budget"])
+        self.assertTrue((self.root / readiness.ARTIFACT_DIR / "perf.json").is_file())
+
+        blocking = [Check("budget", ["true"], outputs=(readiness.artifact("budget.json"),))]
+        with self.assertRaisesRegex(RuntimeError, "did not pass"):
+            readiness.collect_shard_artifacts(shard_dirs[1:], blocking)
+
+
+class BaselineTest(unittest.TestCase):
+    commit = "0123456789abcdef0123456789abcdef01234567"
+    runtime = "v22.0.0"
+
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.store = readiness.BaselineStore(self.root / "store", max_entries=3)
+        self.baseline_dir = self.root / "baseline"
+        for name, value in (
+            ("BASELINE_DIR", self.baseline_dir),
+            ("ROOT", self.root),
+            ("resolve_commit", lambda ref: self.commit),
+            ("node_runtime", lambda: self.runtime),
+        ):
+            patcher = mock.patch.object(readiness, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def store_check(self, text: str = '{"p95": 1.5}') -> Check:
+        output = self.root / "work" / readiness.ARTIFACT_DIR / "perf-gate-report.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text, encoding="utf-8")
+        return Check(
+            readiness.PERF_GATE_CHECK,
+            ["node", "tools/perf/run-and-check.js"],
+            inputs=("src/**/*.js", "package.json"),
+            outputs=(readiness.artifact("perf-gate-report.json"),),
+        )
+
+    def test_entry_key_follows_input_blobs_command_and_runtime(self) -> None:
+        check = self.store_check()
+        blobs = {"src/a.js": "1" * 40, "src/sim/b.js": "2" * 40, "docs/readme.md": "3" * 40, "package.json": "4" * 40}
+        key = self.store.entry_key(check, blobs, self.runtime)
+
+        self.assertEqual(self.store.entry_key(check, dict(reversed(blobs.items())), self.runtime), key)
+        self.assertEqual(self.store.entry_key(check, {**blobs, "docs/readme.md": "5" * 40}, self.runtime), key)
+        self.assertNotEqual(self.store.entry_key(check, {**blobs, "src/sim/b.js": "5" * 40}, self.runtime), key)
+        self.assertNotEqual(self.store.entry_key(check, {**blobs, "src/new.js": "5" * 40}, self.runtime), key)
+        self.assertNotEqual(self.store.entry_key(check, blobs, "v24.0.0"), key)
+        changed = Check(check.name, [*check.command, "--iterations=10"], inputs=check.inputs, outputs=check.outputs)
+        self.assertNotEqual(self.store.entry_key(changed, blobs, self.runtime), key)
+
+    def test_put_then_lookup_round_trips_the_outputs(self) -> None:
+        check = self.store_check()
+        key = "ab" + "0" * 62
+        self.assertIsNone(self.store.lookup(key))
+
+        self.store.put(key, check, self.commit, self.root / "work")
+        stored = self.store.lookup(key)
+
+        self.assertEqual(list(stored), ["perf-gate-report.json"])
+        self.assertEqual(stored["perf-gate-report.json"].read_text(encoding="utf-8"), '{"p95": 1.5}')
+        self.assertFalse((self.store.root / "tmp" / f"{key}.{os.getpid()}").exists())
+
+    def test_corrupted_entry_is_rejected_and_evicted(self) -> None:
+        check = self.store_check()
+        key = "cd" + "0" * 62
+        stored = self.store.put(key, check, self.commit, self.root / "work")
+        stored["perf-gate-report.json"].write_text('{"p95": 0.1}', encoding="utf-8")
+
+        self.assertIsNone(self.store.lookup(key))
+        self.assertFalse(self.store.entry_dir(key).exists())
+
+        self.store.put(key, check, self.commit, self.root / "work")
+        (self.store.entry_dir(key) / "entry.json").write_text("{", encoding="utf-8")
+        self.assertIsNone(self.store.lookup(key))
+
+    def test_put_fails_when_the_check_wrote_no_output(self) -> None:
+        check = self.store_check()
+        (self.root / "work" / check.outputs[0]).unlink()
+        with self.assertRaisesRegex(RuntimeError, "did not write"):
+            self.store.put("ef" + "0" * 62, check, self.commit, self.root / "work")
+
+    def test_prune_keeps_the_most_recently_used_entries(self) -> None:
+        check = self.store_check()
+        keys = [f"{index:02x}" + "0" * 62 for index in range(5)]
+        for age, key in enumerate(keys):
+            self.store.put(key, check, self.commit, self.root / "work")
+            stamp = 1_000_000 + age * 100
+            os.utime(self.store.entry_dir(key), (stamp, stamp))
+        self.store.lookup(keys[0])  # a hit refreshes the entry
+
+        self.assertEqual(self.store.prune(), 2)
+        self.assertEqual(
+            [key for key in keys if self.store.entry_dir(key).exists()], [keys[0], keys[3], keys[4]]
+        )
+
+    def test_commit_alias_is_ignored_for_another_runtime(self) -> None:
+        self.store.save_alias(self.commit, self.runtime, ["chapter_1"], {"perf": "0" * 64})
+
+        self.assertEqual(self.store.load_alias(self.commit, self.runtime)["chapters"], ["chapter_1"])
+        self.assertIsNone(self.store.load_alias(self.commit, "v24.0.0"))
+        self.assertIsNone(self.store.load_alias("f" * 40, self.runtime))
+
+    def test_baseline_dir_is_cleared_before_stored_reports_are_copied(self) -> None:
+        checks = readiness.baseline_checks(["chapter_1"])
+        keys = {}
+        for check in checks:
+            keys[check.name] = f"{len(keys):064x}"
+            for output in check.outputs:
+                (self.root / output).parent.mkdir(parents=True, exist_ok=True)
+                (self.root / output).write_text(json.dumps({"check": check.name}), encoding="utf-8")
+            self.store.put(keys[check.name], check, self.commit, self.root)
+        self.store.save_alias(self.commit, self.runtime, ["chapter_1"], keys)
+        self.baseline_dir.mkdir()
+        (self.baseline_dir / "tuning-gate-report.chapter_removed.json").write_text("{}", encoding="utf-8")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            code = readiness.run_baseline("main", self.store, 1, None, 0)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            sorted(path.name for path in self.baseline_dir.iterdir()),
+            ["perf-gate-report.json", "tuning-gate-report.chapter_1.json"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for tools/assets/check-sprite-budget.py waivers."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from tool_modules import ROOT, load_tool
+
+sprite_budget = load_tool("tools/assets/check-sprite-budget.py", "check_sprite_budget")
+
+MANIFEST_PATH = ROOT / "assets/meta/unit-sprite-manifest.json"
+THRESHOLDS_PATH = ROOT / "tools/assets/sprite-budget-thresholds.json"
+
+
+class WaiverTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.thresholds = json.loads(THRESHOLDS_PATH.read_text(encoding="utf-8"))
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def run_check(self, today: date) -> dict:
+        path = Path(self.temp_dir.name) / "thresholds.json"
+        path.write_text(json.dumps(self.thresholds), encoding="utf-8")
+        return sprite_budget.run_budget_check(MANIFEST_PATH, path, iterations=1, today=today)
+
+    def test_active_waivers_report_without_failing(self) -> None:
+        expires = min(date.fromisoformat(waiver["expires"]) for waiver in self.thresholds["waivers"].values())
+        report = self.run_check(expires)
+
+        self.assertTrue(report["ok"])
+        self.assertEqual(report["failures"], [])
+        self.assertTrue(report["waived"])
+        for entry in report["sheets"]:
+            if not entry["ok"]:
+                self.assertTrue(entry["waived"])
+                self.assertEqual(set(entry["waiver"]), {"reason", "owner", "expires"})
+
+    def test_waivers_lapse_after_their_expiry_date(self) -> None:
+        for waiver in self.thresholds["waivers"].values():
+            waiver["expires"] = "2026-01-31"
+        report = self.run_check(date(2026, 2, 1))
+
+        self.assertFalse(report["ok"])
+        self.assertEqual(report["waived"], [])
+        self.assertIn("expiredWaivers=", sprite_budget.summary_line(report))
+
+    def test_waiver_without_owner_or_expiry_is_rejected(self) -> None:
+        sheet = next(iter(self.thresholds["waivers"]))
+        self.thresholds["waivers"][sheet] = "untrimmed strip"
+        with self.assertRaisesRegex(RuntimeError, "reason, owner and expires"):
+            self.run_check(date(2026, 1, 1))
+
+        self.thresholds["waivers"][sheet] = {"reason": "untrimmed", "owner": "asset-pipeline", "expires": "soon"}
+        with self.assertRaisesRegex(RuntimeError, "YYYY-MM-DD"):
+            self.run_check(date(2026, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+"""Regression tests for tools/validate-schemas.py."""
+
+from __future__ import annotations
+
+import copy
+import io
+import json
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+from typing import Any
+
+from tool_modules import ROOT, load_tool
+
+validate_schemas = load_tool("tools/validate-schemas.py", "validate_schemas")
+
+
+class IntegrityPassTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.documents = validate_schemas.load_integrity_documents()
+
+    def test_shipped_samples_have_no_integrity_errors(self) -> None:
+        issues, resolved, indexed = validate_schemas.check_integrity(self.documents)
+        self.assertEqual([issue for issue in issues if issue.level == "error"], [])
+        self.assertGreater(resolved, 0)
+        self.assertGreater(indexed, 0)
+
+    def test_schema_invalid_wave_ids_are_skipped_not_crashed_on(self) -> None:
+        documents = copy.deepcopy(self.documents)
+        waves = documents["waves.sample.json"]["waves"]
+        waves[0]["spawns"][0]["enemyId"] = ["goblin"]
+        waves[1]["chapterId"] = {"id": "chapter_1"}
+        documents["enemies.sample.json"]["enemies"][0]["chapterId"] = ["chapter_1"]
+
+        schema = validate_schemas.parse_json(validate_schemas.SCHEMAS_DIR / "waves.schema.json")
+        schema_errors = validate_schemas.validate_node(documents["waves.sample.json"], schema, "$")
+        self.assertTrue(any(error.path == "$.waves[0].spawns[0].enemyId" for error in schema_errors))
+        self.assertTrue(any(error.path == "$.waves[1].chapterId" for error in schema_errors))
+
+        issues, _, _ = validate_schemas.check_integrity(documents)
+        self.assertEqual([issue for issue in issues if issue.level == "error"], [])
+
+    def test_proposed_rules_warn_without_failing(self) -> None:
+        documents = copy.deepcopy(self.documents)
+        documents["enemies.sample.json"]["enemies"][0]["chapterId"] = "chapter_unlisted"
+
+        issues, _, _ = validate_schemas.check_integrity(documents)
+        proposed = [issue for issue in issues if issue.rule_id in ("IR-011", "IR-013")]
+        self.assertTrue(any(issue.rule_id == "IR-011" for issue in proposed))
+        self.assertTrue(any(issue.rule_id == "IR-013" for issue in proposed))
+        self.assertEqual({issue.level for issue in proposed}, {"warn"})
+        self.assertEqual([issue for issue in issues if issue.level == "error"], [])
+
+
+MUTATION_VALUES = (None, True, -1, 1.5, "", "unknown_id", [], {}, [1, "a"], {"unexpected": 1})
+
+
+def stream_errors(text: str, schema_name: str, chunk_size: int, inline_limit: int) -> list[Any]:
+    """validate_stream with a small read buffer, so containers are streamed member by member."""
+
+    root = validate_schemas.stream_schema(validate_schemas.SCHEMAS.lookup(schema_name, ""), schema_name)
+    reader = validate_schemas.JsonEventReader(io.StringIO(text), chunk_size=chunk_size, inline_limit=inline_limit)
+    try:
+        return validate_schemas.validate_events(reader.events(), root)
+    except validate_schemas.StreamSyntaxError as error:
+        return [validate_schemas.ValidationError("$", f"invalid JSON: {error}")]
+
+
+def tree_errors(text: str, schema_name: str) -> list[Any]:
+    return validate_schemas.validate_document_text(validate_schemas.SCHEMAS.validator_for(schema_name), text)
+
+
+def containers(node: Any) -> list[Any]:
+    found = [node] if isinstance(node, (dict, list)) else []
+    for child in node.values() if isinstance(node, dict) else node if isinstance(node, list) else ():
+        found.extend(containers(child))
+    return found
+
+
+def mutate(document: Any, rng: random.Random) -> None:
+    """Replace, drop or add one member somewhere in the document."""
+
+    target = rng.choice([node for node in containers(document) if node])
+    key = rng.choice(list(target)) if isinstance(target, dict) else rng.randrange(len(target))
+    action = rng.random()
+    if isinstance(target, dict) and action < 0.2:
+        del target[key]
+    elif isinstance(target, dict) and action < 0.3:
+        target["unexpectedField"] = rng.choice(MUTATION_VALUES)
+    else:
+        target[key] = copy.deepcopy(rng.choice(MUTATION_VALUES))
+
+
+class StatusRegistryTest(unittest.TestCase):
+    @unittest.skipIf(shutil.which("node") is None, "node is not installed")
+    def test_parsed_ids_match_the_loaded_registry(self) -> None:
+        module = json.dumps(f"./{validate_schemas.STATUS_SOURCE}")
+        script = f"console.log(JSON.stringify(Object.keys(require({module}).STATUS_REGISTRY)))"
+        output = subprocess.run(["node", "-e", script], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(validate_schemas.load_status_ids(), tuple(json.loads(output)))
+
+    def test_new_registry_entry_is_picked_up(self) -> None:
+        source = (ROOT / validate_schemas.STATUS_SOURCE).read_text(encoding="utf-8")
+        drifted = source.replace(
+            "const STATUS_REGISTRY = Object.freeze({\n",
+            'const STATUS_REGISTRY = Object.freeze({\n  freeze: Object.freeze({\n    id: "freeze",\n  }),\n',
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "statusRegistry.js"
+            path.write_text(drifted, encoding="utf-8")
+            self.assertEqual(validate_schemas.load_status_ids(path), ("freeze", "slow", "stun", "burn"))
+
+    def test_unreadable_registry_is_an_error(self) -> None:
+        issues: list[Any] = []
+        with mock.patch.object(validate_schemas, "load_status_ids", return_value=()):
+            validate_schemas.build_indexes({}, issues)
+        self.assertEqual([(issue.level, issue.file) for issue in issues], [("error", validate_schemas.STATUS_SOURCE)])
+
+
+class StreamModeParityTest(unittest.TestCase):
+    """Stream mode must report exactly the tree validator's errors, in the same order."""
+
+    def assert_same_errors(self, text: str, schema_name: str) -> list[Any]:
+        expected = tree_errors(text, schema_name)
+        for chunk_size, inline_limit in ((7, 0), (64, 48)):
+            self.assertEqual(stream_errors(text, schema_name, chunk_size, inline_limit), expected)
+        return expected
+
+    def test_samples_match_tree_mode(self) -> None:
+        for schema_name, sample_name in validate_schemas.PAIRS:
+            with self.subTest(sample=sample_name):
+                text = (validate_schemas.EXAMPLES_DIR / sample_name).read_text(encoding="utf-8")
+                self.assertEqual(self.assert_same_errors(text, schema_name), [])
+
+    def test_mutated_samples_match_tree_mode(self) -> None:
+        rng = random.Random(2026)
+        failing = 0
+        for schema_name, sample_name in validate_schemas.PAIRS:
+            sample = validate_schemas.parse_json(validate_schemas.EXAMPLES_DIR / sample_name)
+            for round_index in range(25):
+                document = copy.deepcopy(sample)
+                for _ in range(1 + round_index % 3):
+                    mutate(document, rng)
+                with self.subTest(sample=sample_name, round=round_index):
+                    failing += bool(self.assert_same_errors(json.dumps(document), schema_name))
+        # The mutations must actually exercise error reporting, not just valid documents.
+        self.assertGreater(failing, 100)
+
+    def test_nested_containers_match_tree_mode(self) -> None:
+        document = validate_schemas.parse_json(validate_schemas.EXAMPLES_DIR / "units.sample.json")
+        nested: Any = ["leaf"]
+        for _ in range(200):
+            nested = [nested, {"depth": nested}] if len(json.dumps(nested)) < 4096 else [nested]
+        document["units"][0]["tags"] = nested
+        document["units"][0]["stats"] = {"nested": nested}
+
+        errors = self.assert_same_errors(json.dumps(document), "units.schema.json")
+        self.assertTrue(errors)
+
+    def test_deep_nesting_past_the_recursion_limit_streams(self) -> None:
+        depth = sys.getrecursionlimit() * 5
+        document = validate_schemas.parse_json(validate_schemas.EXAMPLES_DIR / "units.sample.json")
+        document["units"][0]["tags"] = "__deep__"
+        text = json.dumps(document)
+
+        shallow = text.replace('"__deep__"', "[[]]")
+        deep = text.replace('"__deep__"', "[" * depth + "]" * depth)
+        with self.assertRaises(RecursionError):
+            json.loads(deep)
+        expected = tree_errors(shallow, "units.schema.json")
+        self.assertTrue(expected)
+        self.assertEqual(stream_errors(deep, "units.schema.json", 4096, 1024), expected)
+
+    def test_truncated_documents_fail_at_the_same_offset(self) -> None:
+        for schema_name, sample_name in validate_schemas.PAIRS:
+            text = (validate_schemas.EXAMPLES_DIR / sample_name).read_text(encoding="utf-8").rstrip()
+            for end in range(0, len(text), 29):
+                with self.subTest(sample=sample_name, end=end):
+                    expected = tree_errors(text[:end], schema_name)
+                    actual = stream_errors(text[:end], schema_name, 7, 0)
+                    self.assertEqual([error.path for error in actual], ["$"])
+                    self.assertTrue(actual[0].message.startswith("invalid JSON: "))
+                    self.assertEqual(
+                        re.search(r"char (\d+)", actual[0].message).group(1),
+                        re.search(r"char (\d+)", expected[0].message).group(1),
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
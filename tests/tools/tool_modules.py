@@ -0,0 +1,21 @@
+"""Import the hyphenated scripts under tools/ as modules for the unittest suite."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def load_tool(relative_path: str, name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before exec so the module's dataclasses can resolve their own module.
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -9,28 +9,130 @@ Output defaults:
   assets/sprites/units/hero_chibi_01/{idle,attack,hit,die}.png
   assets/sprites/units/hero_chibi_01/{idle,attack,hit,die}.meta.json
   assets/meta/unit-sprite-manifest.json
+  assets/meta/unit-sprite-bundle.json
+
+With --atlas, frames are trimmed to their alpha bounding box and packed into
+power-of-two pages (atlas-<n>.png) shared by all animations of the unit. Each
+meta frame then records its page plus the trim offset inside the full frame.
+
+With --batch, several unit source directories (or globs) are built in a process
+pool and the manifest is rewritten once, atomically, at the end.
+
+Each meta records a build key (source PNG hash + PoseSpec + tool version + layout
+options) and the hash of the sheets it points at. Outputs whose key and sheets are
+still current are skipped; --force rebuilds everything.
+
+With --scales, lower-resolution tiers (e.g. 1,0.5,0.25) are downscaled from the same
+rendered frames and written next to the 1x output as <name>@<scale>x.*; the manifest
+lists them per animation under "tiers".
+
+--format picks the sheet encoder (plain/optimized/palette PNG, lossless/lossy WebP,
+with --quality); every rebuilt sheet is reported with its byte size and decode time
+against the plain-PNG baseline, and metas record the encoding.
+
+A PoseSpec either lists every frame's transform or gives keyframes with easing plus a
+duration; keyframed specs are sampled at the spec's fps. Frames that come out identical
+(after snapping to TRANSFORM_STEPS) are rendered into one cell that several meta
+frames point at.
+
+Frames are written straight into the strip buffer (numpy when installed, PIL otherwise);
+both paths produce identical pixels.
+
+After the manifest, the manifest and every animation meta it points at are compiled into
+one startup bundle (--bundle-path): the manifest entries plus a "clips" table of deduped
+frame data. Regular strip frames collapse to their cell indexes, other frames to arrays in
+"frameFields" order, and a uniform durationMs to one number. --bundle-only recompiles the
+bundle from the files on disk without rendering.
 """
 
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
+import io
 import json
-from dataclasses import dataclass
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from PIL import Image
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the PIL path renders the same pixels, just slower.
+    np = None
+
 
 ROOT = Path(__file__).resolve().parents[2]
+ANIMATIONS = ("idle", "attack", "hit", "die")
+SOURCE_FILES = {"idle": "idle.png", "attack": "attack.png", "hit": "hit.png", "die": "death.png"}
+
+DEFAULT_SCALES = (1.0,)
+# encoder -> (file extension, whether --quality applies)
+SHEET_FORMATS = {
+    "png": ("png", False),
+    "png-optimized": ("png", False),
+    "png-palette": ("png", True),
+    "webp-lossless": ("webp", True),
+    "webp": ("webp", True),
+}
+
+# Format version of unit-sprite-bundle.json; bump when clips/frameFields change shape.
+BUNDLE_VERSION = "1.0.0"
+BUNDLE_FRAME_FIELDS = {
+    "strip": ("x", "y", "w", "h"),
+    "atlas": ("sheet", "x", "y", "w", "h", "offsetX", "offsetY"),
+}
+# Any change to this builder invalidates previously recorded build keys.
+TOOL_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+Transform = Tuple[float, float, float, float, float]
+# (dx, dy, rotation_deg, scale, alpha)
+
+EASINGS: Dict[str, Callable[[float], float]] = {
+    "linear": lambda t: t,
+    "ease-in": lambda t: t * t,
+    "ease-out": lambda t: 1 - (1 - t) * (1 - t),
+    "ease-in-out": lambda t: t * t * (3 - 2 * t),
+    "hold": lambda t: 0.0,
+}
+
+# Sampled transforms snap to these steps so poses that would render the same pixels
+# collapse into one cell: (dx px, dy px, rotation deg, scale, alpha).
+TRANSFORM_STEPS = (0.5, 0.5, 0.25, 0.002, 1 / 255)
+
+
+@dataclass(frozen=True)
+class Keyframe:
+    at: float  # position in the clip: 0.0 = first frame, 1.0 = end
+    transform: Transform
+    easing: str = "linear"  # curve from this keyframe to the next one
 
 
 @dataclass(frozen=True)
 class PoseSpec:
     fps: int
     loop: bool
-    transforms: Tuple[Tuple[float, float, float, float, float], ...]
-    # (dx, dy, rotation_deg, scale, alpha)
+    transforms: Tuple[Transform, ...] = ()
+    keyframes: Tuple[Keyframe, ...] = ()
+    duration_ms: int = 0
+
+    def __post_init__(self) -> None:
+        if bool(self.transforms) == bool(self.keyframes):
+            raise ValueError("PoseSpec needs either transforms or keyframes")
+        if self.keyframes:
+            if self.duration_ms <= 0:
+                raise ValueError("keyframed PoseSpec needs a positive duration_ms")
+            for keyframe in self.keyframes:
+                if not 0 <= keyframe.at <= 1:
+                    raise ValueError(f"keyframe position must be within [0, 1]: {keyframe.at}")
+                if keyframe.easing not in EASINGS:
+                    raise ValueError(f"unknown easing: {keyframe.easing}")
 
 
 POSE_SPECS: Dict[str, PoseSpec] = {
@@ -77,6 +179,48 @@ POSE_SPECS: Dict[str, PoseSpec] = {
 }
 
 
+def snap_transform(transform: Sequence[float]) -> Transform:
+    return tuple(round(value / step) * step for value, step in zip(transform, TRANSFORM_STEPS))  # type: ignore[return-value]
+
+
+def sample_keyframes(keyframes: Sequence[Keyframe], at: float) -> Transform:
+    ordered = sorted(keyframes, key=lambda keyframe: keyframe.at)
+    if at <= ordered[0].at:
+        return ordered[0].transform
+    for current, following in zip(ordered, ordered[1:]):
+        if at < following.at:
+            progress = EASINGS[current.easing]((at - current.at) / (following.at - current.at))
+            return tuple(  # type: ignore[return-value]
+                start + (end - start) * progress for start, end in zip(current.transform, following.transform)
+            )
+    return ordered[-1].transform
+
+
+def timeline_transforms(pose_spec: PoseSpec) -> List[Transform]:
+    """Transform of every frame in playback order."""
+
+    if not pose_spec.keyframes:
+        return list(pose_spec.transforms)
+    count = max(1, int(round(pose_spec.duration_ms * pose_spec.fps / 1000)))
+    # Looping clips wrap back to the start, so their last frame stops short of at=1.0.
+    span = count if pose_spec.loop else max(1, count - 1)
+    return [snap_transform(sample_keyframes(pose_spec.keyframes, index / span)) for index in range(count)]
+
+
+def plan_frames(pose_spec: PoseSpec) -> Tuple[List[Transform], List[int]]:
+    """Unique transforms to render (one cell each) and the cell used by every frame."""
+
+    cells: List[Transform] = []
+    cell_of: Dict[Transform, int] = {}
+    frame_cells = []
+    for transform in timeline_transforms(pose_spec):
+        if transform not in cell_of:
+            cell_of[transform] = len(cells)
+            cells.append(transform)
+        frame_cells.append(cell_of[transform])
+    return cells, frame_cells
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build sprite-strip + metadata from key poses.")
     parser.add_argument(
@@ -99,7 +243,90 @@ def parse_args() -> argparse.Namespace:
         default="assets/meta/unit-sprite-manifest.json",
         help="Manifest file to create/update.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--bundle-path",
+        default="assets/meta/unit-sprite-bundle.json",
+        help="Compiled startup bundle (manifest + every animation meta) to write.",
+    )
+    parser.add_argument(
+        "--bundle-only",
+        action="store_true",
+        help="Only recompile the bundle from the manifest and metas on disk; render nothing.",
+    )
+    parser.add_argument(
+        "--atlas",
+        action="store_true",
+        help="Trim frames and pack all animations into power-of-two atlas pages instead of strips.",
+    )
+    parser.add_argument(
+        "--atlas-max-size",
+        type=int,
+        default=2048,
+        help="Maximum atlas page edge in pixels (power of two).",
+    )
+    parser.add_argument(
+        "--atlas-padding",
+        type=int,
+        default=2,
+        help="Transparent pixels kept between packed frames.",
+    )
+    parser.add_argument(
+        "--scales",
+        default="1",
+        help="Comma-separated resolution tiers in (0, 1], e.g. 1,0.5,0.25. The 1x tier is always built.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(SHEET_FORMATS),
+        default="png",
+        help="Sheet encoder (default: png).",
+    )
+    parser.add_argument(
+        "--quality",
+        type=int,
+        default=90,
+        help=(
+            "0-100. Lossy WebP quality, lossless WebP compression effort, "
+            "or palette size (percent of 256 colours) for png-palette."
+        ),
+    )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="SOURCE_DIR",
+        help=(
+            "Build many units: each entry is a source directory or glob (unit id = directory name), "
+            "or UNIT_ID=DIR. Overrides --input-dir/--unit-id."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --batch (default: CPU count).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every sheet even when its build key is unchanged.",
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    if args.atlas_max_size < 1 or args.atlas_max_size & (args.atlas_max_size - 1):
+        parser.error("--atlas-max-size must be a power of two")
+    if args.atlas_padding < 0:
+        parser.error("--atlas-padding must be >= 0")
+    if not 0 <= args.quality <= 100:
+        parser.error("--quality must be between 0 and 100")
+    try:
+        scales = {float(part) for part in args.scales.split(",") if part.strip()}
+    except ValueError:
+        parser.error("--scales must be a comma-separated list of numbers")
+    if any(not 0 < scale <= 1 for scale in scales):
+        parser.error("--scales values must be in (0, 1]")
+    args.scales = tuple(sorted(scales | {1.0}, reverse=True))
+    return args
 
 
 def clamp_alpha(image: Image.Image, alpha_scale: float) -> Image.Image:
@@ -110,34 +337,63 @@ def clamp_alpha(image: Image.Image, alpha_scale: float) -> Image.Image:
     return Image.merge("RGBA", (r, g, b, a))
 
 
-def build_frame(
-    subject: Image.Image,
+def transform_subject(subject: Image.Image, scale: float, rotation_deg: float) -> Image.Image:
+    target_w = max(1, int(round(subject.width * scale)))
+    target_h = max(1, int(round(subject.height * scale)))
+    transformed = subject.resize((target_w, target_h), Image.Resampling.LANCZOS)
+    return transformed.rotate(rotation_deg, resample=Image.Resampling.BICUBIC, expand=True)
+
+
+def frame_placement(
+    transformed_size: Tuple[int, int],
     canvas_size: Tuple[int, int],
     anchor: Tuple[float, float],
-    transform: Tuple[float, float, float, float, float],
-) -> Image.Image:
-    dx, dy, rotation_deg, scale, alpha = transform
+    offset: Tuple[float, float],
+) -> Optional[Tuple[Tuple[int, int, int, int], Tuple[int, int]]]:
+    """
+    Clip a transformed subject to its frame cell.
+
+    Returns the visible box inside the transformed image and its top-left corner
+    inside the cell, or None when the subject lands entirely off-canvas.
+    """
+
+    width, height = transformed_size
     canvas_w, canvas_h = canvas_size
-    anchor_x, anchor_y = anchor
+    paste_x = int(round(anchor[0] - width / 2 + offset[0]))
+    paste_y = int(round(anchor[1] - height + offset[1]))
 
-    target_w = max(1, int(round(subject.width * scale)))
-    target_h = max(1, int(round(subject.height * scale)))
-    transformed = subject.resize((target_w, target_h), Image.Resampling.LANCZOS)
-    transformed = transformed.rotate(rotation_deg, resample=Image.Resampling.BICUBIC, expand=True)
-    transformed = clamp_alpha(transformed, alpha)
+    left, top = max(0, -paste_x), max(0, -paste_y)
+    right, bottom = min(width, canvas_w - paste_x), min(height, canvas_h - paste_y)
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right, bottom), (paste_x + left, paste_y + top)
 
-    frame = Image.new("RGBA", (canvas_w, canvas_h), (0, 0, 0, 0))
-    paste_x = int(round(anchor_x - transformed.width / 2 + dx))
-    paste_y = int(round(anchor_y - transformed.height + dy))
-    frame.alpha_composite(transformed, (paste_x, paste_y))
-    return frame
+
+def blit_frame_array(strip: "np.ndarray", pixels: Image.Image, dest: Tuple[int, int], alpha_scale: float) -> None:
+    """Copy pixels into the strip buffer, scaling alpha in place (same rounding as clamp_alpha)."""
+
+    x, y = dest
+    region = strip[y : y + pixels.height, x : x + pixels.width]
+    region[...] = np.asarray(pixels)
+    if alpha_scale < 0.999:
+        alpha = region[..., 3]
+        alpha[...] = np.clip(np.rint(alpha * alpha_scale), 0, 255)
+    # Compositing over a transparent canvas drops the colour of fully transparent pixels.
+    region[region[..., 3] == 0] = 0
 
 
 def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def create_animation_strip(source_path: Path, pose_spec: PoseSpec, output_path: Path, meta_path: Path) -> None:
+def render_strip(source_path: Path, cells: Sequence[Transform]) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Render every cell transform side by side into one strip.
+
+    Each transformed subject is clipped to its cell and written straight into the
+    strip; with numpy the strip is a preallocated buffer and alpha is scaled in place.
+    """
+
     source = Image.open(source_path).convert("RGBA")
     bbox = source.getbbox()
     if bbox is None:
@@ -146,44 +402,464 @@ def create_animation_strip(source_path: Path, pose_spec: PoseSpec, output_path:
     subject = source.crop(bbox)
     canvas_w, canvas_h = source.width, source.height
     anchor = ((bbox[0] + bbox[2]) / 2.0, float(bbox[3]))
+    strip_w = canvas_w * len(cells)
+
+    buffer = np.zeros((canvas_h, strip_w, 4), dtype=np.uint8) if np is not None else None
+    strip = Image.new("RGBA", (strip_w, canvas_h), (0, 0, 0, 0)) if buffer is None else None
+
+    for index, (dx, dy, rotation_deg, scale, alpha) in enumerate(cells):
+        transformed = transform_subject(subject, scale, rotation_deg)
+        placement = frame_placement(transformed.size, (canvas_w, canvas_h), anchor, (dx, dy))
+        if placement is None:
+            continue
+        box, (x, y) = placement
+        if box != (0, 0, transformed.width, transformed.height):
+            transformed = transformed.crop(box)
+        dest = (index * canvas_w + x, y)
+        if buffer is not None:
+            blit_frame_array(buffer, transformed, dest, alpha)
+        else:
+            strip.alpha_composite(clamp_alpha(transformed, alpha), dest)
+
+    if buffer is not None:
+        strip = Image.fromarray(buffer)
+    return strip, (canvas_w, canvas_h)
+
+
+def tier_suffix(scale: float) -> str:
+    return "" if scale == 1 else f"@{scale:g}x"
+
+
+def scale_strip(
+    strip: Image.Image,
+    canvas_size: Tuple[int, int],
+    frame_count: int,
+    scale: float,
+) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Downscale a rendered strip cell by cell so neighbouring frames never bleed into each other."""
+
+    if scale == 1:
+        return strip, canvas_size
+    canvas_w, canvas_h = canvas_size
+    tier_w = max(1, int(round(canvas_w * scale)))
+    tier_h = max(1, int(round(canvas_h * scale)))
+    tier = Image.new("RGBA", (tier_w * frame_count, tier_h), (0, 0, 0, 0))
+    for index in range(frame_count):
+        cell = strip.crop((index * canvas_w, 0, (index + 1) * canvas_w, canvas_h))
+        tier.paste(cell.resize((tier_w, tier_h), Image.Resampling.LANCZOS), (index * tier_w, 0))
+    return tier, (tier_w, tier_h)
+
+
+@dataclass(frozen=True)
+class SheetEncoding:
+    format: str = "png"
+    quality: int = 90
+
+    @property
+    def extension(self) -> str:
+        return SHEET_FORMATS[self.format][0]
+
+    def to_json(self) -> dict:
+        if SHEET_FORMATS[self.format][1]:
+            return {"format": self.format, "quality": self.quality}
+        return {"format": self.format}
+
+
+DEFAULT_ENCODING = SheetEncoding()
+
+
+def encode_sheet(image: Image.Image, encoding: SheetEncoding) -> bytes:
+    buffer = io.BytesIO()
+    if encoding.format == "png":
+        image.save(buffer, format="PNG")
+    elif encoding.format == "png-optimized":
+        image.save(buffer, format="PNG", optimize=True)
+    elif encoding.format == "png-palette":
+        colors = max(2, min(256, int(round(256 * encoding.quality / 100))))
+        palette = image.quantize(colors=colors, method=Image.Quantize.FASTOCTREE)
+        palette.save(buffer, format="PNG", optimize=True)
+    elif encoding.format == "webp-lossless":
+        image.save(buffer, format="WEBP", lossless=True, quality=encoding.quality)
+    elif encoding.format == "webp":
+        image.save(buffer, format="WEBP", quality=encoding.quality)
+    else:
+        raise ValueError(f"unknown sheet format: {encoding.format}")
+    return buffer.getvalue()
+
+
+def decode_ms(data: bytes, repeats: int = 3) -> float:
+    """Best-of-N time to decode an encoded sheet to RGBA, as the game would."""
+
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        Image.open(io.BytesIO(data)).convert("RGBA")
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000, 2)
 
-    frames = [
-        build_frame(subject, (canvas_w, canvas_h), anchor, transform)
-        for transform in pose_spec.transforms
-    ]
 
-    strip = Image.new("RGBA", (canvas_w * len(frames), canvas_h), (0, 0, 0, 0))
-    for index, frame in enumerate(frames):
-        strip.alpha_composite(frame, (index * canvas_w, 0))
+def write_sheet(image: Image.Image, output_path: Path, label: str, encoding: SheetEncoding) -> dict:
+    """Encode and write one sheet; returns its size/decode report against the plain-PNG baseline."""
 
+    data = encode_sheet(image, encoding)
     ensure_parent(output_path)
-    strip.save(output_path)
-
-    meta = {
-        "version": "0.1.0",
-        "frameWidth": canvas_w,
-        "frameHeight": canvas_h,
-        "frameCount": len(frames),
-        "fps": pose_spec.fps,
-        "loop": pose_spec.loop,
-        "anchor": {"x": 0.5, "y": 1.0},
-        "frames": [
-            {
-                "index": index,
-                "x": index * canvas_w,
-                "y": 0,
-                "w": canvas_w,
-                "h": canvas_h,
-                "durationMs": int(round(1000 / pose_spec.fps)),
+    output_path.write_bytes(data)
+    decode_after = decode_ms(data)
+    if encoding == DEFAULT_ENCODING:
+        baseline, decode_before = data, decode_after
+    else:
+        baseline = encode_sheet(image, DEFAULT_ENCODING)
+        decode_before = decode_ms(baseline)
+    return {
+        "sheet": label,
+        "format": encoding.format,
+        "bytesBefore": len(baseline),
+        "bytesAfter": len(data),
+        "decodeMsBefore": decode_before,
+        "decodeMsAfter": decode_after,
+    }
+
+
+def write_json(path: Path, payload: dict) -> None:
+    ensure_parent(path)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_key(payload: dict) -> str:
+    return hashlib.sha256(json.dumps({"tool": TOOL_VERSION, **payload}, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def strip_build_key(
+    source_path: Path,
+    pose_spec: PoseSpec,
+    scales: Tuple[float, ...] = DEFAULT_SCALES,
+    encoding: SheetEncoding = DEFAULT_ENCODING,
+) -> str:
+    return build_key(
+        {
+            "layout": "strip",
+            "scales": list(scales),
+            "encoding": encoding.to_json(),
+            "source": file_sha256(source_path),
+            "pose": asdict(pose_spec),
+        }
+    )
+
+
+def atlas_build_key(
+    source_map: Dict[str, Path],
+    max_size: int,
+    padding: int,
+    scales: Tuple[float, ...] = DEFAULT_SCALES,
+    encoding: SheetEncoding = DEFAULT_ENCODING,
+) -> str:
+    return build_key(
+        {
+            "layout": "atlas",
+            "maxSize": max_size,
+            "padding": padding,
+            "scales": list(scales),
+            "encoding": encoding.to_json(),
+            "sources": {animation: file_sha256(path) for animation, path in source_map.items()},
+            "poses": {animation: asdict(POSE_SPECS[animation]) for animation in source_map},
+        }
+    )
+
+
+def build_record(key: str, meta_path: Path, sheet_paths: List[Path]) -> dict:
+    return {
+        "key": key,
+        "sheets": {
+            os.path.relpath(sheet_path, meta_path.parent).replace(os.sep, "/"): file_sha256(sheet_path)
+            for sheet_path in sheet_paths
+        },
+    }
+
+
+def read_json(path: Path) -> Optional[dict]:
+    try:
+        parsed = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def build_is_current(meta_paths: List[Path], key: str) -> bool:
+    """True when every meta carries `key` and every sheet it lists still has the recorded hash."""
+
+    for meta_path in meta_paths:
+        meta = read_json(meta_path)
+        build = meta.get("build") if meta else None
+        if not isinstance(build, dict) or build.get("key") != key or not build.get("sheets"):
+            return False
+        for rel_sheet, digest in build["sheets"].items():
+            sheet_path = meta_path.parent / rel_sheet
+            if not sheet_path.is_file() or file_sha256(sheet_path) != digest:
+                return False
+    return True
+
+
+def create_animation_strip(
+    source_path: Path,
+    pose_spec: PoseSpec,
+    output_dir: Path,
+    animation: str,
+    scales: Tuple[float, ...] = DEFAULT_SCALES,
+    encoding: SheetEncoding = DEFAULT_ENCODING,
+    key: Optional[str] = None,
+    label_dir: Optional[Path] = None,
+) -> List[dict]:
+    """Write one strip + meta per scale tier; returns the sheet reports (labelled under label_dir)."""
+
+    cells, frame_cells = plan_frames(pose_spec)
+    strip, canvas_size = render_strip(source_path, cells)
+
+    reports = []
+    for scale in scales:
+        tier_strip, (frame_w, frame_h) = scale_strip(strip, canvas_size, len(cells), scale)
+        sheet_name = f"{animation}{tier_suffix(scale)}.{encoding.extension}"
+        output_path = output_dir / sheet_name
+        meta_path = output_dir / f"{animation}{tier_suffix(scale)}.meta.json"
+        label = ((label_dir or output_dir) / sheet_name).as_posix()
+        reports.append(write_sheet(tier_strip, output_path, label, encoding))
+
+        meta = {
+            "version": "0.1.0",
+            "scale": scale,
+            "encoding": encoding.to_json(),
+            "frameWidth": frame_w,
+            "frameHeight": frame_h,
+            "frameCount": len(frame_cells),
+            "fps": pose_spec.fps,
+            "loop": pose_spec.loop,
+            "anchor": {"x": 0.5, "y": 1.0},
+            "frames": [
+                {
+                    "index": index,
+                    "x": cell * frame_w,
+                    "y": 0,
+                    "w": frame_w,
+                    "h": frame_h,
+                    "durationMs": int(round(1000 / pose_spec.fps)),
+                }
+                for index, cell in enumerate(frame_cells)
+            ],
+        }
+        if key is not None:
+            meta["build"] = build_record(key, meta_path, [output_path])
+        write_json(meta_path, meta)
+    return reports
+
+
+@dataclass
+class TrimmedFrame:
+    animation: str
+    index: int  # rendered cell, which several meta frames may share
+    image: Image.Image
+    offset: Tuple[int, int]
+    page: int = -1
+    position: Tuple[int, int] = (0, 0)
+
+
+def trim_frame(animation: str, index: int, frame: Image.Image) -> TrimmedFrame:
+    bbox = frame.getbbox()
+    if bbox is None:
+        # Keep fully transparent frames addressable with a 1x1 placeholder.
+        return TrimmedFrame(animation, index, Image.new("RGBA", (1, 1), (0, 0, 0, 0)), (0, 0))
+    return TrimmedFrame(animation, index, frame.crop(bbox), (bbox[0], bbox[1]))
+
+
+def next_power_of_two(value: int) -> int:
+    size = 1
+    while size < value:
+        size <<= 1
+    return size
+
+
+def pack_atlas(frames: List[TrimmedFrame], max_size: int, padding: int) -> List[Tuple[int, int]]:
+    """
+    Shelf-pack trimmed frames (tallest first) into pages of at most max_size.
+
+    Sets each frame's page/position and returns the power-of-two size of every page.
+    """
+
+    order = sorted(range(len(frames)), key=lambda i: (-frames[i].image.height, -frames[i].image.width, i))
+    page_extents: List[List[int]] = []
+    cursor_x = cursor_y = shelf_h = 0
+
+    for i in order:
+        frame = frames[i]
+        w, h = frame.image.width + padding, frame.image.height + padding
+        if w > max_size or h > max_size:
+            raise ValueError(
+                f"frame {frame.animation}[{frame.index}] ({frame.image.width}x{frame.image.height}) "
+                f"does not fit in a {max_size}px atlas page"
+            )
+        if not page_extents or cursor_x + w > max_size:
+            cursor_x, cursor_y, shelf_h = 0, cursor_y + shelf_h, 0
+        if not page_extents or cursor_y + h > max_size:
+            page_extents.append([0, 0])
+            cursor_x = cursor_y = shelf_h = 0
+
+        frame.page = len(page_extents) - 1
+        frame.position = (cursor_x, cursor_y)
+        extent = page_extents[frame.page]
+        extent[0] = max(extent[0], cursor_x + frame.image.width)
+        extent[1] = max(extent[1], cursor_y + frame.image.height)
+        cursor_x += w
+        shelf_h = max(shelf_h, h)
+
+    return [(next_power_of_two(w), next_power_of_two(h)) for w, h in page_extents]
+
+
+def create_unit_atlas(
+    source_map: Dict[str, Path],
+    output_unit_dir: Path,
+    output_unit_dir_abs: Path,
+    max_size: int,
+    padding: int,
+    scales: Tuple[float, ...] = DEFAULT_SCALES,
+    encoding: SheetEncoding = DEFAULT_ENCODING,
+    key: Optional[str] = None,
+) -> List[dict]:
+    """
+    Render every animation once, then pack and write atlas pages + metas for each
+    scale tier. Returns the page reports.
+    """
+
+    rendered = {}
+    for animation, source_path in source_map.items():
+        cells, frame_cells = plan_frames(POSE_SPECS[animation])
+        strip, canvas_size = render_strip(source_path, cells)
+        rendered[animation] = (strip, canvas_size, frame_cells)
+    reports = []
+    for scale in scales:
+        reports.extend(
+            write_atlas_tier(rendered, output_unit_dir, output_unit_dir_abs, max_size, padding, scale, encoding, key)
+        )
+    return reports
+
+
+def write_atlas_tier(
+    rendered: Dict[str, Tuple[Image.Image, Tuple[int, int], List[int]]],
+    output_unit_dir: Path,
+    output_unit_dir_abs: Path,
+    max_size: int,
+    padding: int,
+    scale: float,
+    encoding: SheetEncoding,
+    key: Optional[str],
+) -> List[dict]:
+    suffix = tier_suffix(scale)
+    tier_sizes: Dict[str, Tuple[int, int]] = {}
+    trimmed: List[TrimmedFrame] = []
+    for animation, (strip, canvas_size, frame_cells) in rendered.items():
+        cell_count = max(frame_cells) + 1
+        tier_strip, (canvas_w, canvas_h) = scale_strip(strip, canvas_size, cell_count, scale)
+        tier_sizes[animation] = (canvas_w, canvas_h)
+        trimmed.extend(
+            trim_frame(animation, cell, tier_strip.crop((cell * canvas_w, 0, (cell + 1) * canvas_w, canvas_h)))
+            for cell in range(cell_count)
+        )
+
+    page_sizes = pack_atlas(trimmed, max_size, padding)
+    page_names = [f"atlas-{page}{suffix}.{encoding.extension}" for page in range(len(page_sizes))]
+    reports = []
+    for page, (page_w, page_h) in enumerate(page_sizes):
+        sheet = Image.new("RGBA", (page_w, page_h), (0, 0, 0, 0))
+        for frame in trimmed:
+            if frame.page == page:
+                sheet.paste(frame.image, frame.position)
+        label = (output_unit_dir / page_names[page]).as_posix()
+        reports.append(write_sheet(sheet, output_unit_dir_abs / page_names[page], label, encoding))
+
+    for animation, (_, _, frame_cells) in rendered.items():
+        pose_spec = POSE_SPECS[animation]
+        cells = sorted((frame for frame in trimmed if frame.animation == animation), key=lambda f: f.index)
+        pages = sorted({cell.page for cell in cells})
+        canvas_w, canvas_h = tier_sizes[animation]
+        meta = {
+            "version": "0.1.0",
+            "layout": "atlas",
+            "scale": scale,
+            "encoding": encoding.to_json(),
+            "sheets": [(output_unit_dir / page_names[page]).as_posix() for page in pages],
+            "frameWidth": canvas_w,
+            "frameHeight": canvas_h,
+            "frameCount": len(frame_cells),
+            "fps": pose_spec.fps,
+            "loop": pose_spec.loop,
+            "anchor": {"x": 0.5, "y": 1.0},
+            "frames": [
+                {
+                    "index": index,
+                    "sheet": pages.index(cells[cell].page),
+                    "x": cells[cell].position[0],
+                    "y": cells[cell].position[1],
+                    "w": cells[cell].image.width,
+                    "h": cells[cell].image.height,
+                    "offsetX": cells[cell].offset[0],
+                    "offsetY": cells[cell].offset[1],
+                    "durationMs": int(round(1000 / pose_spec.fps)),
+                }
+                for index, cell in enumerate(frame_cells)
+            ],
+        }
+        meta_path = output_unit_dir_abs / f"{animation}{suffix}.meta.json"
+        if key is not None:
+            meta["build"] = build_record(key, meta_path, [output_unit_dir_abs / page_names[page] for page in pages])
+        write_json(meta_path, meta)
+    return reports
+
+
+def manifest_unit_entry(
+    unit_id: str,
+    output_unit_dir: Path,
+    sheet_paths: Optional[Dict[float, Dict[str, List[str]]]] = None,
+    scales: Tuple[float, ...] = DEFAULT_SCALES,
+    extension: str = "png",
+) -> dict:
+    """
+    Manifest entry for one unit. The 1x tier stays in sheetPath/metaPath; with several
+    scales every animation also lists all tiers, largest first, under "tiers".
+    """
+
+    animations = {}
+    for animation in ANIMATIONS:
+        tiers = []
+        for scale in scales:
+            tier = {
+                "scale": scale,
+                "sheetPath": (output_unit_dir / f"{animation}{tier_suffix(scale)}.{extension}").as_posix(),
+                "metaPath": (output_unit_dir / f"{animation}{tier_suffix(scale)}.meta.json").as_posix(),
             }
-            for index in range(len(frames))
-        ],
+            if sheet_paths is not None:
+                tier["sheetPath"] = sheet_paths[scale][animation][0]
+                tier["sheetPaths"] = sheet_paths[scale][animation]
+            tiers.append(tier)
+
+        base = next(tier for tier in tiers if tier["scale"] == 1)
+        animations[animation] = {
+            "sheetPath": base["sheetPath"],
+            "metaPath": base["metaPath"],
+            "key": f"{unit_id}.{animation}",
+        }
+        if sheet_paths is not None:
+            animations[animation]["sheetPaths"] = base["sheetPaths"]
+        if len(tiers) > 1:
+            animations[animation]["tiers"] = tiers
+
+    return {
+        "animations": animations,
+        "defaultAnimation": "idle",
     }
-    ensure_parent(meta_path)
-    meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
-def update_manifest(manifest_path: Path, unit_id: str, output_unit_dir: Path) -> None:
+def update_manifest(manifest_path: Path, unit_entries: Dict[str, dict]) -> dict:
     if manifest_path.exists():
         manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
     else:
@@ -194,53 +870,281 @@ def update_manifest(manifest_path: Path, unit_id: str, output_unit_dir: Path) ->
     if "units" not in manifest or not isinstance(manifest["units"], dict):
         manifest["units"] = {}
 
-    animations = {}
-    for animation in ("idle", "attack", "hit", "die"):
-        rel_png = (output_unit_dir / f"{animation}.png").as_posix()
-        rel_meta = (output_unit_dir / f"{animation}.meta.json").as_posix()
-        animations[animation] = {
-            "sheetPath": rel_png,
-            "metaPath": rel_meta,
-            "key": f"{unit_id}.{animation}",
-        }
+    manifest["units"].update(unit_entries)
 
-    manifest["units"][unit_id] = {
-        "animations": animations,
-        "defaultAnimation": "idle",
+    # Write next to the target and rename so readers never see a half-written manifest.
+    temp_path = manifest_path.with_name(f".{manifest_path.name}.tmp")
+    write_json(temp_path, manifest)
+    os.replace(temp_path, manifest_path)
+    return manifest
+
+
+def compile_clip(meta: dict) -> dict:
+    """One meta as a bundle clip; frame order (and so each frame's index) is kept."""
+
+    layout = meta.get("layout", "strip")
+    frame_w, frame_h = meta["frameWidth"], meta["frameHeight"]
+    frames = meta["frames"]
+    durations = [frame["durationMs"] for frame in frames]
+    clip = {
+        "layout": layout,
+        "frameWidth": frame_w,
+        "frameHeight": frame_h,
+        "fps": meta["fps"],
+        "loop": meta["loop"],
+        "anchor": meta["anchor"],
     }
+    if "encoding" in meta:
+        clip["encoding"] = meta["encoding"]
+    clip["durationMs"] = durations[0] if durations and len(set(durations)) == 1 else durations
 
-    ensure_parent(manifest_path)
-    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    # create_animation_strip lays cells out left to right at full frame size.
+    if layout == "strip" and frame_w > 0 and all(
+        frame["y"] == 0 and frame["w"] == frame_w and frame["h"] == frame_h and frame["x"] % frame_w == 0
+        for frame in frames
+    ):
+        clip["cells"] = [frame["x"] // frame_w for frame in frames]
+    else:
+        clip["frames"] = [[frame.get(field, 0) for field in BUNDLE_FRAME_FIELDS[layout]] for frame in frames]
+    return clip
 
 
-def main() -> None:
-    args = parse_args()
-    input_dir = (ROOT / args.input_dir).resolve()
-    unit_id = args.unit_id
-    output_unit_dir = Path(args.output_root) / unit_id
-    output_unit_dir_abs = (ROOT / output_unit_dir).resolve()
-    manifest_path = (ROOT / args.manifest_path).resolve()
+def compile_sprite_bundle(manifest: dict, read_meta: Callable[[str], dict]) -> dict:
+    """
+    Merge the manifest with every meta it references. Animation entries (and their tiers)
+    keep their manifest fields and gain a "clip" index; identical clips are stored once.
+    """
 
-    source_map = {
-        "idle": input_dir / "idle.png",
-        "attack": input_dir / "attack.png",
-        "hit": input_dir / "hit.png",
-        "die": input_dir / "death.png",
+    clips: List[dict] = []
+    clip_indexes: Dict[str, int] = {}
+
+    def clip_index(meta_path: str) -> int:
+        clip = compile_clip(read_meta(meta_path))
+        signature = json.dumps(clip, sort_keys=True)
+        if signature not in clip_indexes:
+            clip_indexes[signature] = len(clips)
+            clips.append(clip)
+        return clip_indexes[signature]
+
+    units = {}
+    for unit_id, unit in sorted(manifest.get("units", {}).items()):
+        animations = {}
+        for name, animation in unit.get("animations", {}).items():
+            entry = {**animation, "clip": clip_index(animation["metaPath"])}
+            if "tiers" in animation:
+                entry["tiers"] = [{**tier, "clip": clip_index(tier["metaPath"])} for tier in animation["tiers"]]
+            animations[name] = entry
+        units[unit_id] = {**unit, "animations": animations}
+
+    return {
+        "version": BUNDLE_VERSION,
+        "manifestVersion": manifest.get("version", "0.1.0"),
+        "frameFields": {layout: list(fields) for layout, fields in BUNDLE_FRAME_FIELDS.items()},
+        "clips": clips,
+        "units": units,
     }
 
-    missing = [str(path) for path in source_map.values() if not path.exists()]
+
+def write_sprite_bundle(manifest: dict, bundle_path: Path) -> Tuple[int, int, int]:
+    """Write the bundle (compact JSON, temp file + rename); returns (metas read, their bytes, bundle bytes)."""
+
+    meta_bytes: Dict[str, int] = {}
+
+    def read_meta(meta_path: str) -> dict:
+        meta = read_json(ROOT / meta_path)
+        if meta is None:
+            raise FileNotFoundError(f"missing or unreadable sprite meta: {meta_path}")
+        meta_bytes[meta_path] = (ROOT / meta_path).stat().st_size
+        return meta
+
+    bundle = compile_sprite_bundle(manifest, read_meta)
+    text = json.dumps(bundle, ensure_ascii=False, separators=(",", ":")) + "\n"
+    ensure_parent(bundle_path)
+    temp_path = bundle_path.with_name(f".{bundle_path.name}.tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    os.replace(temp_path, bundle_path)
+    return len(meta_bytes), sum(meta_bytes.values()), len(text.encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class UnitJob:
+    unit_id: str
+    input_dir: Path
+    output_unit_dir: Path
+    output_unit_dir_abs: Path
+
+    def source_map(self) -> Dict[str, Path]:
+        return {animation: self.input_dir / file_name for animation, file_name in SOURCE_FILES.items()}
+
+    def meta_path(self, animation: str, scale: float = 1.0) -> Path:
+        return self.output_unit_dir_abs / f"{animation}{tier_suffix(scale)}.meta.json"
+
+
+def make_unit_job(unit_id: str, input_dir: Path, output_root: str) -> UnitJob:
+    output_unit_dir = Path(output_root) / unit_id
+    return UnitJob(unit_id, input_dir, output_unit_dir, (ROOT / output_unit_dir).resolve())
+
+
+def resolve_batch_jobs(entries: List[str], output_root: str) -> List[UnitJob]:
+    jobs: Dict[str, UnitJob] = {}
+    for entry in entries:
+        unit_id, separator, pattern = entry.partition("=")
+        if not separator:
+            unit_id, pattern = "", entry
+        matches = sorted(Path(path) for path in glob.glob(str(ROOT / pattern)) if Path(path).is_dir())
+        if not matches:
+            raise FileNotFoundError(f"no source directory matches: {pattern}")
+        if unit_id and len(matches) > 1:
+            raise ValueError(f"{entry} matches {len(matches)} directories; UNIT_ID=DIR needs exactly one")
+        for input_dir in matches:
+            job = make_unit_job(unit_id or input_dir.name, input_dir.resolve(), output_root)
+            if job.unit_id in jobs and jobs[job.unit_id].input_dir != job.input_dir:
+                raise ValueError(f"unit id {job.unit_id} resolves to more than one source directory")
+            jobs[job.unit_id] = job
+    return list(jobs.values())
+
+
+def check_sources(jobs: List[UnitJob]) -> None:
+    missing = [str(path) for job in jobs for path in job.source_map().values() if not path.exists()]
     if missing:
         raise FileNotFoundError(f"missing source files: {missing}")
 
-    for animation, source_path in source_map.items():
-        output_path = output_unit_dir_abs / f"{animation}.png"
-        meta_path = output_unit_dir_abs / f"{animation}.meta.json"
-        create_animation_strip(source_path, POSE_SPECS[animation], output_path, meta_path)
 
-    update_manifest(manifest_path, unit_id, output_unit_dir)
-    print(f"Built sprite pack for {unit_id}")
-    print(f"Output directory: {output_unit_dir.as_posix()}")
+def build_strip_task(
+    job: UnitJob,
+    animation: str,
+    scales: Tuple[float, ...],
+    encoding: SheetEncoding,
+    key: str,
+) -> List[dict]:
+    return create_animation_strip(
+        job.source_map()[animation],
+        POSE_SPECS[animation],
+        job.output_unit_dir_abs,
+        animation,
+        scales,
+        encoding,
+        key,
+        job.output_unit_dir,
+    )
+
+
+def build_atlas_task(
+    job: UnitJob,
+    max_size: int,
+    padding: int,
+    scales: Tuple[float, ...],
+    encoding: SheetEncoding,
+    key: str,
+) -> List[dict]:
+    return create_unit_atlas(
+        job.source_map(), job.output_unit_dir, job.output_unit_dir_abs, max_size, padding, scales, encoding, key
+    )
+
+
+def recorded_sheet_paths(job: UnitJob, scales: Tuple[float, ...]) -> Dict[float, Dict[str, List[str]]]:
+    return {
+        scale: {animation: list(read_json(job.meta_path(animation, scale))["sheets"]) for animation in ANIMATIONS}
+        for scale in scales
+    }
+
+
+def build_units(jobs: List[UnitJob], args: argparse.Namespace) -> Tuple[Dict[str, dict], int, int, List[dict]]:
+    """
+    Render every out-of-date unit (atlas: one task per unit, strips: one task per
+    unit/animation) and return the manifest entries, built/skipped task counts and
+    the report of every sheet written. Uses a process pool when more than one task
+    needs building.
+    """
+
+    encoding = SheetEncoding(args.format, args.quality)
+    tasks = []
+    skipped = 0
+    for job in jobs:
+        if args.atlas:
+            key = atlas_build_key(job.source_map(), args.atlas_max_size, args.atlas_padding, args.scales, encoding)
+            meta_paths = [job.meta_path(animation, scale) for animation in ANIMATIONS for scale in args.scales]
+            if not args.force and build_is_current(meta_paths, key):
+                skipped += 1
+                continue
+            tasks.append(
+                (build_atlas_task, (job, args.atlas_max_size, args.atlas_padding, args.scales, encoding, key))
+            )
+            continue
+        for animation in ANIMATIONS:
+            key = strip_build_key(job.source_map()[animation], POSE_SPECS[animation], args.scales, encoding)
+            meta_paths = [job.meta_path(animation, scale) for scale in args.scales]
+            if not args.force and build_is_current(meta_paths, key):
+                skipped += 1
+                continue
+            tasks.append((build_strip_task, (job, animation, args.scales, encoding, key)))
+
+    reports: List[dict] = []
+    workers = min(args.jobs, len(tasks))
+    if workers <= 1:
+        for fn, task_args in tasks:
+            reports.extend(fn(*task_args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(fn, *task_args) for fn, task_args in tasks]:
+                reports.extend(future.result())
+
+    entries: Dict[str, dict] = {}
+    for job in jobs:
+        sheet_paths = recorded_sheet_paths(job, args.scales) if args.atlas else None
+        entries[job.unit_id] = manifest_unit_entry(
+            job.unit_id, job.output_unit_dir, sheet_paths, args.scales, encoding.extension
+        )
+    return entries, len(tasks), skipped, reports
+
+
+def format_sheet_report(report: dict) -> str:
+    before, after = report["bytesBefore"], report["bytesAfter"]
+    change = (after - before) / before * 100 if before else 0.0
+    return (
+        f"[SHEET] {report['sheet']}: png {before / 1024:.1f} KiB, decode {report['decodeMsBefore']:.1f} ms"
+        f" -> {report['format']} {after / 1024:.1f} KiB ({change:+.1f}%), decode {report['decodeMsAfter']:.1f} ms"
+    )
+
+
+def print_bundle_report(bundle_path: str, manifest_path: Path, stats: Tuple[int, int, int]) -> None:
+    meta_count, meta_bytes, bundle_bytes = stats
+    source_bytes = manifest_path.stat().st_size + meta_bytes
+    print(
+        f"Bundle: {Path(bundle_path).as_posix()} ({bundle_bytes / 1024:.1f} KiB in 1 file"
+        f" vs {source_bytes / 1024:.1f} KiB in {meta_count + 1} manifest/meta files)"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    manifest_path = (ROOT / args.manifest_path).resolve()
+    bundle_path = (ROOT / args.bundle_path).resolve()
+
+    if args.bundle_only:
+        manifest = read_json(manifest_path)
+        if manifest is None:
+            raise FileNotFoundError(f"missing or unreadable manifest: {args.manifest_path}")
+        print_bundle_report(args.bundle_path, manifest_path, write_sprite_bundle(manifest, bundle_path))
+        return
+
+    if args.batch:
+        jobs = resolve_batch_jobs(args.batch, args.output_root)
+    else:
+        jobs = [make_unit_job(args.unit_id, (ROOT / args.input_dir).resolve(), args.output_root)]
+    check_sources(jobs)
+
+    entries, built, skipped, reports = build_units(jobs, args)
+    manifest = update_manifest(manifest_path, entries)
+    bundle_stats = write_sprite_bundle(manifest, bundle_path)
+    for job in jobs:
+        print(f"Built sprite pack for {job.unit_id}")
+        print(f"Output directory: {job.output_unit_dir.as_posix()}")
+    for report in reports:
+        print(format_sheet_report(report))
+    print(f"Rendered {built} sheet task(s), skipped {skipped} up-to-date")
     print(f"Manifest: {Path(args.manifest_path).as_posix()}")
+    print_bundle_report(args.bundle_path, manifest_path, bundle_stats)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Measure every sprite sheet referenced by the unit sprite manifest and gate it
+against an asset budget.
+
+For each sheet (strip, atlas page or resolution tier) the tool records pixel
+dimensions, decoded RGBA bytes, file size, opaque-pixel ratio (alpha > 0) and
+median decode time, then compares them with the per-sheet limits in the
+thresholds file. A sheet listed under "waivers" (reason, owner, expires) is still
+measured, but until its expiry date its violations are reported as warnings instead
+of failing the gate; once expired it fails like any other sheet.
+
+Exit code is 1 when any sheet is missing or over budget without an active waiver,
+or when a waiver entry is malformed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import statistics
+import sys
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PIL import Image
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SUMMARY_PREFIX = "[sprite-budget]"
+
+# report metric -> (threshold key, "max" | "min")
+SHEET_LIMITS = {
+    "width": ("maxWidth", "max"),
+    "height": ("maxHeight", "max"),
+    "decodedBytes": ("maxDecodedBytes", "max"),
+    "fileBytes": ("maxFileBytes", "max"),
+    "opaqueRatio": ("minOpaqueRatio", "min"),
+    "decodeMs": ("maxDecodeMs", "max"),
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check sprite sheets against the asset budget.")
+    parser.add_argument(
+        "--manifest",
+        default="assets/meta/unit-sprite-manifest.json",
+        help="Unit sprite manifest to walk.",
+    )
+    parser.add_argument(
+        "--thresholds",
+        default="tools/assets/sprite-budget-thresholds.json",
+        help="Budget thresholds JSON.",
+    )
+    parser.add_argument(
+        "--output",
+        help="Optional path for the JSON report.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=5,
+        help="Decode repetitions per sheet; the median is reported.",
+    )
+    args = parser.parse_args()
+    if args.iterations < 1:
+        parser.error("--iterations must be a positive integer")
+    return args
+
+
+def load_json(path: Path, label: str) -> dict:
+    try:
+        parsed = json.loads(path.read_text(encoding="utf-8"))
+    except OSError as error:
+        raise RuntimeError(f"Cannot read {label}: {path} :: {error}") from error
+    except json.JSONDecodeError as error:
+        raise RuntimeError(f"Failed to parse {label} JSON: {path} :: {error}") from error
+    if not isinstance(parsed, dict):
+        raise RuntimeError(f"Invalid {label} shape: expected an object in {path}")
+    return parsed
+
+
+def collect_sheets(manifest: dict) -> Dict[str, List[str]]:
+    """Map every sheet path in the manifest (all pages and tiers) to the animation keys using it."""
+
+    sheets: Dict[str, List[str]] = {}
+    units = manifest.get("units")
+    if not isinstance(units, dict):
+        return sheets
+
+    for unit_id, unit in sorted(units.items()):
+        animations = unit.get("animations") if isinstance(unit, dict) else None
+        if not isinstance(animations, dict):
+            continue
+        for animation, entry in animations.items():
+            if not isinstance(entry, dict):
+                continue
+            key = entry.get("key") or f"{unit_id}.{animation}"
+            variants = [entry, *(tier for tier in entry.get("tiers", []) if isinstance(tier, dict))]
+            for variant in variants:
+                paths = variant.get("sheetPaths") or [variant.get("sheetPath")]
+                for sheet_path in paths:
+                    if isinstance(sheet_path, str) and sheet_path.strip():
+                        users = sheets.setdefault(sheet_path.strip(), [])
+                        if key not in users:
+                            users.append(key)
+    return sheets
+
+
+def measure_sheet(path: Path, iterations: int) -> Dict[str, Any]:
+    data = path.read_bytes()
+    timings = []
+    image: Optional[Image.Image] = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        image = Image.open(io.BytesIO(data)).convert("RGBA")
+        timings.append((time.perf_counter() - started) * 1000)
+
+    assert image is not None
+    pixels = image.width * image.height
+    transparent = image.getchannel("A").histogram()[0]
+    return {
+        "width": image.width,
+        "height": image.height,
+        "decodedBytes": pixels * 4,
+        "fileBytes": len(data),
+        "opaqueRatio": round(1 - transparent / pixels, 4) if pixels else 0.0,
+        "decodeMs": round(statistics.median(timings), 3),
+    }
+
+
+def evaluate_sheet(sheet: str, stats: Dict[str, Any], limits: dict, profile: Optional[str]) -> List[dict]:
+    failures = []
+    for metric, (limit_key, direction) in SHEET_LIMITS.items():
+        limit = limits.get(limit_key)
+        if not isinstance(limit, (int, float)) or isinstance(limit, bool):
+            continue
+        actual = stats[metric]
+        if direction == "max" and actual > limit:
+            failure_type = "threshold_exceeded"
+        elif direction == "min" and actual < limit:
+            failure_type = "below_minimum"
+        else:
+            continue
+        failures.append(
+            {
+                "type": failure_type,
+                "sheet": sheet,
+                "metric": metric,
+                "actual": actual,
+                "threshold": limit,
+                "profile": profile,
+            }
+        )
+    return failures
+
+
+def format_failure(failure: dict) -> str:
+    if failure["type"] == "missing_sheet":
+        return f"Missing sheet: sheet={failure['sheet']}"
+    comparison = ">" if failure["type"] == "threshold_exceeded" else "<"
+    return (
+        f"Budget {failure['type'].replace('_', ' ')}: sheet={failure['sheet']} metric={failure['metric']} "
+        f"actual={failure['actual']} {comparison} threshold={failure['threshold']}"
+        + (f" profile={failure['profile']}" if failure.get("profile") else "")
+    )
+
+
+def parse_waivers(raw: Any) -> Dict[str, dict]:
+    """Validate the "waivers" map: sheet path -> {reason, owner, expires (YYYY-MM-DD)}."""
+
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise RuntimeError('Invalid sprite budget thresholds: "waivers" must be an object')
+    waivers = {}
+    for sheet, waiver in raw.items():
+        fields = waiver if isinstance(waiver, dict) else {}
+        reason, owner, expires = fields.get("reason"), fields.get("owner"), fields.get("expires")
+        if not all(isinstance(value, str) and value.strip() for value in (reason, owner, expires)):
+            raise RuntimeError(f"Invalid waiver for {sheet}: expected non-empty reason, owner and expires")
+        try:
+            date.fromisoformat(expires)
+        except ValueError as error:
+            raise RuntimeError(f"Invalid waiver for {sheet}: expires must be YYYY-MM-DD ({expires})") from error
+        waivers[sheet] = {"reason": reason, "owner": owner, "expires": expires}
+    return waivers
+
+
+def run_budget_check(manifest_path: Path, thresholds_path: Path, iterations: int, today: Optional[date] = None) -> dict:
+    manifest = load_json(manifest_path, "sprite manifest")
+    thresholds = load_json(thresholds_path, "sprite budget thresholds")
+    limits = thresholds.get("sheet") if isinstance(thresholds.get("sheet"), dict) else {}
+    waivers = parse_waivers(thresholds.get("waivers"))
+    today = today or datetime.now(timezone.utc).date()
+    profile = thresholds.get("profile") if isinstance(thresholds.get("profile"), str) else None
+
+    sheet_reports = []
+    failures: List[dict] = []
+    waived: List[dict] = []
+    for sheet, users in collect_sheets(manifest).items():
+        path = ROOT / sheet
+        entry: Dict[str, Any] = {"sheet": sheet, "animations": users}
+        if path.is_file():
+            entry.update(measure_sheet(path, iterations))
+            sheet_failures = evaluate_sheet(sheet, entry, limits, profile)
+        else:
+            sheet_failures = [{"type": "missing_sheet", "sheet": sheet, "metric": None, "profile": profile}]
+
+        entry["ok"] = not sheet_failures
+        if sheet_failures and sheet in waivers:
+            entry["waiver"] = waivers[sheet]
+            # A waiver covers its expiry day and lapses the day after.
+            entry["waived"] = today <= date.fromisoformat(waivers[sheet]["expires"])
+        if entry.get("waived"):
+            waived.extend(sheet_failures)
+        else:
+            failures.extend(sheet_failures)
+        sheet_reports.append(entry)
+
+    return {
+        "version": "1.0.0",
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "ok": not failures,
+        "profile": profile,
+        "thresholdVersion": thresholds.get("version") if isinstance(thresholds.get("version"), str) else None,
+        "checkedSheets": len(sheet_reports),
+        "failures": failures,
+        "waived": waived,
+        "sheets": sheet_reports,
+    }
+
+
+def summary_line(report: dict) -> str:
+    parts = [
+        f"{SUMMARY_PREFIX} {'PASS' if report['ok'] else 'FAIL'}",
+        f"checkedSheets={report['checkedSheets']}",
+        f"profile={report['profile'] or 'n/a'}",
+        f"thresholdVersion={report['thresholdVersion'] or 'n/a'}",
+    ]
+    if report["waived"]:
+        parts.append(f"waived={len(report['waived'])}")
+    expired = sum(1 for entry in report["sheets"] if "waiver" in entry and not entry["waived"])
+    if expired:
+        parts.append(f"expiredWaivers={expired}")
+    if not report["ok"]:
+        parts.append(f"failures={len(report['failures'])}")
+    return " ".join(parts)
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        report = run_budget_check(
+            (ROOT / args.manifest).resolve(),
+            (ROOT / args.thresholds).resolve(),
+            args.iterations,
+        )
+    except RuntimeError as error:
+        print(f"[FAIL] {error}", file=sys.stderr)
+        return 1
+
+    for entry in report["sheets"]:
+        marker = "OK" if entry["ok"] else ("WAIVED" if entry.get("waived") else "FAIL")
+        if "width" in entry:
+            print(
+                f"[{marker}] {entry['sheet']}: {entry['width']}x{entry['height']}, "
+                f"{entry['decodedBytes'] / 1048576:.1f} MiB decoded, {entry['fileBytes'] / 1024:.1f} KiB file, "
+                f"opaque {entry['opaqueRatio']:.1%}, decode {entry['decodeMs']:.1f} ms"
+            )
+        else:
+            print(f"[{marker}] {entry['sheet']}: missing")
+
+    if args.output:
+        output_path = (ROOT / args.output).resolve()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"{SUMMARY_PREFIX} Wrote report to {args.output}")
+
+    for failure in report["failures"]:
+        print(format_failure(failure), file=sys.stderr)
+    for entry in report["sheets"]:
+        if "waiver" not in entry:
+            continue
+        waiver = entry["waiver"]
+        if entry["waived"]:
+            print(
+                f"Warning: budget violation waived until {waiver['expires']}: sheet={entry['sheet']} "
+                f"owner={waiver['owner']} reason={waiver['reason']}"
+            )
+            for failure in report["waived"]:
+                if failure["sheet"] == entry["sheet"]:
+                    print(f"  {format_failure(failure)}")
+        else:
+            print(
+                f"Waiver expired on {waiver['expires']}: sheet={entry['sheet']} owner={waiver['owner']} "
+                f"reason={waiver['reason']}",
+                file=sys.stderr,
+            )
+    print(summary_line(report))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
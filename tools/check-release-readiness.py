@@ -4,39 +4,174 @@ Run the release-readiness checks required for CI and local gating.
 
 Checks:
 1) Schema/sample validation
-2) Node test suite
+2) Python tool unit tests (tests/tools) and the Node test suite
 3) Deterministic replay/save smoke checks
 4) Chapter-scoped tuning gates (auto-discovered from content/chapter-presets.json)
+5) Trend diff and threshold proposal artifacts built from the gate reports
+
+Each check declares the checks it depends on. `--jobs N` runs independent checks
+concurrently; the first failure cancels everything still running or queued, except
+for non-blocking checks (the sprite asset budget), which run last and fail the gate
+without stopping the checks and artifacts around them.
+
+Checks also declare input globs and output artifacts. A check whose inputs hash to
+the same value as its last passing run (and whose artifacts are still intact) is
+reused instead of re-run; `--force` disables this.
+
+Every run writes per-check wall time, child CPU time and peak RSS to
+.tmp/release-readiness/gate-timings.json and appends a copy to the history dir.
+
+With `--capture` (implied by `--jobs` > 1) child stdout/stderr are read through
+asyncio pipes, prefixed with the check name, and only the last `--tail-lines` lines
+per check are kept for the failure summary.
+
+Sharded CI: `--shard-index I --shard-count N` runs only this node's share of the
+checks without dependencies (balanced by historical wall time), and
+`--merge DIR...` collects every shard's artifacts and runs the dependent checks once.
+
+`--node-workers N` runs `node <script>` checks inside up to N long-lived Node workers
+(tools/release-readiness/check-worker.js, JSON-RPC over stdin/stdout) instead of one
+fresh process each, so interpreter startup and shared modules (src/**, tools/balance/**)
+are paid once per worker. Exit codes and output are the same; `node --test` still spawns.
+Worker checks report the worker's CPU time for the run and its peak RSS so far.
+
+`--baseline BASE_REF` fills .tmp/release-readiness/baseline with the perf and per-chapter
+tuning reports of the base commit and exits. Reports come from a content-addressed store
+(.tmp/release-readiness/baseline-store) keyed by each check's command, the Node version and
+the git blob ids of its inputs in the base tree; only missing ones are generated, in a
+temporary worktree at the base commit.
 """
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import hashlib
 import json
 import os
+import re
+import shutil
+import statistics
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Iterable
 
 
 ROOT = Path(__file__).resolve().parents[1]
-CHAPTER_PRESETS_PATH = ROOT / "content" / "chapter-presets.json"
+CHAPTER_PRESETS_RELATIVE = "content/chapter-presets.json"
+CHAPTER_PRESETS_PATH = ROOT / CHAPTER_PRESETS_RELATIVE
+ARTIFACT_DIR = ".tmp/release-readiness"
+STAMPS_PATH = ROOT / ARTIFACT_DIR / "check-stamps.json"
+STAMPS_VERSION = 1
+TIMINGS_PATH = ROOT / ARTIFACT_DIR / "gate-timings.json"
+HISTORY_DIR = ROOT / ARTIFACT_DIR / "history"
+TIMINGS_VERSION = "1.0.0"
+SHARD_RESULT_VERSION = "1.0.0"
+SHARD_HISTORY_LIMIT = 10
+DEFAULT_CHECK_DURATION_MS = 1000.0
+DEFAULT_TAIL_LINES = 40
+CAPTURE_CHUNK_BYTES = 64 * 1024
+CAPTURE_MAX_LINE_BYTES = 8 * 1024
+NODE_WORKER_SCRIPT = "tools/release-readiness/check-worker.js"
+NODE_WORKER_CLOSE_TIMEOUT_S = 5.0
+BASELINE_DIR = ROOT / ARTIFACT_DIR / "baseline"
+BASELINE_STORE_DIR = ROOT / ARTIFACT_DIR / "baseline-store"
+BASE_WORKTREE_DIR = ROOT / ARTIFACT_DIR / "base-worktree"
+BASELINE_STORE_VERSION = 1
+BASELINE_STORE_MAX_ENTRIES = 200
+FULL_COMMIT_RE = re.compile(r"[0-9a-f]{40}")
+
+OUTPUT_LOCK = threading.Lock()
+
+RUNTIME_INPUTS = ("src/**/*.js", "content/**/*.json", "package.json")
+BALANCE_INPUTS = (*RUNTIME_INPUTS, "tools/balance/**/*.js", "tools/balance/**/*.json")
+TREND_TOOL_INPUTS = (
+    "tools/release-readiness/check-trend-diff.js",
+    "tools/release-readiness/trend-thresholds.json",
+)
+
+PYTHON_TOOL_TESTS_CHECK = "python tool unit tests"
+PERF_GATE_CHECK = "performance gate checks"
+SPRITE_BUDGET_CHECK = "sprite asset budget checks"
+TREND_DIFF_CHECK = "release-readiness trend diff checks"
+ADAPTIVE_POLICY_CHECK = "adaptive rebalance policy build"
+THRESHOLD_SYNC_CHECK = "trend threshold sync preview"
+THRESHOLD_REBALANCE_CHECK = "trend threshold rebalance recommendation"
+THRESHOLD_PROPOSAL_CHECK = "trend threshold proposal comment artifact"
+THRESHOLD_APPLY_CHECK = "trend threshold apply preview"
+
+
+@dataclass(frozen=True)
+class Check:
+    name: str
+    command: list[str]
+    depends_on: tuple[str, ...] = ()
+    # Glob patterns (relative to ROOT) whose content decides whether a rerun is needed.
+    inputs: tuple[str, ...] = ()
+    # Artifacts the check writes; they must still match the recorded hashes to be reused.
+    outputs: tuple[str, ...] = ()
+    # A failing blocking check cancels the rest of the gate; a non-blocking one only fails it.
+    blocking: bool = True
+
+
+@dataclass
+class CheckResult:
+    name: str
+    status: str  # pass | fail | cancelled | reused | skipped
+    exit_code: int | None = None
+    wall_ms: float | None = None
+    user_cpu_ms: float | None = None
+    system_cpu_ms: float | None = None
+    peak_rss_bytes: int | None = None
+    output_tail: list[str] | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "name": self.name,
+            "status": self.status,
+            "exitCode": self.exit_code,
+            "wallMs": self.wall_ms,
+            "userCpuMs": self.user_cpu_ms,
+            "systemCpuMs": self.system_cpu_ms,
+            "peakRssBytes": self.peak_rss_bytes,
+        }
+        if self.output_tail:
+            payload["outputTail"] = self.output_tail
+        return payload
+
+
+def artifact(name: str) -> str:
+    return f"{ARTIFACT_DIR}/{name}"
+
+
+def tuning_gate_check_name(chapter_id: str) -> str:
+    return f"balance tuning gate checks ({chapter_id})"
 
 
 def load_chapter_ids(chapter_presets_path: Path) -> list[str]:
     if not chapter_presets_path.exists():
         raise RuntimeError(f"Missing chapter presets file: {chapter_presets_path}")
+    return parse_chapter_ids(chapter_presets_path.read_text(encoding="utf-8"), chapter_presets_path)
 
+
+def parse_chapter_ids(text: str, source: Path | str) -> list[str]:
     try:
-        parsed = json.loads(chapter_presets_path.read_text(encoding="utf-8"))
+        parsed = json.loads(text)
     except json.JSONDecodeError as error:
-        raise RuntimeError(
-            f"Failed to parse chapter presets JSON: {chapter_presets_path} :: {error}"
-        ) from error
+        raise RuntimeError(f"Failed to parse chapter presets JSON: {source} :: {error}") from error
 
-    chapters = parsed.get("chapters", {})
+    chapters = parsed.get("chapters", {}) if isinstance(parsed, dict) else None
     if not isinstance(chapters, dict) or not chapters:
         raise RuntimeError(
-            f"Invalid chapter presets shape: expected non-empty object at 'chapters' in {chapter_presets_path}"
+            f"Invalid chapter presets shape: expected non-empty object at 'chapters' in {source}"
         )
 
     chapter_ids = sorted(
@@ -45,9 +180,7 @@ def load_chapter_ids(chapter_presets_path: Path) -> list[str]:
         if isinstance(chapter_id, str) and chapter_id.strip()
     )
     if not chapter_ids:
-        raise RuntimeError(
-            f"No valid chapter IDs found in chapter presets: {chapter_presets_path}"
-        )
+        raise RuntimeError(f"No valid chapter IDs found in chapter presets: {source}")
 
     return chapter_ids
 
@@ -64,14 +197,45 @@ def parse_bool_env(name: str, default: bool) -> bool:
     return default
 
 
-def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[tuple[str, list[str]]]:
-    checks: list[tuple[str, list[str]]] = [
-        ("schema/sample validation", [sys.executable, "tools/validate-schemas.py"]),
-        ("node test suite", ["node", "--test", "tests/**/*.test.js"]),
-        ("deterministic replay/save smoke checks", ["node", "tools/smoke-replay-save-check.js"]),
-        ("long-run save/reload smoke checks", ["node", "tools/e2e/long-run-save-reload-smoke.js"]),
-        (
-            "performance gate checks",
+def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[Check]:
+    checks: list[Check] = [
+        Check(
+            "schema/sample validation",
+            [sys.executable, "tools/validate-schemas.py"],
+            inputs=("tools/validate-schemas.py", "docs/schemas/*.json", "docs/examples/*.json"),
+        ),
+        Check(
+            PYTHON_TOOL_TESTS_CHECK,
+            [sys.executable, "-m", "unittest", "discover", "-s", "tests/tools"],
+            inputs=(
+                "tests/tools/*.py",
+                "tools/**/*.py",
+                "tools/**/*.json",
+                "docs/schemas/*.json",
+                "docs/examples/*.json",
+                "src/**/*.js",
+                "assets/meta/*.json",
+                "assets/sprites/**/*.json",
+                "assets/sprites/**/*.png",
+            ),
+        ),
+        Check(
+            "node test suite",
+            ["node", "--test", "tests/**/*.test.js"],
+            inputs=(*RUNTIME_INPUTS, "tests/**/*.js", "tools/**/*.js", "tools/**/*.json", "assets/**/*.json"),
+        ),
+        Check(
+            "deterministic replay/save smoke checks",
+            ["node", "tools/smoke-replay-save-check.js"],
+            inputs=(*RUNTIME_INPUTS, "tools/smoke-replay-save-check.js"),
+        ),
+        Check(
+            "long-run save/reload smoke checks",
+            ["node", "tools/e2e/long-run-save-reload-smoke.js"],
+            inputs=(*RUNTIME_INPUTS, "tools/e2e/*.js"),
+        ),
+        Check(
+            PERF_GATE_CHECK,
             [
                 "node",
                 "tools/perf/run-and-check.js",
@@ -79,13 +243,15 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
                 "--iterations=200",
                 "--output=.tmp/release-readiness/perf-gate-report.json",
             ],
+            inputs=(*RUNTIME_INPUTS, "tools/perf/*.js", "tools/perf/*.json"),
+            outputs=(artifact("perf-gate-report.json"),),
         ),
     ]
 
     for chapter_id in chapter_ids:
         checks.append(
-            (
-                f"balance tuning gate checks ({chapter_id})",
+            Check(
+                tuning_gate_check_name(chapter_id),
                 [
                     "node",
                     "tools/balance/run-tuning-gate.js",
@@ -93,6 +259,8 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
                     f"--output=.tmp/release-readiness/tuning-gate-report.{chapter_id}.json",
                     "--top-candidates=10",
                 ],
+                inputs=BALANCE_INPUTS,
+                outputs=(artifact(f"tuning-gate-report.{chapter_id}.json"),),
             )
         )
 
@@ -107,15 +275,23 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
         trend_diff_command.insert(-1, "--allow-missing-baseline")
 
     checks.append(
-        (
-            "release-readiness trend diff checks",
+        Check(
+            TREND_DIFF_CHECK,
             trend_diff_command,
+            depends_on=(PERF_GATE_CHECK, *(tuning_gate_check_name(chapter_id) for chapter_id in chapter_ids)),
+            inputs=(
+                *TREND_TOOL_INPUTS,
+                artifact("perf-gate-report.json"),
+                artifact("tuning-gate-report.*.json"),
+                artifact("baseline/*.json"),
+            ),
+            outputs=(artifact("trend-diff-report.json"),),
         )
     )
 
     checks.append(
-        (
-            "adaptive rebalance policy build",
+        Check(
+            ADAPTIVE_POLICY_CHECK,
             [
                 "node",
                 "tools/release-readiness/build-adaptive-rebalance-policy.js",
@@ -126,12 +302,21 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
                 "--output=.tmp/release-readiness/adaptive-rebalance-policy.json",
                 "--min-samples=3",
             ],
+            depends_on=(TREND_DIFF_CHECK,),
+            inputs=(
+                *TREND_TOOL_INPUTS,
+                "tools/release-readiness/build-adaptive-rebalance-policy.js",
+                artifact("history/trend-diff-report*.json"),
+                artifact("adaptive-rebalance-policy.prev.json"),
+                artifact("trend-diff-report.json"),
+            ),
+            outputs=(artifact("adaptive-rebalance-policy.json"),),
         )
     )
 
     checks.append(
-        (
-            "trend threshold sync preview",
+        Check(
+            THRESHOLD_SYNC_CHECK,
             [
                 "node",
                 "tools/release-readiness/sync-trend-thresholds.js",
@@ -142,12 +327,22 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
                 "--output=.tmp/release-readiness/trend-thresholds.synced.preview.json",
                 "--summary-output=.tmp/release-readiness/trend-threshold-sync-summary.json",
             ],
+            depends_on=(TREND_DIFF_CHECK,),
+            inputs=(
+                *TREND_TOOL_INPUTS,
+                "tools/release-readiness/sync-trend-thresholds.js",
+                artifact("trend-diff-report.json"),
+            ),
+            outputs=(
+                artifact("trend-thresholds.synced.preview.json"),
+                artifact("trend-threshold-sync-summary.json"),
+            ),
         )
     )
 
     checks.append(
-        (
-            "trend threshold rebalance recommendation",
+        Check(
+            THRESHOLD_REBALANCE_CHECK,
             [
                 "node",
                 "tools/release-readiness/rebalance-trend-thresholds.js",
@@ -156,12 +351,20 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
                 "--adaptive-policy=.tmp/release-readiness/adaptive-rebalance-policy.json",
                 "--output=.tmp/release-readiness/trend-threshold-recommendation.json",
             ],
+            depends_on=(TREND_DIFF_CHECK, ADAPTIVE_POLICY_CHECK),
+            inputs=(
+                *TREND_TOOL_INPUTS,
+                "tools/release-readiness/rebalance-trend-thresholds.js",
+                artifact("trend-diff-report.json"),
+                artifact("adaptive-rebalance-policy.json"),
+            ),
+            outputs=(artifact("trend-threshold-recommendation.json"),),
         )
     )
 
     checks.append(
-        (
-            "trend threshold proposal comment artifact",
+        Check(
+            THRESHOLD_PROPOSAL_CHECK,
             [
                 "node",
                 "tools/release-readiness/build-threshold-proposal-comment.js",
@@ -171,12 +374,23 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
                 "--output=.tmp/release-readiness/trend-threshold-proposal-comment.md",
                 "--output-json=.tmp/release-readiness/trend-threshold-proposal.json",
             ],
+            depends_on=(TREND_DIFF_CHECK, THRESHOLD_SYNC_CHECK, THRESHOLD_REBALANCE_CHECK),
+            inputs=(
+                "tools/release-readiness/build-threshold-proposal-comment.js",
+                artifact("trend-diff-report.json"),
+                artifact("trend-threshold-sync-summary.json"),
+                artifact("trend-threshold-recommendation.json"),
+            ),
+            outputs=(
+                artifact("trend-threshold-proposal-comment.md"),
+                artifact("trend-threshold-proposal.json"),
+            ),
         )
     )
 
     checks.append(
-        (
-            "trend threshold apply preview",
+        Check(
+            THRESHOLD_APPLY_CHECK,
             [
                 "node",
                 "tools/release-readiness/apply-threshold-proposal.js",
@@ -186,31 +400,1135 @@ def build_checks(chapter_ids: list[str], allow_missing_baseline: bool) -> list[t
                 "--summary-output=.tmp/release-readiness/trend-threshold-apply-summary.json",
                 "--allow-manual-review",
             ],
+            depends_on=(THRESHOLD_PROPOSAL_CHECK,),
+            inputs=(
+                *TREND_TOOL_INPUTS,
+                "tools/release-readiness/apply-threshold-proposal.js",
+                artifact("trend-threshold-proposal.json"),
+            ),
+            outputs=(
+                artifact("trend-thresholds.applied.preview.json"),
+                artifact("trend-threshold-apply-summary.json"),
+            ),
+        )
+    )
+
+    # Last, so a budget regression is reported without holding back the trend and proposal artifacts.
+    checks.append(
+        Check(
+            SPRITE_BUDGET_CHECK,
+            [
+                sys.executable,
+                "tools/assets/check-sprite-budget.py",
+                "--output=.tmp/release-readiness/sprite-budget-report.json",
+            ],
+            inputs=(
+                "tools/assets/check-sprite-budget.py",
+                "tools/assets/sprite-budget-thresholds.json",
+                "assets/meta/unit-sprite-manifest.json",
+                "assets/sprites/**/*.png",
+                "assets/sprites/**/*.webp",
+            ),
+            outputs=(artifact("sprite-budget-report.json"),),
+            blocking=False,
         )
     )
 
     return checks
 
 
-def run_check(name: str, command: list[str]) -> int:
-    print(f"\n[CHECK] {name}")
-    print(f"[CMD]   {' '.join(command)}")
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class InputHasher:
+    """Hashes check inputs, memoizing file digests by (size, mtime) for the current run."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._digests: dict[Path, tuple[int, int, str]] = {}
+
+    def file_digest(self, path: Path) -> str:
+        stat = path.stat()
+        cached = self._digests.get(path)
+        if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hash_file(path)
+        self._digests[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def resolve(self, patterns: tuple[str, ...]) -> list[Path]:
+        matched: set[Path] = set()
+        for pattern in patterns:
+            matched.update(path for path in self.root.glob(pattern) if path.is_file())
+        return sorted(matched)
+
+    def check_digest(self, check: Check) -> str:
+        digest = hashlib.sha256()
+        digest.update(json.dumps([STAMPS_VERSION, check.command, list(check.inputs)]).encode("utf-8"))
+        for path in self.resolve(check.inputs):
+            digest.update(f"\0{path.relative_to(self.root).as_posix()}\0".encode("utf-8"))
+            digest.update(self.file_digest(path).encode("ascii"))
+        return digest.hexdigest()
+
+
+class CheckStamps:
+    """Last passing input hash (and artifact hashes) per check, stored under .tmp/release-readiness."""
+
+    def __init__(self, path: Path, hasher: InputHasher) -> None:
+        self.path = path
+        self.hasher = hasher
+        self.entries: dict[str, Any] = {}
+
+    def load(self) -> None:
+        try:
+            parsed = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(parsed, dict) and parsed.get("version") == STAMPS_VERSION:
+            checks = parsed.get("checks")
+            if isinstance(checks, dict):
+                self.entries = checks
+
+    def save(self) -> None:
+        payload = {"version": STAMPS_VERSION, "checks": self.entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        temp_path.replace(self.path)
+
+    def outputs_digest(self, check: Check) -> dict[str, str] | None:
+        digests: dict[str, str] = {}
+        for output in check.outputs:
+            output_path = self.hasher.root / output
+            if not output_path.is_file():
+                return None
+            digests[output] = self.hasher.file_digest(output_path)
+        return digests
+
+    def is_current(self, check: Check, inputs_digest: str) -> bool:
+        entry = self.entries.get(check.name)
+        if not isinstance(entry, dict) or entry.get("inputs") != inputs_digest:
+            return False
+        return self.outputs_digest(check) == entry.get("outputs")
+
+    def record(self, check: Check, inputs_digest: str) -> None:
+        outputs = self.outputs_digest(check)
+        if outputs is None:
+            self.entries.pop(check.name, None)
+        else:
+            self.entries[check.name] = {"inputs": inputs_digest, "outputs": outputs}
+        self.save()
+
+    def forget(self, check: Check) -> None:
+        if self.entries.pop(check.name, None) is not None:
+            self.save()
+
+
+class CancelToken:
+    """Shared by the scheduler and check threads so one failure stops every running child."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._processes: set[subprocess.Popen[bytes]] = set()
 
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def register(self, process: subprocess.Popen[bytes]) -> bool:
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._processes.add(process)
+            return True
+
+    def unregister(self, process: subprocess.Popen[bytes]) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            for process in self._processes:
+                if process.poll() is None:
+                    process.terminate()
+
+
+def wait_with_usage(process: subprocess.Popen[bytes]) -> tuple[int, Any]:
+    """Reap the child with wait4 to get its own rusage; fall back to wait() where unavailable."""
+
+    if hasattr(os, "wait4"):
+        try:
+            _, status, usage = os.wait4(process.pid, 0)
+        except ChildProcessError:
+            return process.wait(), None
+        process.returncode = os.waitstatus_to_exitcode(status)
+        return process.returncode, usage
+    return process.wait(), None
+
+
+def max_rss_bytes(usage: Any) -> int:
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return int(usage.ru_maxrss) if sys.platform == "darwin" else int(usage.ru_maxrss) * 1024
+
+
+def format_usage(result: CheckResult) -> str:
+    parts = [f"{result.wall_ms / 1000:.1f}s wall"] if result.wall_ms is not None else []
+    if result.user_cpu_ms is not None and result.system_cpu_ms is not None:
+        parts.append(f"{(result.user_cpu_ms + result.system_cpu_ms) / 1000:.1f}s cpu")
+    if result.peak_rss_bytes is not None:
+        parts.append(f"{result.peak_rss_bytes / (1024 * 1024):.1f} MiB peak rss")
+    return ", ".join(parts)
+
+
+class OutputCapture:
+    """
+    Prefixes each line of a check's output and keeps only the last `tail_lines`.
+
+    Partial lines are capped at CAPTURE_MAX_LINE_BYTES, so memory per check is bounded
+    no matter how much (or how oddly) the child prints.
+    """
+
+    def __init__(self, name: str, tail_lines: int) -> None:
+        self.name = name
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self._partial: dict[str, bytearray] = {}
+
+    def feed(self, stream: str, chunk: bytes) -> None:
+        buffer = self._partial.setdefault(stream, bytearray())
+        buffer.extend(chunk)
+        while True:
+            newline = buffer.find(b"\n")
+            if newline < 0:
+                break
+            self._emit(stream, bytes(buffer[:newline]))
+            del buffer[: newline + 1]
+        while len(buffer) > CAPTURE_MAX_LINE_BYTES:
+            self._emit(stream, bytes(buffer[:CAPTURE_MAX_LINE_BYTES]))
+            del buffer[:CAPTURE_MAX_LINE_BYTES]
+
+    def close(self, stream: str) -> None:
+        buffer = self._partial.pop(stream, None)
+        if buffer:
+            self._emit(stream, bytes(buffer))
+
+    def _emit(self, stream: str, raw_line: bytes) -> None:
+        line = raw_line.decode("utf-8", errors="replace").rstrip("\r")
+        marker = "!" if stream == "stderr" else ""
+        self.tail.append(f"{marker} {line}" if marker else line)
+        with OUTPUT_LOCK:
+            sys.stdout.write(f"[{self.name}]{marker} {line}\n")
+            sys.stdout.flush()
+
+
+async def pump_output(process: subprocess.Popen[bytes], capture: OutputCapture) -> None:
+    loop = asyncio.get_running_loop()
+
+    async def pump(pipe: Any, stream: str) -> None:
+        reader = asyncio.StreamReader(limit=CAPTURE_CHUNK_BYTES)
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+        try:
+            while True:
+                chunk = await reader.read(CAPTURE_CHUNK_BYTES)
+                if not chunk:
+                    break
+                capture.feed(stream, chunk)
+        finally:
+            transport.close()
+            capture.close(stream)
+
+    await asyncio.gather(pump(process.stdout, "stdout"), pump(process.stderr, "stderr"))
+
+
+def pump_output_blocking(process: subprocess.Popen[bytes], capture: OutputCapture) -> None:
+    # Windows event loops cannot attach to anonymous Popen pipes; use one thread per stream.
+    def pump(pipe: Any, stream: str) -> None:
+        for chunk in iter(lambda: pipe.read1(CAPTURE_CHUNK_BYTES), b""):
+            capture.feed(stream, chunk)
+        capture.close(stream)
+
+    readers = [
+        threading.Thread(target=pump, args=(process.stdout, "stdout"), daemon=True),
+        threading.Thread(target=pump, args=(process.stderr, "stderr"), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+
+
+class NodeWorkerError(RuntimeError):
+    pass
+
+
+class NodeWorker:
+    """One `check-worker.js` process; runs one script at a time over newline-delimited JSON-RPC."""
+
+    def __init__(self, cwd: Path = ROOT) -> None:
+        # The worker script always comes from this checkout; scripts resolve against `cwd`.
+        self.process = subprocess.Popen(
+            ["node", str(ROOT / NODE_WORKER_SCRIPT)], cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        self._next_id = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, script: str, args: list[str], on_output: Any) -> dict[str, Any]:
+        """Run `node script args...` in the worker; `on_output(stream, text)` gets its output."""
+
+        self._next_id += 1
+        request_id = self._next_id
+        request = {"jsonrpc": "2.0", "id": request_id, "method": "run", "params": {"script": script, "args": args}}
+        try:
+            self.process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            self.process.stdin.flush()
+        except OSError as error:
+            raise NodeWorkerError(f"node worker is not accepting requests ({error})") from error
+
+        for raw_line in iter(self.process.stdout.readline, b""):
+            try:
+                message = json.loads(raw_line)
+            except json.JSONDecodeError as error:
+                raise NodeWorkerError(f"unreadable node worker message ({error})") from error
+            if message.get("method") == "output":
+                params = message.get("params") or {}
+                if params.get("id") == request_id:
+                    on_output(params.get("stream"), str(params.get("data", "")))
+                continue
+            if message.get("id") != request_id:
+                continue
+            if "error" in message:
+                raise NodeWorkerError(str((message.get("error") or {}).get("message")))
+            return message.get("result") or {}
+        raise NodeWorkerError(f"node worker exited with code {self.process.wait()}")
+
+    def close(self) -> None:
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=NODE_WORKER_CLOSE_TIMEOUT_S)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+
+
+class NodeWorkerPool:
+    """Starts up to `size` workers on demand; a worker that died (or was cancelled) is replaced."""
+
+    def __init__(self, size: int, cwd: Path = ROOT) -> None:
+        self.size = size
+        self.cwd = cwd
+        self._condition = threading.Condition()
+        self._idle: list[NodeWorker] = []
+        self._workers: list[NodeWorker] = []
+
+    def acquire(self) -> NodeWorker:
+        with self._condition:
+            while True:
+                for worker in [worker for worker in self._idle if not worker.alive]:
+                    self._idle.remove(worker)
+                    self._workers.remove(worker)
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._workers) < self.size:
+                    worker = NodeWorker(self.cwd)
+                    self._workers.append(worker)
+                    return worker
+                self._condition.wait()
+
+    def release(self, worker: NodeWorker) -> None:
+        with self._condition:
+            if worker.alive:
+                self._idle.append(worker)
+            else:
+                self._workers.remove(worker)
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            workers, self._workers, self._idle = self._workers, [], []
+        for worker in workers:
+            worker.close()
+
+
+def worker_invocation(command: list[str]) -> tuple[str, list[str]] | None:
+    """`node <script.js> args...` can run in a worker; `node --test` and non-node commands cannot."""
+
+    if len(command) >= 2 and command[0] == "node" and command[1].endswith(".js") and not command[1].startswith("-"):
+        return command[1], command[2:]
+    return None
+
+
+def run_in_worker(
+    workers: NodeWorkerPool,
+    invocation: tuple[str, list[str]],
+    capture: OutputCapture | None,
+    cancel: CancelToken | None,
+) -> tuple[int, dict[str, Any], float]:
+    """Run one invocation on a pooled worker; returns (exit code, worker usage, wall ms)."""
+
+    def on_output(stream: str, text: str) -> None:
+        if capture is not None:
+            capture.feed(stream, text.encode("utf-8"))
+            return
+        target = sys.stderr if stream == "stderr" else sys.stdout
+        with OUTPUT_LOCK:
+            target.write(text)
+            target.flush()
+
+    worker = workers.acquire()
+    started_at = time.perf_counter()
+    if cancel is not None and not cancel.register(worker.process):
+        worker.process.terminate()
     try:
-        completed = subprocess.run(command, cwd=ROOT, check=False)
-    except FileNotFoundError:
-        print(f"[FAIL]  {name} (command not found: {command[0]})")
-        return 127
+        result = worker.run(*invocation, on_output)
+        returncode = int(result.get("exitCode", 1))
+    except NodeWorkerError as error:
+        # A worker that broke protocol is not reused; the pool starts a fresh one.
+        result = {}
+        if worker.alive:
+            worker.process.kill()
+            worker.process.wait()
+        if cancel is not None and cancel.cancelled:
+            returncode = worker.process.returncode or 1
+        else:
+            returncode = 1
+            on_output("stderr", f"[node worker] {error}\n")
+    finally:
+        if cancel is not None:
+            cancel.unregister(worker.process)
+        if capture is not None:
+            capture.close("stdout")
+            capture.close("stderr")
+        workers.release(worker)
+    return returncode, result, round((time.perf_counter() - started_at) * 1000, 1)
+
+
+def run_check(
+    check: Check,
+    cancel: CancelToken | None = None,
+    tail_lines: int | None = None,
+    workers: NodeWorkerPool | None = None,
+    cwd: Path = ROOT,
+) -> CheckResult:
+    """Run one check in `cwd`; with `tail_lines`, capture its output (see OutputCapture)."""
+
+    name, command = check.name, check.command
+    invocation = worker_invocation(command) if workers is not None else None
+    with OUTPUT_LOCK:
+        print(f"\n[CHECK] {name}")
+        print(f"[CMD]   {' '.join(command)}" + (" (node worker)" if invocation is not None else ""))
+
+    capture = OutputCapture(name, tail_lines) if tail_lines else None
+    if invocation is not None:
+        try:
+            returncode, worker_usage, wall_ms = run_in_worker(workers, invocation, capture, cancel)
+        except FileNotFoundError:
+            print(f"[FAIL]  {name} (command not found: node)")
+            return CheckResult(name, "fail", exit_code=127)
+        result = CheckResult(
+            name,
+            "pass",
+            exit_code=returncode,
+            wall_ms=wall_ms,
+            user_cpu_ms=worker_usage.get("userCpuMs"),
+            system_cpu_ms=worker_usage.get("systemCpuMs"),
+            peak_rss_bytes=worker_usage.get("peakRssBytes"),
+        )
+    else:
+        pipe = subprocess.PIPE if capture is not None else None
+        started_at = time.perf_counter()
+        try:
+            process = subprocess.Popen(command, cwd=cwd, stdout=pipe, stderr=pipe)
+        except FileNotFoundError:
+            print(f"[FAIL]  {name} (command not found: {command[0]})")
+            return CheckResult(name, "fail", exit_code=127)
+
+        if cancel is not None and not cancel.register(process):
+            process.terminate()
+        try:
+            if capture is not None:
+                if os.name == "nt":
+                    pump_output_blocking(process, capture)
+                else:
+                    asyncio.run(pump_output(process, capture))
+            returncode, usage = wait_with_usage(process)
+        finally:
+            if cancel is not None:
+                cancel.unregister(process)
+
+        result = CheckResult(name, "pass", exit_code=returncode, wall_ms=round((time.perf_counter() - started_at) * 1000, 1))
+        if usage is not None:
+            result.user_cpu_ms = round(usage.ru_utime * 1000, 1)
+            result.system_cpu_ms = round(usage.ru_stime * 1000, 1)
+            result.peak_rss_bytes = max_rss_bytes(usage)
+
+    if capture is not None:
+        result.output_tail = list(capture.tail)
 
+    if returncode != 0:
+        if cancel is not None and cancel.cancelled:
+            result.status = "cancelled"
+            print(f"[CANCEL] {name} (stopped after another check failed)")
+        else:
+            result.status = "fail"
+            print(f"[FAIL]  {name} (exit code {returncode}; {format_usage(result)})")
+        result.exit_code = returncode or 1
+        return result
+
+    print(f"[PASS]  {name} ({format_usage(result)})")
+    return result
+
+
+def write_timings_report(results: list[CheckResult], jobs: int, ok: bool, wall_ms: float) -> Path:
+    generated_at = datetime.now(timezone.utc)
+    payload = {
+        "version": TIMINGS_VERSION,
+        "generatedAt": generated_at.isoformat().replace("+00:00", "Z"),
+        "ok": ok,
+        "jobs": jobs,
+        "wallMs": wall_ms,
+        "checks": [result.to_json() for result in results],
+    }
+    text = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+
+    TIMINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    TIMINGS_PATH.write_text(text, encoding="utf-8")
+    HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+    history_path = HISTORY_DIR / f"gate-timings.{generated_at.strftime('%Y%m%dT%H%M%S%fZ')}.json"
+    history_path.write_text(text, encoding="utf-8")
+    prune_timings_history(HISTORY_DIR)
+    return history_path
+
+
+def prune_timings_history(history_dir: Path, keep: int = SHARD_HISTORY_LIMIT) -> None:
+    """Delete all but the newest `keep` gate-timings history files (shard balancing reads no more)."""
+
+    history_paths = sorted(history_dir.glob("gate-timings.*.json"))
+    for stale_path in history_paths[: max(len(history_paths) - keep, 0)]:
+        stale_path.unlink(missing_ok=True)
+
+
+def validate_check_graph(checks: list[Check]) -> None:
+    names = [check.name for check in checks]
+    if len(set(names)) != len(names):
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        raise RuntimeError(f"duplicate check names: {', '.join(duplicates)}")
+
+    known = set(names)
+    for check in checks:
+        unknown = [dep for dep in check.depends_on if dep not in known]
+        if unknown:
+            raise RuntimeError(f"check '{check.name}' depends on unknown check(s): {', '.join(unknown)}")
+
+    resolved: set[str] = set()
+    remaining = list(checks)
+    while remaining:
+        ready = [check for check in remaining if all(dep in resolved for dep in check.depends_on)]
+        if not ready:
+            cycle = ", ".join(check.name for check in remaining)
+            raise RuntimeError(f"dependency cycle between checks: {cycle}")
+        resolved.update(check.name for check in ready)
+        remaining = [check for check in remaining if check.name not in resolved]
+
+
+def run_checks(
+    checks: list[Check],
+    jobs: int,
+    stamps: CheckStamps | None = None,
+    satisfied: Iterable[str] = (),
+    tail_lines: int | None = None,
+    workers: NodeWorkerPool | None = None,
+    cwd: Path = ROOT,
+) -> tuple[int, list[CheckResult]]:
+    """
+    Run checks as a dependency DAG with at most `jobs` children at once.
+
+    Ready checks start in declaration order, so `jobs=1` reproduces the sequential
+    gate exactly. The first failing check cancels running checks and skips the rest,
+    unless it is non-blocking: then the others carry on and only the exit code fails.
+    With `stamps`, checks whose inputs are unchanged since their last pass are reused.
+    Dependencies named in `satisfied` are treated as already passed (used by --merge).
+    `tail_lines` turns on prefixed, bounded output capture for every check.
+    With `workers`, `node <script>` checks run on the pooled Node workers.
+    `cwd` is the tree the checks run in (a base-commit worktree for --baseline).
+    Returns the exit code and one result per check in declaration order.
+    """
+
+    pending = list(checks)
+    order = {check.name: index for index, check in enumerate(checks)}
+    results: dict[str, CheckResult] = {}
+    completed: set[str] = set(satisfied)
+    running: dict[Future[CheckResult], tuple[Check, str | None]] = {}
+
+    def ordered_results() -> list[CheckResult]:
+        return [results.get(check.name) or CheckResult(check.name, "skipped") for check in checks]
+
+    cancel = CancelToken()
+    deferred_code = 0
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            started = True
+            while started:
+                started = False
+                for check in list(pending):
+                    if len(running) >= jobs:
+                        break
+                    if not all(dep in completed for dep in check.depends_on):
+                        continue
+                    pending.remove(check)
+                    inputs_digest = stamps.hasher.check_digest(check) if stamps and check.inputs else None
+                    if stamps and inputs_digest and stamps.is_current(check, inputs_digest):
+                        print(f"\n[REUSE] {check.name} (inputs unchanged since last pass)")
+                        results[check.name] = CheckResult(check.name, "reused", exit_code=0)
+                        completed.add(check.name)
+                        # A reused check may unblock dependents, so rescan from the top.
+                        started = True
+                        break
+                    running[executor.submit(run_check, check, cancel, tail_lines, workers, cwd)] = (check, inputs_digest)
+
+            if not running:
+                if pending:
+                    # Whatever is left waits on a failed non-blocking check.
+                    print(f"[SKIP]  {len(pending)} check(s) not started: a dependency failed")
+                    break
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda item: order[running[item][0].name]):
+                check, inputs_digest = running.pop(future)
+                result = future.result()
+                results[check.name] = result
+                if result.status != "pass":
+                    if stamps:
+                        stamps.forget(check)
+                    if result.status == "fail" and not check.blocking:
+                        print(f"[INFO]  '{check.name}' is non-blocking; continuing with the remaining checks")
+                        deferred_code = deferred_code or result.exit_code or 1
+                        continue
+                    cancel.cancel()
+                    for other in wait(running).done:
+                        results[running[other][0].name] = other.result()
+                    skipped = len(pending)
+                    if skipped:
+                        print(f"[SKIP]  {skipped} queued check(s) not started after '{check.name}' failed")
+                    return result.exit_code or 1, ordered_results()
+                if stamps and inputs_digest:
+                    stamps.record(check, inputs_digest)
+                completed.add(check.name)
+
+    return deferred_code, ordered_results()
+
+
+def shardable_checks(checks: list[Check]) -> list[Check]:
+    return [check for check in checks if not check.depends_on]
+
+
+def load_historical_durations(history_dir: Path, limit: int = SHARD_HISTORY_LIMIT) -> dict[str, float]:
+    """Median wall time per check over the most recent gate-timings history files."""
+
+    samples: dict[str, list[float]] = {}
+    history_paths = sorted(history_dir.glob("gate-timings.*.json"))[-limit:] if history_dir.is_dir() else []
+    for history_path in history_paths:
+        try:
+            parsed = json.loads(history_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        for entry in parsed.get("checks", []) if isinstance(parsed, dict) else []:
+            wall_ms = entry.get("wallMs") if isinstance(entry, dict) else None
+            if entry.get("status") == "pass" and isinstance(wall_ms, (int, float)):
+                samples.setdefault(str(entry.get("name")), []).append(float(wall_ms))
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def plan_shards(checks: list[Check], shard_count: int, durations: dict[str, float]) -> list[list[Check]]:
+    """
+    Greedy longest-first assignment of checks to shards by expected wall time.
+
+    Checks without history use the median known duration. The plan only depends on
+    its inputs, so every node given the same history computes the same split.
+    """
+
+    fallback = statistics.median(durations.values()) if durations else DEFAULT_CHECK_DURATION_MS
+    order = {check.name: index for index, check in enumerate(checks)}
+    by_cost = sorted(checks, key=lambda check: (-durations.get(check.name, fallback), order[check.name]))
+
+    shards: list[list[Check]] = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+    for check in by_cost:
+        target = min(range(shard_count), key=lambda index: (loads[index], index))
+        shards[target].append(check)
+        loads[target] += durations.get(check.name, fallback)
+
+    return [sorted(shard, key=lambda check: order[check.name]) for shard in shards]
+
+
+def shard_result_path(shard_index: int, shard_count: int) -> Path:
+    return ROOT / ARTIFACT_DIR / f"shard-result.{shard_index}-of-{shard_count}.json"
+
+
+def write_shard_result(
+    shard_index: int, shard_count: int, assigned: list[Check], results: list[CheckResult], ok: bool
+) -> Path:
+    payload = {
+        "version": SHARD_RESULT_VERSION,
+        "generatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "shardIndex": shard_index,
+        "shardCount": shard_count,
+        "ok": ok,
+        "checks": [check.name for check in assigned],
+        "results": [result.to_json() for result in results],
+    }
+    output_path = shard_result_path(shard_index, shard_count)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return output_path
+
+
+def collect_shard_artifacts(shard_dirs: list[Path], sharded: list[Check]) -> list[str]:
+    """
+    Verify that the shards together passed every sharded check, then copy their
+    declared outputs into the local artifact dir. Raises RuntimeError on any gap.
+
+    Returns the non-blocking checks that failed on a shard: they do not stop the
+    merge, but the merged gate must still fail.
+    """
+
+    blocking = {check.name: check.blocking for check in sharded}
+    failed_non_blocking: list[str] = []
+    shard_count: int | None = None
+    seen_indexes: set[int] = set()
+    passed: dict[str, Path] = {}
+    for shard_dir in shard_dirs:
+        result_paths = sorted(shard_dir.glob("shard-result.*-of-*.json"))
+        if not result_paths:
+            raise RuntimeError(f"no shard-result file in {shard_dir}")
+        for result_path in result_paths:
+            parsed = json.loads(result_path.read_text(encoding="utf-8"))
+            if shard_count is None:
+                shard_count = parsed.get("shardCount")
+            if parsed.get("shardCount") != shard_count:
+                raise RuntimeError(f"{result_path} has shardCount {parsed.get('shardCount')}, expected {shard_count}")
+            if not parsed.get("ok"):
+                failed = [
+                    entry.get("name")
+                    for entry in parsed.get("results", [])
+                    if isinstance(entry, dict) and entry.get("status") not in ("pass", "reused")
+                ]
+                if not failed or any(blocking.get(name, True) for name in failed):
+                    raise RuntimeError(f"shard {parsed.get('shardIndex')} did not pass ({result_path})")
+                failed_non_blocking.extend(failed)
+            seen_indexes.add(parsed.get("shardIndex"))
+            for name in parsed.get("checks", []):
+                passed[name] = shard_dir
+
+    missing_shards = sorted(set(range(shard_count or 0)) - seen_indexes)
+    if missing_shards:
+        raise RuntimeError(f"missing shard result(s) for index {', '.join(map(str, missing_shards))}")
+    missing_checks = [check.name for check in sharded if check.name not in passed]
+    if missing_checks:
+        raise RuntimeError(f"no shard ran: {', '.join(missing_checks)} (shards used different plans?)")
+
+    artifact_root = (ROOT / ARTIFACT_DIR).resolve()
+    artifact_root.mkdir(parents=True, exist_ok=True)
+    for check in sharded:
+        if check.name in failed_non_blocking:
+            continue
+        shard_dir = passed[check.name].resolve()
+        for output in check.outputs:
+            relative = Path(output).relative_to(ARTIFACT_DIR)
+            source = shard_dir / relative
+            if not source.is_file():
+                raise RuntimeError(f"shard artifact missing for '{check.name}': {source}")
+            if shard_dir != artifact_root:
+                destination = artifact_root / relative
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, destination)
+    return sorted(failed_non_blocking)
+
+
+def git_output(args: list[str]) -> str:
+    completed = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        detail = completed.stderr.strip() or f"exit code {completed.returncode}"
+        raise RuntimeError(f"git {' '.join(args)} failed: {detail}")
+    return completed.stdout
+
+
+def node_runtime() -> str:
+    completed = subprocess.run(["node", "--version"], capture_output=True, text=True)
     if completed.returncode != 0:
-        print(f"[FAIL]  {name} (exit code {completed.returncode})")
-        return completed.returncode or 1
+        raise RuntimeError(f"node --version failed: {completed.stderr.strip()}")
+    return completed.stdout.strip()
+
+
+def resolve_commit(ref: str) -> str:
+    # A full SHA needs no git lookup, so a restored store can answer without the base objects.
+    if FULL_COMMIT_RE.fullmatch(ref):
+        return ref
+    return git_output(["rev-parse", "--verify", f"{ref}^{{commit}}"]).strip()
+
+
+@lru_cache(maxsize=None)
+def glob_regex(pattern: str) -> re.Pattern[str]:
+    """Path.glob semantics for repo-relative paths: `**/` spans directories, `*` and `?` do not."""
+
+    parts: list[str] = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            parts.append("(?:[^/]+/)*")
+            index += 3
+        elif pattern[index] == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif pattern[index] == "?":
+            parts.append("[^/]")
+            index += 1
+        else:
+            parts.append(re.escape(pattern[index]))
+            index += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+def list_tree_blobs(commit: str) -> dict[str, str]:
+    """Repo-relative path -> git blob id for every file in `commit`."""
+
+    blobs: dict[str, str] = {}
+    for record in git_output(["ls-tree", "-r", "--full-tree", "-z", commit]).split("\0"):
+        meta, _, path = record.partition("\t")
+        fields = meta.split()
+        if len(fields) == 3 and fields[1] == "blob":
+            blobs[path] = fields[2]
+    return blobs
+
+
+def baseline_checks(chapter_ids: list[str]) -> list[Check]:
+    names = {PERF_GATE_CHECK, *(tuning_gate_check_name(chapter_id) for chapter_id in chapter_ids)}
+    return [check for check in build_checks(chapter_ids, True) if check.name in names]
 
-    print(f"[PASS]  {name}")
+
+class BaselineStore:
+    """
+    Content-addressed baseline artifacts: objects/<key[:2]>/<key>/ holds one check's outputs.
+
+    Keys hash the check command, the Node version and the blob id of every input file in
+    the base tree, so base commits that share inputs share entries. commits/<sha>.json
+    remembers a base commit's chapters and keys. Least recently used entries beyond
+    `max_entries` are pruned.
+    """
+
+    def __init__(self, root: Path, max_entries: int = BASELINE_STORE_MAX_ENTRIES) -> None:
+        self.root = root
+        self.max_entries = max_entries
+
+    def entry_key(self, check: Check, blobs: dict[str, str], runtime: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(json.dumps([BASELINE_STORE_VERSION, runtime, check.command, list(check.inputs)]).encode("utf-8"))
+        patterns = [glob_regex(pattern) for pattern in check.inputs]
+        for path in sorted(path for path in blobs if any(pattern.match(path) for pattern in patterns)):
+            digest.update(f"\0{path}\0{blobs[path]}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def entry_dir(self, key: str) -> Path:
+        return self.root / "objects" / key[:2] / key
+
+    def alias_path(self, commit: str) -> Path:
+        return self.root / "commits" / f"{commit}.json"
+
+    def load_alias(self, commit: str, runtime: str) -> dict[str, Any] | None:
+        try:
+            parsed = json.loads(self.alias_path(commit).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(parsed, dict)
+            or parsed.get("version") != BASELINE_STORE_VERSION
+            or parsed.get("runtime") != runtime
+            or not isinstance(parsed.get("chapters"), list)
+            or not isinstance(parsed.get("keys"), dict)
+        ):
+            return None
+        return parsed
+
+    def save_alias(self, commit: str, runtime: str, chapter_ids: list[str], keys: dict[str, str]) -> None:
+        payload = {
+            "version": BASELINE_STORE_VERSION,
+            "commit": commit,
+            "runtime": runtime,
+            "chapters": chapter_ids,
+            "keys": keys,
+        }
+        alias_path = self.alias_path(commit)
+        alias_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = alias_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        temp_path.replace(alias_path)
+
+    def lookup(self, key: str) -> dict[str, Path] | None:
+        """Stored files by name, or None when the entry is missing or does not match its hashes."""
+
+        entry_dir = self.entry_dir(key)
+        try:
+            manifest = json.loads((entry_dir / "entry.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        files = manifest.get("files") if isinstance(manifest, dict) else None
+        if not isinstance(files, dict) or not files or manifest.get("version") != BASELINE_STORE_VERSION:
+            return None
+
+        stored: dict[str, Path] = {}
+        for name, digest in files.items():
+            path = entry_dir / name
+            if not path.is_file() or hash_file(path) != digest:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                return None
+            stored[name] = path
+        os.utime(entry_dir)
+        return stored
+
+    def put(self, key: str, check: Check, commit: str, source_root: Path) -> dict[str, Path]:
+        """Copy `check.outputs` from `source_root` into a new entry (written aside, then renamed)."""
+
+        staging = self.root / "tmp" / f"{key}.{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        files: dict[str, str] = {}
+        for output in check.outputs:
+            source = source_root / output
+            if not source.is_file():
+                shutil.rmtree(staging, ignore_errors=True)
+                raise RuntimeError(f"baseline check '{check.name}' did not write {output}")
+            name = Path(output).name
+            shutil.copy2(source, staging / name)
+            files[name] = hash_file(staging / name)
+        manifest = {
+            "version": BASELINE_STORE_VERSION,
+            "check": check.name,
+            "command": check.command,
+            "baseCommit": commit,
+            "createdAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "files": files,
+        }
+        (staging / "entry.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+        entry_dir = self.entry_dir(key)
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        staging.replace(entry_dir)
+        return {name: entry_dir / name for name in files}
+
+    def prune(self) -> int:
+        objects = self.root / "objects"
+        entries = sorted(
+            (path for path in objects.glob("*/*") if path.is_dir()) if objects.is_dir() else [],
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in entries[self.max_entries :]:
+            shutil.rmtree(stale, ignore_errors=True)
+        return max(0, len(entries) - self.max_entries)
+
+
+def remove_worktree(path: Path) -> None:
+    try:
+        git_output(["worktree", "remove", "--force", str(path)])
+    except RuntimeError:
+        shutil.rmtree(path, ignore_errors=True)
+        git_output(["worktree", "prune"])
+
+
+def run_baseline(
+    base_ref: str, store: BaselineStore, jobs: int, tail_lines: int | None, node_workers: int
+) -> int:
+    """Materialize the base commit's gate reports into BASELINE_DIR, generating only store misses."""
+
+    try:
+        commit = resolve_commit(base_ref)
+        runtime = node_runtime()
+        alias = store.load_alias(commit, runtime)
+        if alias is not None:
+            chapter_ids = [str(chapter_id) for chapter_id in alias["chapters"]]
+        else:
+            presets_source = f"{commit}:{CHAPTER_PRESETS_RELATIVE}"
+            chapter_ids = parse_chapter_ids(git_output(["show", presets_source]), presets_source)
+        checks = baseline_checks(chapter_ids)
+        keys = {str(name): str(key) for name, key in alias["keys"].items()} if alias is not None else {}
+        if any(check.name not in keys for check in checks):
+            blobs = list_tree_blobs(commit)
+            keys = {check.name: store.entry_key(check, blobs, runtime) for check in checks}
+    except (OSError, RuntimeError) as error:
+        print(f"[FAIL]  baseline lookup ({error})")
+        return 1
+
+    print(f"Baseline commit: {commit} (node {runtime})")
+    print(f"Baseline chapters: {', '.join(chapter_ids)}")
+
+    stored: dict[str, dict[str, Path]] = {}
+    misses: list[Check] = []
+    for check in checks:
+        entry = store.lookup(keys[check.name])
+        if entry is None:
+            misses.append(check)
+            print(f"[MISS]  {check.name} (baseline {keys[check.name][:12]})")
+        else:
+            stored[check.name] = entry
+            print(f"[REUSE] {check.name} (baseline {keys[check.name][:12]})")
+
+    if misses:
+        try:
+            if BASE_WORKTREE_DIR.exists():
+                remove_worktree(BASE_WORKTREE_DIR)
+            git_output(["worktree", "add", "--detach", str(BASE_WORKTREE_DIR), commit])
+        except (OSError, RuntimeError) as error:
+            print(f"[FAIL]  baseline worktree ({error})")
+            return 1
+        workers = NodeWorkerPool(node_workers, BASE_WORKTREE_DIR) if node_workers else None
+        try:
+            code, results = run_checks(misses, jobs, None, (), tail_lines, workers, BASE_WORKTREE_DIR)
+            if code != 0:
+                print_failure_summary(results)
+                return code
+            for check in misses:
+                stored[check.name] = store.put(keys[check.name], check, commit, BASE_WORKTREE_DIR)
+        except (OSError, RuntimeError) as error:
+            print(f"[FAIL]  baseline store ({error})")
+            return 1
+        finally:
+            if workers is not None:
+                workers.close()
+            try:
+                remove_worktree(BASE_WORKTREE_DIR)
+            except (OSError, RuntimeError) as error:
+                print(f"[WARN]  could not remove baseline worktree ({error})")
+
+    try:
+        # Start empty so reports of chapters the base no longer has, or of an earlier base, are not diffed.
+        shutil.rmtree(BASELINE_DIR, ignore_errors=True)
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        for check in checks:
+            for name, path in stored[check.name].items():
+                shutil.copyfile(path, BASELINE_DIR / name)
+        store.save_alias(commit, runtime, chapter_ids, keys)
+        pruned = store.prune()
+    except OSError as error:
+        print(f"[FAIL]  baseline store ({error})")
+        return 1
+
+    print(
+        f"\n[baseline] PASS commit={commit[:12]} reused={len(checks) - len(misses)} "
+        f"generated={len(misses)} pruned={pruned} dir={BASELINE_DIR.relative_to(ROOT).as_posix()}"
+    )
     return 0
 
 
-def main() -> int:
+def print_failure_summary(results: list[CheckResult]) -> None:
+    for result in results:
+        if result.status != "fail" or not result.output_tail:
+            continue
+        print(f"\n[FAIL]  {result.name}: last {len(result.output_tail)} line(s) of output")
+        for line in result.output_tail:
+            print(f"        {line}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run release-readiness checks.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Maximum number of checks to run concurrently (default: 1).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every check even when its inputs and artifacts are unchanged.",
+    )
+    parser.add_argument(
+        "--capture",
+        action="store_true",
+        help="Prefix child output with the check name and keep a bounded tail for failures (default with --jobs > 1).",
+    )
+    parser.add_argument(
+        "--tail-lines",
+        type=int,
+        default=DEFAULT_TAIL_LINES,
+        help=f"Lines of output kept per check for the failure summary (default: {DEFAULT_TAIL_LINES}).",
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        help="Zero-based index of this node's shard (requires --shard-count).",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        help="Total number of shards the independent checks are split across.",
+    )
+    parser.add_argument(
+        "--timings-history",
+        default=str(HISTORY_DIR),
+        help="Directory of gate-timings.*.json used to balance shards (must be identical on every shard).",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="SHARD_DIR",
+        help="Merge shard artifact directories and run the dependent checks once.",
+    )
+    parser.add_argument(
+        "--node-workers",
+        type=int,
+        default=0,
+        help="Run `node <script>` checks in up to N long-lived Node workers instead of a process each (default: 0, off).",
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="BASE_REF",
+        help="Fill .tmp/release-readiness/baseline with BASE_REF's perf/tuning reports (via the baseline store) and exit.",
+    )
+    parser.add_argument(
+        "--baseline-store",
+        default=str(BASELINE_STORE_DIR),
+        help="Content-addressed baseline artifact store used by --baseline.",
+    )
+    args = parser.parse_args(argv)
+    if args.baseline is not None and (args.shard_count is not None or args.merge):
+        parser.error("--baseline cannot be combined with --shard-index/--shard-count or --merge")
+    if args.node_workers < 0:
+        parser.error("--node-workers must be zero or a positive integer")
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    if args.tail_lines < 1:
+        parser.error("--tail-lines must be a positive integer")
+    if (args.shard_index is None) != (args.shard_count is None):
+        parser.error("--shard-index and --shard-count must be used together")
+    if args.shard_count is not None:
+        if args.shard_count < 1:
+            parser.error("--shard-count must be a positive integer")
+        if not 0 <= args.shard_index < args.shard_count:
+            parser.error("--shard-index must be in [0, --shard-count)")
+        if args.merge:
+            parser.error("--merge cannot be combined with --shard-index/--shard-count")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    tail_lines = args.tail_lines if args.capture or args.jobs > 1 else None
+
+    if args.baseline is not None:
+        print(f"Generating release-readiness baseline for {args.baseline}...")
+        return run_baseline(args.baseline, BaselineStore(Path(args.baseline_store)), args.jobs, tail_lines, args.node_workers)
+
     try:
         chapter_ids = load_chapter_ids(CHAPTER_PRESETS_PATH)
     except RuntimeError as error:
@@ -220,14 +1538,71 @@ def main() -> int:
     require_baseline = parse_bool_env("RELEASE_READINESS_REQUIRE_BASELINE", False)
     allow_missing_baseline = not require_baseline
     checks = build_checks(chapter_ids, allow_missing_baseline)
+    try:
+        validate_check_graph(checks)
+    except RuntimeError as error:
+        print(f"[FAIL]  check graph ({error})")
+        return 1
+
     print("Running release-readiness checks...")
     print(f"Discovered chapters for tuning gates: {', '.join(chapter_ids)}")
     print(f"Baseline required mode: {require_baseline}")
-    for name, command in checks:
-        code = run_check(name, command)
-        if code != 0:
-            return code
+    print(f"Parallel jobs: {args.jobs}")
+    print(f"Incremental reuse: {not args.force}")
+    print(f"Node workers: {args.node_workers or 'off'}")
+
+    selected = checks
+    satisfied: list[str] = []
+    failed_on_shards: list[str] = []
+    sharded = shardable_checks(checks)
+    if args.shard_count is not None:
+        durations = load_historical_durations(Path(args.timings_history))
+        selected = plan_shards(sharded, args.shard_count, durations)[args.shard_index]
+        print(f"Shard {args.shard_index + 1}/{args.shard_count}: {len(selected)} of {len(sharded)} independent check(s)")
+        for check in selected:
+            estimate = durations.get(check.name)
+            print(f"  - {check.name}" + (f" (~{estimate / 1000:.1f}s)" if estimate is not None else ""))
+    elif args.merge:
+        try:
+            failed_on_shards = collect_shard_artifacts([Path(shard_dir) for shard_dir in args.merge], sharded)
+        except (OSError, RuntimeError, ValueError) as error:
+            print(f"[FAIL]  shard merge ({error})")
+            return 1
+        satisfied = [check.name for check in sharded]
+        selected = [check for check in checks if check.depends_on]
+        print(f"Merged {len(args.merge)} shard dir(s); running {len(selected)} dependent check(s)")
+        for name in failed_on_shards:
+            print(f"[FAIL]  {name} (failed on its shard; non-blocking)")
+
+    stamps: CheckStamps | None = None
+    if not args.force:
+        stamps = CheckStamps(STAMPS_PATH, InputHasher(ROOT))
+        stamps.load()
+    started_at = time.perf_counter()
+    workers = NodeWorkerPool(args.node_workers) if args.node_workers else None
+    try:
+        code, results = run_checks(selected, args.jobs, stamps, satisfied, tail_lines, workers)
+    finally:
+        if workers is not None:
+            workers.close()
+    wall_ms = round((time.perf_counter() - started_at) * 1000, 1)
+    if failed_on_shards and code == 0:
+        code = 1
+    try:
+        history_path = write_timings_report(results, args.jobs, code == 0, wall_ms)
+        print(f"\n[INFO]  gate timings: {TIMINGS_PATH.relative_to(ROOT).as_posix()} (history: {history_path.name})")
+    except OSError as error:
+        print(f"\n[WARN]  could not write gate timings ({error})")
+    print_failure_summary(results)
+    if args.shard_count is not None:
+        result_path = write_shard_result(args.shard_index, args.shard_count, selected, results, code == 0)
+        print(f"[INFO]  shard result: {result_path.relative_to(ROOT).as_posix()}")
+    if code != 0:
+        return code
 
+    if args.shard_count is not None:
+        print(f"\nShard {args.shard_index + 1}/{args.shard_count} checks passed; run --merge to finish the gate.")
+        return 0
     print("\nAll release-readiness checks passed.")
     return 0
 
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Benchmark tools/validate-schemas.py on synthetic corpora and gate it against a baseline.
+
+Every docs/examples/*.sample.json is scaled up: each top-level array of objects
+(units, waves, run history entries, board units, ...) is repeated `--scale` times,
+capped by the schema's maxItems, with copied ids suffixed so they stay distinct.
+Every synthesized document is checked to be valid before it is timed.
+
+For each sample the corpus is validated in two modes:
+- tree:   json.loads + compiled validator (pair and corpus mode)
+- stream: event-driven validator (--stream mode)
+and the report records documents/sec and nodes/sec (JSON values visited) of the
+fastest pass over the corpus, plus the peak Python heap (tracemalloc) while
+validating its largest document.
+
+With a baseline, throughput below `(1 - tolerance) * baseline` or peak memory
+above `(1 + tolerance) * baseline` fails the run (exit code 1), like the
+tools/perf threshold checks. `--write-baseline` stores the current numbers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import importlib.util
+import io
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+
+ROOT = Path(__file__).resolve().parents[2]
+VALIDATOR_PATH = ROOT / "tools" / "validate-schemas.py"
+SUMMARY_PREFIX = "[validator-bench]"
+DEFAULT_BASELINE = "tools/perf/validator-bench-baseline.json"
+DEFAULT_SCALE = 8
+DEFAULT_DOCUMENTS = 20
+DEFAULT_MIN_SECONDS = 0.5
+MIN_PASSES = 5
+DEFAULT_TOLERANCE = {"docsPerSec": 0.5, "nodesPerSec": 0.5, "peakKiB": 0.2}
+MODES = ("tree", "stream")
+
+# Keys whose string values are identities; copies get a suffix so they stay unique.
+ID_KEYS = frozenset({"id", "runId", "instanceId"})
+
+# report metric -> "min" (throughput) | "max" (memory)
+BASELINE_METRICS = {
+    "docsPerSec": "min",
+    "nodesPerSec": "min",
+    "peakKiB": "max",
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark validate-schemas.py on synthetic corpora.")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        help=f"Repeat factor for top-level collections (default: baseline's scale or {DEFAULT_SCALE}).",
+    )
+    parser.add_argument(
+        "--documents",
+        type=int,
+        help=f"Documents per synthetic corpus (default: baseline's value or {DEFAULT_DOCUMENTS}).",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=DEFAULT_MIN_SECONDS,
+        help="Keep re-validating each corpus until this much time has passed.",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON to compare against.",
+    )
+    parser.add_argument(
+        "--no-baseline",
+        action="store_true",
+        help="Only measure; do not compare against the baseline.",
+    )
+    parser.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help="Overwrite the baseline with this run's numbers (keeps its tolerance).",
+    )
+    parser.add_argument(
+        "--output",
+        help="Optional path for the JSON report.",
+    )
+    args = parser.parse_args()
+    for name in ("scale", "documents"):
+        value = getattr(args, name)
+        if value is not None and value < 1:
+            parser.error(f"--{name} must be a positive integer")
+    if args.min_seconds <= 0:
+        parser.error("--min-seconds must be positive")
+    return args
+
+
+def load_validator() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("validate_schemas", VALIDATOR_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Cannot load validator: {VALIDATOR_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so its dataclasses can resolve their module.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_baseline(path: Path) -> dict:
+    try:
+        parsed = json.loads(path.read_text(encoding="utf-8"))
+    except OSError as error:
+        raise RuntimeError(f"Cannot read validator baseline: {path} :: {error}") from error
+    except json.JSONDecodeError as error:
+        raise RuntimeError(f"Failed to parse validator baseline JSON: {path} :: {error}") from error
+    if not isinstance(parsed, dict) or not isinstance(parsed.get("benchmarks"), dict):
+        raise RuntimeError(f"Invalid validator baseline shape: expected a 'benchmarks' object in {path}")
+    return parsed
+
+
+def resolve_schema(validator: ModuleType, schema: Any, base: str) -> tuple[dict, str]:
+    """Follow `$ref`s to the schema object that carries the keywords."""
+
+    while isinstance(schema, dict) and "$ref" in schema:
+        name, _, pointer = schema["$ref"].partition("#")
+        base = name or base
+        schema = validator.SCHEMAS.lookup(base, pointer)
+    return (schema if isinstance(schema, dict) else {}), base
+
+
+def suffix_ids(node: Any, suffix: str) -> Any:
+    if isinstance(node, dict):
+        return {
+            key: f"{value}{suffix}" if key in ID_KEYS and isinstance(value, str) else suffix_ids(value, suffix)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [suffix_ids(item, suffix) for item in node]
+    return node
+
+
+def synthesize_document(validator: ModuleType, sample: Any, schema_name: str, scale: int, tag: int) -> Any:
+    root_schema, base = resolve_schema(validator, validator.SCHEMAS.document(schema_name), schema_name)
+    document = copy.deepcopy(sample)
+    if not isinstance(document, dict):
+        return document
+
+    properties = root_schema.get("properties", {})
+    for key, value in document.items():
+        if not value or not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+            continue
+        array_schema, _ = resolve_schema(validator, properties.get(key, {}), base)
+        target = len(value) * scale
+        if isinstance(array_schema.get("maxItems"), int):
+            target = min(target, array_schema["maxItems"])
+        document[key] = [
+            value[index % len(value)]
+            if index < len(value)
+            else suffix_ids(value[index % len(value)], f"_{tag}_{index // len(value)}")
+            for index in range(target)
+        ]
+    return document
+
+
+def count_nodes(document: Any) -> int:
+    count = 0
+    pending = [document]
+    while pending:
+        node = pending.pop()
+        count += 1
+        if isinstance(node, dict):
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+    return count
+
+
+def mode_runner(validator: ModuleType, schema_name: str, mode: str) -> Callable[[str], list]:
+    if mode == "tree":
+        compiled = validator.SCHEMAS.validator_for(schema_name)
+        return lambda text: validator.validate_document_text(compiled, text)
+    return lambda text: validator.validate_stream(io.StringIO(text), schema_name)
+
+
+def measure_mode(run: Callable[[str], list], texts: List[str], nodes: int, min_seconds: float) -> Dict[str, Any]:
+    run(texts[0])  # warm up compiled validators and pattern caches
+
+    # Each pass validates the whole corpus; the fastest pass is reported so that
+    # scheduler noise on shared CI machines does not read as a regression.
+    passes: List[float] = []
+    while sum(passes) < min_seconds or len(passes) < MIN_PASSES:
+        started = time.perf_counter()
+        for text in texts:
+            run(text)
+        passes.append(time.perf_counter() - started)
+    best = min(passes)
+
+    largest = max(texts, key=len)
+    tracemalloc.start()
+    run(largest)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "passes": len(passes),
+        "bestPassMs": round(best * 1000, 3),
+        "docsPerSec": round(len(texts) / best, 1),
+        "nodesPerSec": round(nodes / best, 1),
+        "peakKiB": round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(validator: ModuleType, scale: int, documents: int, min_seconds: float) -> List[dict]:
+    results = []
+    for schema_name, sample_name in validator.PAIRS:
+        sample = validator.parse_json(validator.EXAMPLES_DIR / sample_name)
+        corpus = [synthesize_document(validator, sample, schema_name, scale, tag) for tag in range(documents)]
+        compiled = validator.SCHEMAS.validator_for(schema_name)
+        for document in corpus:
+            errors: list = []
+            compiled(document, "$", errors)
+            if errors:
+                first = errors[0]
+                raise RuntimeError(
+                    f"Synthesized {sample_name} is not valid against {schema_name}: {first.path}: {first.message}"
+                )
+
+        texts = [json.dumps(document, ensure_ascii=False) for document in corpus]
+        nodes = sum(count_nodes(document) for document in corpus)
+        sample_key = schema_name.removesuffix(".schema.json")
+        for mode in MODES:
+            entry = {
+                "benchmark": f"{sample_key}/{mode}",
+                "sample": sample_name,
+                "mode": mode,
+                "documents": len(texts),
+                "nodesPerDocument": round(nodes / len(texts), 1),
+                "bytesPerDocument": round(sum(len(text.encode("utf-8")) for text in texts) / len(texts), 1),
+            }
+            entry.update(measure_mode(mode_runner(validator, schema_name, mode), texts, nodes, min_seconds))
+            results.append(entry)
+    return results
+
+
+def compare_with_baseline(results: List[dict], baseline: dict) -> List[dict]:
+    tolerance = {**DEFAULT_TOLERANCE, **(baseline.get("tolerance") or {})}
+    profile = baseline.get("profile") if isinstance(baseline.get("profile"), str) else None
+    by_name = {entry["benchmark"]: entry for entry in results}
+
+    failures = []
+    for name, limits in sorted(baseline["benchmarks"].items()):
+        entry = by_name.get(name)
+        if entry is None:
+            failures.append({"type": "missing_benchmark", "benchmark": name, "metric": None, "profile": profile})
+            continue
+        for metric, direction in BASELINE_METRICS.items():
+            reference = limits.get(metric) if isinstance(limits, dict) else None
+            if not isinstance(reference, (int, float)) or isinstance(reference, bool):
+                continue
+            if direction == "min":
+                threshold = round(reference * (1 - tolerance[metric]), 1)
+                failed = entry[metric] < threshold
+            else:
+                threshold = round(reference * (1 + tolerance[metric]), 1)
+                failed = entry[metric] > threshold
+            if failed:
+                failures.append(
+                    {
+                        "type": "below_minimum" if direction == "min" else "threshold_exceeded",
+                        "benchmark": name,
+                        "metric": metric,
+                        "actual": entry[metric],
+                        "baseline": reference,
+                        "threshold": threshold,
+                        "profile": profile,
+                    }
+                )
+    return failures
+
+
+def baseline_payload(results: List[dict], previous: Optional[dict], scale: int, documents: int) -> dict:
+    previous = previous or {}
+    return {
+        "version": previous.get("version", "1.0.0"),
+        "profile": previous.get("profile", "ci-validator-baseline"),
+        "scale": scale,
+        "documents": documents,
+        "tolerance": previous.get("tolerance", DEFAULT_TOLERANCE),
+        "benchmarks": {
+            entry["benchmark"]: {metric: entry[metric] for metric in BASELINE_METRICS} for entry in results
+        },
+    }
+
+
+def format_failure(failure: dict) -> str:
+    if failure["type"] == "missing_benchmark":
+        return f"Missing benchmark in report: benchmark={failure['benchmark']}"
+    label = "Below minimum" if failure["type"] == "below_minimum" else "Threshold exceeded"
+    comparison = "<" if failure["type"] == "below_minimum" else ">"
+    return (
+        f"{label}: benchmark={failure['benchmark']} metric={failure['metric']} "
+        f"actual={failure['actual']} {comparison} threshold={failure['threshold']} (baseline={failure['baseline']})"
+        + (f" profile={failure['profile']}" if failure.get("profile") else "")
+    )
+
+
+def summary_line(report: dict) -> str:
+    parts = [
+        f"{SUMMARY_PREFIX} {'PASS' if report['ok'] else 'FAIL'}",
+        f"benchmarks={len(report['benchmarks'])}",
+        f"scale={report['scale']}",
+        f"profile={report['profile'] or 'n/a'}",
+        f"baselineVersion={report['baselineVersion'] or 'n/a'}",
+    ]
+    if not report["ok"]:
+        parts.append(f"failures={len(report['failures'])}")
+    return " ".join(parts)
+
+
+def main() -> int:
+    args = parse_args()
+    baseline_path = (ROOT / args.baseline).resolve()
+    try:
+        baseline = None if args.no_baseline or not baseline_path.is_file() else load_baseline(baseline_path)
+        if baseline is None and not (args.no_baseline or args.write_baseline):
+            raise RuntimeError(f"Missing validator baseline: {baseline_path} (use --write-baseline or --no-baseline)")
+        scale = args.scale or (baseline or {}).get("scale") or DEFAULT_SCALE
+        documents = args.documents or (baseline or {}).get("documents") or DEFAULT_DOCUMENTS
+        results = run_benchmarks(load_validator(), scale, documents, args.min_seconds)
+    except RuntimeError as error:
+        print(f"[FAIL] {error}", file=sys.stderr)
+        return 1
+
+    for entry in results:
+        print(
+            f"[BENCH] {entry['benchmark']}: {entry['documents']} doc(s) x {entry['nodesPerDocument']:.0f} nodes, "
+            f"{entry['docsPerSec']:,.1f} docs/s, {entry['nodesPerSec']:,.0f} nodes/s, peak {entry['peakKiB']:.1f} KiB"
+        )
+
+    failures = [] if baseline is None or args.write_baseline else compare_with_baseline(results, baseline)
+    report = {
+        "version": "1.0.0",
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "ok": not failures,
+        "profile": (baseline or {}).get("profile"),
+        "baselineVersion": (baseline or {}).get("version"),
+        "scale": scale,
+        "documentsPerCorpus": documents,
+        "python": sys.version.split()[0],
+        "failures": failures,
+        "benchmarks": results,
+    }
+
+    if args.write_baseline:
+        baseline_path.write_text(
+            json.dumps(baseline_payload(results, baseline, scale, documents), indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"{SUMMARY_PREFIX} Wrote baseline to {args.baseline}")
+
+    if args.output:
+        output_path = (ROOT / args.output).resolve()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"{SUMMARY_PREFIX} Wrote report to {args.output}")
+
+    for failure in failures:
+        print(format_failure(failure), file=sys.stderr)
+    print(summary_line(report))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
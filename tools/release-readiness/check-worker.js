@@ -0,0 +1,274 @@
+#!/usr/bin/env node
+'use strict';
+
+// Long-lived runner for `check-release-readiness.py --node-workers N`.
+//
+// Reads newline-delimited JSON-RPC 2.0 requests from stdin:
+//   {"jsonrpc":"2.0","id":1,"method":"run","params":{"script":"tools/perf/run-and-check.js","args":["--iterations=200"]}}
+// and runs the script in this process as if it were `node <script> <args...>`:
+// process.argv is set, the script is loaded as the main module (so `require.main === module`
+// guards fire), and everything it requires stays in the module cache for later runs.
+// While a run is active, stdout/stderr writes are forwarded as `output` notifications and
+// process.exit() ends the run instead of the worker. The response carries the exit code.
+//
+// Runs are sequential. A run ends at the first process.exit() call, or once the event loop
+// has nothing left but the worker's own stdin. Its exit code is the exit() argument, else
+// process.exitCode, else 1 for an uncaught error, else 0.
+
+const { AsyncLocalStorage } = require('node:async_hooks');
+const Module = require('node:module');
+const path = require('node:path');
+const readline = require('node:readline');
+const util = require('node:util');
+
+const JSONRPC_VERSION = '2.0';
+const PARSE_ERROR = -32700;
+const INVALID_REQUEST = -32600;
+const METHOD_NOT_FOUND = -32601;
+const INVALID_PARAMS = -32602;
+const IDLE_POLL_MS = 2;
+
+class ExitSignal extends Error {
+  constructor(run) {
+    super(`process.exit(${run.exitCode})`);
+    this.name = 'ExitSignal';
+    this.run = run;
+  }
+}
+
+function normalizeExitCode(code, fallback = 0) {
+  if (code === undefined || code === null) {
+    return fallback;
+  }
+  const numeric = Number(code);
+  return Number.isInteger(numeric) ? numeric & 0xff : 1;
+}
+
+function parseRequest(line) {
+  let message;
+  try {
+    message = JSON.parse(line);
+  } catch (error) {
+    return { error: { code: PARSE_ERROR, message: `Parse error: ${error.message}` }, id: null };
+  }
+
+  const id = message && (typeof message.id === 'number' || typeof message.id === 'string') ? message.id : null;
+  if (!message || message.jsonrpc !== JSONRPC_VERSION || typeof message.method !== 'string' || id === null) {
+    return { error: { code: INVALID_REQUEST, message: 'Invalid request' }, id };
+  }
+  if (message.method !== 'run') {
+    return { error: { code: METHOD_NOT_FOUND, message: `Method not found: ${message.method}` }, id };
+  }
+
+  const params = message.params || {};
+  const args = params.args === undefined ? [] : params.args;
+  if (typeof params.script !== 'string' || !params.script || !Array.isArray(args) || args.some((arg) => typeof arg !== 'string')) {
+    return { error: { code: INVALID_PARAMS, message: 'params.script must be a path and params.args a list of strings' }, id };
+  }
+
+  return { id, script: params.script, args };
+}
+
+function describeError(error) {
+  if (error instanceof Error && error.stack) {
+    return error.stack;
+  }
+  return `Uncaught ${util.inspect(error)}`;
+}
+
+function countResources(names) {
+  const counts = new Map();
+  for (const name of names) {
+    counts.set(name, (counts.get(name) || 0) + 1);
+  }
+  return counts;
+}
+
+function isIdle(baseline, current) {
+  for (const [name, count] of current) {
+    if (count > (baseline.get(name) || 0)) {
+      return false;
+    }
+  }
+  return true;
+}
+
+function createWorker({ input = process.stdin, output = process.stdout, errorOutput = process.stderr } = {}) {
+  const storage = new AsyncLocalStorage();
+  const writeMessage = output.write.bind(output);
+  const writeWorkerError = errorOutput.write.bind(errorOutput);
+  const realExit = process.exit.bind(process);
+  const queue = [];
+  let activeRun = null;
+  let draining = false;
+  let inputClosed = false;
+
+  function send(message) {
+    writeMessage(`${JSON.stringify({ jsonrpc: JSONRPC_VERSION, ...message })}\n`);
+  }
+
+  function ownerRun() {
+    return storage.getStore() || activeRun;
+  }
+
+  function forward(streamName) {
+    return function write(chunk, encoding, callback) {
+      const done = typeof encoding === 'function' ? encoding : callback;
+      const run = ownerRun();
+      // Output from a run that already exited would never have been printed by a real process.
+      if (run && !run.finished && !run.exited) {
+        const data =
+          typeof chunk === 'string'
+            ? typeof encoding === 'string' && encoding !== 'utf8' && encoding !== 'utf-8'
+              ? Buffer.from(chunk, encoding).toString('utf8')
+              : chunk
+            : Buffer.from(chunk).toString('utf8');
+        send({ method: 'output', params: { id: run.id, stream: streamName, data } });
+      } else if (!run) {
+        // Never let stray writes corrupt the protocol stream.
+        writeWorkerError(chunk);
+      }
+      if (typeof done === 'function') {
+        process.nextTick(done);
+      }
+      return true;
+    };
+  }
+
+  function fail(run, error) {
+    if (!run || run.finished || run.exited) {
+      return;
+    }
+    forward('stderr')(`${describeError(error)}\n`);
+    run.exited = true;
+    run.exitCode = 1;
+  }
+
+  process.exit = function exit(code) {
+    const run = ownerRun() || { exited: true, exitCode: normalizeExitCode(code) };
+    if (!run.exited && !run.finished) {
+      run.exited = true;
+      run.exitCode = normalizeExitCode(code, normalizeExitCode(process.exitCode));
+    }
+    // Unwind the caller like a real exit would; later exit() calls never override the first.
+    throw new ExitSignal(run);
+  };
+  process.stdout.write = forward('stdout');
+  process.stderr.write = forward('stderr');
+
+  process.on('uncaughtException', (error) => {
+    if (!(error instanceof ExitSignal)) {
+      fail(storage.getStore() || activeRun, error);
+    }
+  });
+  process.on('unhandledRejection', (reason) => {
+    if (!(reason instanceof ExitSignal)) {
+      fail(storage.getStore() || activeRun, reason);
+    }
+  });
+
+  async function waitForRun(run, baseline) {
+    await new Promise((resolve) => setImmediate(resolve));
+    while (!run.exited && !isIdle(baseline, countResources(process.getActiveResourcesInfo()))) {
+      // Unref'd, so the poll timer itself never shows up as pending work.
+      await new Promise((resolve) => setTimeout(resolve, IDLE_POLL_MS).unref());
+    }
+  }
+
+  async function execute(request) {
+    const run = { id: request.id, exited: false, finished: false, exitCode: 0 };
+    const scriptPath = path.resolve(request.script);
+    const cwd = process.cwd();
+    const cpuStart = process.cpuUsage();
+    const startedAt = process.hrtime.bigint();
+    // Keeps the worker alive while the run waits on work, even after stdin has closed.
+    const keepAlive = setInterval(() => {}, 1 << 30);
+    const baseline = countResources(process.getActiveResourcesInfo());
+
+    activeRun = run;
+    process.argv = [process.execPath, scriptPath, ...request.args];
+    process.exitCode = undefined;
+    storage.run(run, () => {
+      try {
+        // Only the entry script is reloaded; its dependencies stay cached between runs.
+        delete require.cache[require.resolve(scriptPath)];
+        Module._load(scriptPath, null, true);
+      } catch (error) {
+        if (!(error instanceof ExitSignal)) {
+          fail(run, error);
+        }
+      }
+    });
+    await waitForRun(run, baseline);
+    clearInterval(keepAlive);
+
+    if (!run.exited) {
+      run.exitCode = normalizeExitCode(process.exitCode);
+    }
+    run.finished = true;
+    activeRun = null;
+    process.exitCode = undefined;
+    if (process.cwd() !== cwd) {
+      process.chdir(cwd);
+    }
+
+    const cpu = process.cpuUsage(cpuStart);
+    return {
+      exitCode: run.exitCode,
+      wallMs: Math.round(Number(process.hrtime.bigint() - startedAt) / 1e5) / 10,
+      userCpuMs: Math.round(cpu.user / 100) / 10,
+      systemCpuMs: Math.round(cpu.system / 100) / 10,
+      peakRssBytes: process.resourceUsage().maxRSS * 1024,
+    };
+  }
+
+  async function drain() {
+    if (draining) {
+      return;
+    }
+    draining = true;
+    while (queue.length > 0) {
+      const request = parseRequest(queue.shift());
+      if (request.error) {
+        send({ id: request.id, error: request.error });
+        continue;
+      }
+      send({ id: request.id, result: await execute(request) });
+    }
+    draining = false;
+    if (inputClosed) {
+      realExit(0);
+    }
+  }
+
+  const lines = readline.createInterface({ input, crlfDelay: Infinity });
+  lines.on('line', (line) => {
+    if (line.trim()) {
+      queue.push(line);
+      drain();
+    }
+  });
+  lines.on('close', () => {
+    inputClosed = true;
+    if (!draining) {
+      realExit(0);
+    }
+  });
+}
+
+if (require.main === module) {
+  createWorker();
+}
+
+module.exports = {
+  JSONRPC_VERSION,
+  PARSE_ERROR,
+  INVALID_REQUEST,
+  METHOD_NOT_FOUND,
+  INVALID_PARAMS,
+  normalizeExitCode,
+  parseRequest,
+  countResources,
+  isIdle,
+  createWorker,
+};
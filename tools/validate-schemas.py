@@ -4,22 +4,56 @@ Validate docs/examples/*.sample.json against docs/schemas/*.schema.json.
 
 This script intentionally supports only the JSON Schema keywords used in this repo.
 It has no external dependency.
+
+Corpus mode (`--corpus PATH --schema run_save|run_history`) validates a directory
+of *.json documents or a JSON Lines file (`-` for stdin) one document at a time.
+`--jobs N` spreads pairs, or chunks of corpus documents, across N processes while
+keeping output in input order.
+
+Stream mode (`--stream PATH --schema NAME`) validates a single document from a JSON
+event stream as it is read, so memory follows nesting depth rather than document size
+and deep nesting cannot hit the recursion limit. Pair samples larger than
+STREAM_THRESHOLD_BYTES take the same path. Errors are identical to the tree validator.
+
+Schemas may share definitions through `$ref` ("#/$defs/x" or "other.schema.json#/$defs/x").
+Referenced files are loaded lazily and every referenced definition is compiled once per
+process, so all schemas and documents that use it share one validator.
+
+After the pairs, an integrity pass applies the cross-file rules of
+docs/CONTENT_INTEGRITY_RULES.md (unknown skill/enemy/relic/chapter ids, duplicate ids,
+wave ordering, ...). Ids are hashed into indexes in one scan, so every reference is a
+single lookup; violations are reported with their `$.path`. `--no-integrity` skips it.
+
+Pair results are cached in .tmp/validate-schemas/cache.json, keyed by a hash of
+the schema bytes (including every schema it references), sample bytes and this
+script's own source; `--no-cache` skips it.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
 import re
 import sys
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, TextIO, TypeVar
 
 
 ROOT = Path(__file__).resolve().parents[1]
 SCHEMAS_DIR = ROOT / "docs" / "schemas"
 EXAMPLES_DIR = ROOT / "docs" / "examples"
+CACHE_PATH = ROOT / ".tmp" / "validate-schemas" / "cache.json"
+CACHE_VERSION = 1
+
+# Any edit to this file changes the version, so stale results are never reused.
+VALIDATOR_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
 
 PAIRS = [
     ("units.schema.json", "units.sample.json"),
@@ -35,6 +69,35 @@ PAIRS = [
     ("run_history.schema.json", "run_history.sample.json"),
 ]
 
+CORPUS_SCHEMAS = {
+    "run_save": "run_save.schema.json",
+    "run_history": "run_history.schema.json",
+}
+STREAM_SCHEMAS = {schema_name.removesuffix(".schema.json"): schema_name for schema_name, _ in PAIRS}
+CORPUS_CHUNK_SIZE = 256
+
+# Samples larger than this are validated from an event stream instead of a parsed tree.
+STREAM_THRESHOLD_BYTES = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_INLINE_LIMIT = 64 * 1024
+STREAM_LITERALS = (
+    ("true", True),
+    ("false", False),
+    ("null", None),
+    ("NaN", float("nan")),
+    ("Infinity", float("inf")),
+    ("-Infinity", float("-inf")),
+)
+STREAM_LITERAL_LOOKAHEAD = max(len(word) for word, _ in STREAM_LITERALS)
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+T = TypeVar("T")
+
+# Keywords that may sit next to `$ref` without adding any validation of their own.
+REF_ANNOTATIONS = frozenset(
+    {"$ref", "$defs", "definitions", "$id", "$schema", "$comment", "title", "description", "default", "examples"}
+)
+
 
 @dataclass
 class ValidationError:
@@ -42,6 +105,9 @@ class ValidationError:
     message: str
 
 
+Validator = Callable[[Any, str, list[ValidationError]], None]
+
+
 def is_number(value: Any) -> bool:
     return isinstance(value, (int, float)) and not isinstance(value, bool)
 
@@ -67,84 +133,776 @@ def validate_format(value: str, fmt: str) -> bool:
     return True
 
 
-def validate_node(value: Any, schema: dict[str, Any], path: str) -> list[ValidationError]:
-    errors: list[ValidationError] = []
+class PatternRegistry:
+    """
+    Compiled `pattern` keywords shared by every schema and document.
 
-    if "enum" in schema and value not in schema["enum"]:
-        errors.append(ValidationError(path, f"value {value!r} is not in enum"))
-        return errors
+    Patterns are compiled once (usually up front via `preload`) and matched with
+    JSON Schema `search` semantics, so unanchored patterns behave per the spec.
+    """
 
-    expected_type = schema.get("type")
-    if expected_type:
-        if expected_type == "object":
-            if not isinstance(value, dict):
-                errors.append(ValidationError(path, "expected object"))
-                return errors
-        elif expected_type == "array":
-            if not isinstance(value, list):
-                errors.append(ValidationError(path, "expected array"))
-                return errors
-        elif expected_type == "string":
-            if not isinstance(value, str):
-                errors.append(ValidationError(path, "expected string"))
-                return errors
-        elif expected_type == "number":
-            if not is_number(value):
-                errors.append(ValidationError(path, "expected number"))
-                return errors
-        elif expected_type == "integer":
-            if not is_integer(value):
-                errors.append(ValidationError(path, "expected integer"))
-                return errors
-        elif expected_type == "boolean":
-            if not isinstance(value, bool):
-                errors.append(ValidationError(path, "expected boolean"))
-                return errors
-
-    if isinstance(value, str):
-        if "minLength" in schema and len(value) < schema["minLength"]:
-            errors.append(ValidationError(path, f"string length < minLength {schema['minLength']}"))
-        if "pattern" in schema:
-            if not re.match(schema["pattern"], value):
-                errors.append(ValidationError(path, f"string does not match pattern {schema['pattern']!r}"))
-        if "format" in schema and not validate_format(value, schema["format"]):
-            errors.append(ValidationError(path, f"string does not satisfy format {schema['format']}"))
-
-    if is_number(value):
-        if "minimum" in schema and value < schema["minimum"]:
-            errors.append(ValidationError(path, f"value < minimum {schema['minimum']}"))
-        if "maximum" in schema and value > schema["maximum"]:
-            errors.append(ValidationError(path, f"value > maximum {schema['maximum']}"))
-        if "exclusiveMinimum" in schema and value <= schema["exclusiveMinimum"]:
-            errors.append(ValidationError(path, f"value <= exclusiveMinimum {schema['exclusiveMinimum']}"))
-
-    if isinstance(value, list):
-        if "minItems" in schema and len(value) < schema["minItems"]:
-            errors.append(ValidationError(path, f"array length < minItems {schema['minItems']}"))
-        if "maxItems" in schema and len(value) > schema["maxItems"]:
-            errors.append(ValidationError(path, f"array length > maxItems {schema['maxItems']}"))
-        item_schema = schema.get("items")
-        if isinstance(item_schema, dict):
+    def __init__(self) -> None:
+        self._compiled: dict[str, re.Pattern[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def compile(self, pattern: str) -> re.Pattern[str]:
+        compiled = self._compiled.get(pattern)
+        if compiled is None:
+            compiled = re.compile(pattern)
+            self._compiled[pattern] = compiled
+        return compiled
+
+    def collect(self, node: Any, path: str, errors: list[ValidationError]) -> None:
+        if isinstance(node, dict):
+            for key, child in node.items():
+                child_path = f"{path}.{key}"
+                if key == "pattern" and isinstance(child, str):
+                    try:
+                        self.compile(child)
+                    except re.error as error:
+                        errors.append(ValidationError(child_path, f"invalid pattern {child!r}: {error}"))
+                else:
+                    self.collect(child, child_path, errors)
+        elif isinstance(node, list):
+            for idx, child in enumerate(node):
+                self.collect(child, f"{path}[{idx}]", errors)
+
+    def preload(self, schemas: SchemaResolver) -> list[tuple[str, ValidationError]]:
+        problems: list[tuple[str, ValidationError]] = []
+        for schema_path in sorted(schemas.schemas_dir.glob("*.schema.json")):
+            errors: list[ValidationError] = []
+            try:
+                self.collect(schemas.document(schema_path.name), "$", errors)
+            except json.JSONDecodeError as error:
+                errors.append(ValidationError("$", f"invalid JSON: {error}"))
+            problems.extend((schema_path.name, err) for err in errors)
+        return problems
+
+
+PATTERNS = PatternRegistry()
+
+
+TYPE_GUARDS: dict[str, tuple[Callable[[Any], bool], str]] = {
+    "object": (lambda value: isinstance(value, dict), "expected object"),
+    "array": (lambda value: isinstance(value, list), "expected array"),
+    "string": (lambda value: isinstance(value, str), "expected string"),
+    "number": (is_number, "expected number"),
+    "integer": (is_integer, "expected integer"),
+    "boolean": (lambda value: isinstance(value, bool), "expected boolean"),
+}
+
+
+def compile_string_checks(schema: dict[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+        length_message = f"string length < minLength {min_length}"
+
+        def check_min_length(value: str, path: str, errors: list[ValidationError]) -> None:
+            if len(value) < min_length:
+                errors.append(ValidationError(path, length_message))
+
+        checks.append(check_min_length)
+
+    if "pattern" in schema:
+        pattern = schema["pattern"]
+        search = PATTERNS.compile(pattern).search
+        pattern_message = f"string does not match pattern {pattern!r}"
+
+        def check_pattern(value: str, path: str, errors: list[ValidationError]) -> None:
+            if search(value) is None:
+                errors.append(ValidationError(path, pattern_message))
+
+        checks.append(check_pattern)
+
+    if "format" in schema:
+        fmt = schema["format"]
+        format_message = f"string does not satisfy format {fmt}"
+
+        def check_format(value: str, path: str, errors: list[ValidationError]) -> None:
+            if not validate_format(value, fmt):
+                errors.append(ValidationError(path, format_message))
+
+        checks.append(check_format)
+
+    return checks
+
+
+def compile_number_checks(schema: dict[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+        min_message = f"value < minimum {minimum}"
+
+        def check_minimum(value: Any, path: str, errors: list[ValidationError]) -> None:
+            if value < minimum:
+                errors.append(ValidationError(path, min_message))
+
+        checks.append(check_minimum)
+
+    if "maximum" in schema:
+        maximum = schema["maximum"]
+        max_message = f"value > maximum {maximum}"
+
+        def check_maximum(value: Any, path: str, errors: list[ValidationError]) -> None:
+            if value > maximum:
+                errors.append(ValidationError(path, max_message))
+
+        checks.append(check_maximum)
+
+    if "exclusiveMinimum" in schema:
+        exclusive_minimum = schema["exclusiveMinimum"]
+        exclusive_message = f"value <= exclusiveMinimum {exclusive_minimum}"
+
+        def check_exclusive_minimum(value: Any, path: str, errors: list[ValidationError]) -> None:
+            if value <= exclusive_minimum:
+                errors.append(ValidationError(path, exclusive_message))
+
+        checks.append(check_exclusive_minimum)
+
+    return checks
+
+
+def compile_array_checks(schema: dict[str, Any], base: str | None) -> list[Validator]:
+    checks: list[Validator] = []
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+        min_message = f"array length < minItems {min_items}"
+
+        def check_min_items(value: list[Any], path: str, errors: list[ValidationError]) -> None:
+            if len(value) < min_items:
+                errors.append(ValidationError(path, min_message))
+
+        checks.append(check_min_items)
+
+    if "maxItems" in schema:
+        max_items = schema["maxItems"]
+        max_message = f"array length > maxItems {max_items}"
+
+        def check_max_items(value: list[Any], path: str, errors: list[ValidationError]) -> None:
+            if len(value) > max_items:
+                errors.append(ValidationError(path, max_message))
+
+        checks.append(check_max_items)
+
+    item_schema = schema.get("items")
+    if isinstance(item_schema, dict):
+        validate_item = compile_schema(item_schema, base)
+
+        def check_items(value: list[Any], path: str, errors: list[ValidationError]) -> None:
             for idx, item in enumerate(value):
-                errors.extend(validate_node(item, item_schema, f"{path}[{idx}]"))
-
-    if isinstance(value, dict):
-        required = schema.get("required", [])
-        for key in required:
-            if key not in value:
-                errors.append(ValidationError(path, f"missing required key {key!r}"))
-
-        properties = schema.get("properties", {})
-        for key, val in value.items():
-            if key in properties:
-                errors.extend(validate_node(val, properties[key], f"{path}.{key}"))
-            else:
-                additional = schema.get("additionalProperties", True)
-                if additional is False:
+                validate_item(item, f"{path}[{idx}]", errors)
+
+        checks.append(check_items)
+
+    return checks
+
+
+def compile_object_checks(schema: dict[str, Any], base: str | None) -> list[Validator]:
+    checks: list[Validator] = []
+
+    required = tuple(schema.get("required", []))
+    if required:
+        missing_messages = {key: f"missing required key {key!r}" for key in required}
+
+        def check_required(value: dict[str, Any], path: str, errors: list[ValidationError]) -> None:
+            for key in required:
+                if key not in value:
+                    errors.append(ValidationError(path, missing_messages[key]))
+
+        checks.append(check_required)
+
+    property_table = {
+        key: compile_schema(sub_schema, base)
+        for key, sub_schema in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties", True)
+    validate_additional = compile_schema(additional, base) if isinstance(additional, dict) else None
+    reject_additional = additional is False
+
+    if property_table or validate_additional is not None or reject_additional:
+
+        def check_properties(value: dict[str, Any], path: str, errors: list[ValidationError]) -> None:
+            for key, val in value.items():
+                validate_property = property_table.get(key)
+                if validate_property is not None:
+                    validate_property(val, f"{path}.{key}", errors)
+                elif reject_additional:
                     errors.append(ValidationError(path, f"unexpected key {key!r}"))
-                elif isinstance(additional, dict):
-                    errors.extend(validate_node(val, additional, f"{path}.{key}"))
+                elif validate_additional is not None:
+                    validate_additional(val, f"{path}.{key}", errors)
+
+        checks.append(check_properties)
+
+    return checks
+
+
+def compile_schema(schema: dict[str, Any], base: str | None = None) -> Validator:
+    """
+    Compile a schema once into a validator closure.
+
+    Keyword lookups and the type dispatch happen here instead of on every node,
+    so a compiled validator can be reused across any number of documents.
+    `base` is the schema file that relative `$ref`s ("#/...") resolve against.
+    """
+
+    ref_validator = SCHEMAS.resolve(schema["$ref"], base) if "$ref" in schema else None
+    if ref_validator is not None and REF_ANNOTATIONS.issuperset(schema):
+        # A bare reference (plus annotations) is the shared validator itself.
+        return ref_validator
+
+    enum_values = schema["enum"] if "enum" in schema else None
+    type_guard: Callable[[Any], bool] | None = None
+    type_message = ""
+    expected_type = schema.get("type")
+    if expected_type in TYPE_GUARDS:
+        type_guard, type_message = TYPE_GUARDS[expected_type]
+
+    string_checks = compile_string_checks(schema)
+    number_checks = compile_number_checks(schema)
+    array_checks = compile_array_checks(schema, base)
+    object_checks = compile_object_checks(schema, base)
 
+    def validate(value: Any, path: str, errors: list[ValidationError]) -> None:
+        if ref_validator is not None:
+            ref_validator(value, path, errors)
+
+        if enum_values is not None and value not in enum_values:
+            errors.append(ValidationError(path, f"value {value!r} is not in enum"))
+            return
+
+        if type_guard is not None and not type_guard(value):
+            errors.append(ValidationError(path, type_message))
+            return
+
+        if isinstance(value, str):
+            for check in string_checks:
+                check(value, path, errors)
+        elif isinstance(value, list):
+            for check in array_checks:
+                check(value, path, errors)
+        elif isinstance(value, dict):
+            for check in object_checks:
+                check(value, path, errors)
+        elif is_number(value):
+            for check in number_checks:
+                check(value, path, errors)
+
+    return validate
+
+
+class SchemaRefError(Exception):
+    """A `$ref` that points at a missing schema file or JSON pointer."""
+
+
+def iter_refs(node: Any) -> Iterator[str]:
+    if isinstance(node, dict):
+        for key, child in node.items():
+            if key == "$ref" and isinstance(child, str):
+                yield child
+            else:
+                yield from iter_refs(child)
+    elif isinstance(node, list):
+        for child in node:
+            yield from iter_refs(child)
+
+
+class SchemaResolver:
+    """
+    Schema files loaded on first use, plus one compiled validator per `$ref` target.
+
+    Targets are keyed by (file name, JSON pointer); the whole file is the empty pointer.
+    """
+
+    def __init__(self, schemas_dir: Path) -> None:
+        self.schemas_dir = schemas_dir
+        self._documents: dict[str, Any] = {}
+        self._validators: dict[tuple[str, str], Validator] = {}
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def document(self, name: str) -> Any:
+        if name not in self._documents:
+            path = self.schemas_dir / name
+            if not path.is_file():
+                raise SchemaRefError(f"missing schema file {name}")
+            self._documents[name] = parse_json(path)
+        return self._documents[name]
+
+    def lookup(self, name: str, pointer: str) -> dict[str, Any]:
+        node = self.document(name)
+        for token in pointer.split("/")[1:] if pointer else ():
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, dict) and token in node:
+                node = node[token]
+            elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                node = node[int(token)]
+            else:
+                raise SchemaRefError(f"unresolvable $ref {name}#{pointer}")
+        if not isinstance(node, dict):
+            raise SchemaRefError(f"$ref {name}#{pointer} does not point at a schema object")
+        return node
+
+    def validator_for(self, name: str, pointer: str = "") -> Validator:
+        key = (name, pointer)
+        validator = self._validators.get(key)
+        if validator is not None:
+            return validator
+
+        schema = self.lookup(name, pointer)
+        # Register a forwarder first so recursive references resolve to the same target.
+        compiled: list[Validator] = []
+        self._validators[key] = lambda value, path, errors: compiled[0](value, path, errors)
+        try:
+            compiled.append(compile_schema(schema, name))
+        except SchemaRefError:
+            del self._validators[key]
+            raise
+        self._validators[key] = compiled[0]
+        return compiled[0]
+
+    def resolve(self, ref: str, base: str | None) -> Validator:
+        name, _, pointer = ref.partition("#")
+        if not name and base is None:
+            raise SchemaRefError(f"cannot resolve {ref!r} outside a schema file")
+        return self.validator_for(name or base, pointer)
+
+    def referenced_files(self, name: str) -> list[str]:
+        """`name` plus every schema file reachable from it through `$ref`, sorted."""
+
+        seen = {name}
+        pending = [name]
+        while pending:
+            for ref in iter_refs(self.document(pending.pop())):
+                target = ref.partition("#")[0]
+                if target and target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+        return sorted(seen)
+
+
+SCHEMAS = SchemaResolver(SCHEMAS_DIR)
+
+
+class StreamSyntaxError(ValueError):
+    """Malformed JSON met while reading an event stream."""
+
+
+class JsonEventReader:
+    """
+    Pull-parse JSON text into events without building the document.
+
+    Events are ("start_map" | "end_map" | "start_array" | "end_array", None),
+    ("map_key", key) and ("value", value). A container that is complete within
+    `inline_limit` characters of the read buffer is decoded in one call and
+    delivered as a single "value"; larger ones are streamed member by member.
+    Memory is bounded by the read buffer plus one flag per open container.
+    """
+
+    def __init__(
+        self, stream: TextIO, chunk_size: int = STREAM_CHUNK_SIZE, inline_limit: int = STREAM_INLINE_LIMIT
+    ) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._inline_limit = inline_limit
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str, pos: int | None = None) -> StreamSyntaxError:
+        return StreamSyntaxError(f"{message}: char {self._offset + (self._pos if pos is None else pos)}")
+
+    def _next_char(self) -> str | None:
+        while True:
+            self._pos = WHITESPACE_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return None
+
+    def _read_string(self) -> str:
+        while True:
+            try:
+                value, end = scanstring(self._buf, self._pos + 1)
+            except json.JSONDecodeError as error:
+                # The string (or an escape in it) may simply continue in the next chunk.
+                truncated = error.msg.startswith("Unterminated") or error.pos >= len(self._buf) - 6
+                if truncated and self._fill():
+                    continue
+                raise self._error(error.msg, error.pos) from None
+            self._pos = end
+            return value
+
+    def _read_scalar(self) -> Any:
+        while len(self._buf) - self._pos < STREAM_LITERAL_LOOKAHEAD and self._fill():
+            pass
+        for word, value in STREAM_LITERALS:
+            if self._buf.startswith(word, self._pos):
+                self._pos += len(word)
+                return value
+        while True:
+            match = NUMBER_RE.match(self._buf, self._pos)
+            if match is None:
+                raise self._error("Expecting value")
+            if match.end() < len(self._buf) or not self._fill():
+                break
+        integer, frac, exp = match.groups()
+        self._pos = match.end()
+        if frac or exp:
+            return float(integer + (frac or "") + (exp or ""))
+        return int(integer)
+
+    def _read_inline(self) -> tuple[bool, Any]:
+        if self._inline_limit <= 0:
+            return False, None
+        while len(self._buf) - self._pos < self._inline_limit and self._fill():
+            pass
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except (json.JSONDecodeError, RecursionError):
+            # Too large for the buffer, too deep, or malformed: stream it (and report errors) instead.
+            return False, None
+        self._pos = end
+        return True, value
+
+    def events(self) -> Iterator[tuple[str, Any]]:
+        open_maps: list[bool] = []
+        state = "value"
+        while True:
+            char = self._next_char()
+            if char is None:
+                if state == "done":
+                    return
+                raise self._error("Unexpected end of document")
+
+            if state == "done":
+                raise self._error("Extra data")
+
+            if state == "colon":
+                if char != ":":
+                    raise self._error("Expecting ':' delimiter")
+                self._pos += 1
+                state = "value"
+                continue
+
+            if state in ("key", "key_or_end"):
+                if char == "}" and state == "key_or_end":
+                    self._pos += 1
+                    open_maps.pop()
+                    yield "end_map", None
+                    state = "comma_or_end" if open_maps else "done"
+                elif char == '"':
+                    yield "map_key", self._read_string()
+                    state = "colon"
+                else:
+                    raise self._error("Expecting property name enclosed in double quotes")
+                continue
+
+            if state == "comma_or_end":
+                in_map = open_maps[-1]
+                if char == ",":
+                    self._pos += 1
+                    state = "key" if in_map else "value"
+                elif char == ("}" if in_map else "]"):
+                    self._pos += 1
+                    open_maps.pop()
+                    yield ("end_map" if in_map else "end_array"), None
+                    state = "comma_or_end" if open_maps else "done"
+                else:
+                    raise self._error("Expecting ',' delimiter")
+                continue
+
+            # state is "value" or "value_or_end" (right after '[')
+            inline, value = self._read_inline() if char in "{[" else (False, None)
+            if inline:
+                yield "value", value
+            elif char == "]" and state == "value_or_end":
+                self._pos += 1
+                open_maps.pop()
+                yield "end_array", None
+            elif char == "{":
+                self._pos += 1
+                open_maps.append(True)
+                yield "start_map", None
+                state = "key_or_end"
+                continue
+            elif char == "[":
+                self._pos += 1
+                open_maps.append(False)
+                yield "start_array", None
+                state = "value_or_end"
+                continue
+            else:
+                yield "value", self._read_string() if char == '"' else self._read_scalar()
+            state = "comma_or_end" if open_maps else "done"
+
+
+def build_value(first_event: str, events: Iterator[tuple[str, Any]]) -> Any:
+    """Materialize the container that `first_event` opened from the rest of its events."""
+
+    root: Any = {} if first_event == "start_map" else []
+    stack: list[Any] = [root]
+    key = ""
+    for event, value in events:
+        if event == "map_key":
+            key = value
+            continue
+        if event in ("end_map", "end_array"):
+            stack.pop()
+            if not stack:
+                return root
+            continue
+        node = {} if event == "start_map" else [] if event == "start_array" else value
+        parent = stack[-1]
+        if isinstance(parent, dict):
+            parent[key] = node
+        else:
+            parent.append(node)
+        if event in ("start_map", "start_array"):
+            stack.append(node)
+    raise StreamSyntaxError("Unexpected end of document")
+
+
+@dataclass
+class StreamLayer:
+    """The container keywords of one schema object; a `$ref` contributes the target's layers first."""
+
+    base: str | None
+    has_enum: bool
+    expected_type: Any
+    required: tuple[str, ...]
+    properties: dict[str, Any]
+    additional: Any
+    items: Any
+    min_items: Any
+    max_items: Any
+
+    def type_error(self, kind: str) -> str | None:
+        if self.expected_type in TYPE_GUARDS and self.expected_type != kind:
+            return TYPE_GUARDS[self.expected_type][1]
+        return None
+
+    def child(self, key: str, path: str, errors: list[ValidationError]) -> StreamSchema | None:
+        child_schema = self.properties.get(key)
+        if child_schema is None:
+            if self.additional is False:
+                errors.append(ValidationError(path, f"unexpected key {key!r}"))
+                return None
+            child_schema = self.additional if isinstance(self.additional, dict) else None
+        return stream_schema(child_schema, self.base) if child_schema is not None else None
+
+    def item(self) -> StreamSchema | None:
+        return stream_schema(self.items, self.base) if isinstance(self.items, dict) else None
+
+    def close_errors(self, path: str, is_object: bool, count: int, seen: set[str]) -> list[ValidationError]:
+        if is_object:
+            return [ValidationError(path, f"missing required key {key!r}") for key in self.required if key not in seen]
+        errors = []
+        if self.min_items is not None and count < self.min_items:
+            errors.append(ValidationError(path, f"array length < minItems {self.min_items}"))
+        if self.max_items is not None and count > self.max_items:
+            errors.append(ValidationError(path, f"array length > maxItems {self.max_items}"))
+        return errors
+
+
+class StreamSchema:
+    """
+    A schema object as seen by the event-driven validator.
+
+    Scalars go through the regular compiled validator; containers are checked
+    layer by layer as their members arrive.
+    """
+
+    def __init__(self, schema: dict[str, Any], base: str | None) -> None:
+        self.schema = schema
+        self.base = base
+        self.layers: tuple[StreamLayer, ...] = ()
+        self._validator: Validator | None = None
+
+    @property
+    def validator(self) -> Validator:
+        if self._validator is None:
+            self._validator = compile_schema(self.schema, self.base)
+        return self._validator
+
+    @property
+    def has_enum(self) -> bool:
+        return any(layer.has_enum for layer in self.layers)
+
+
+_STREAM_SCHEMAS: dict[int, StreamSchema] = {}
+
+
+def stream_schema(schema: dict[str, Any], base: str | None) -> StreamSchema:
+    cached = _STREAM_SCHEMAS.get(id(schema))
+    if cached is not None:
+        return cached
+
+    node = StreamSchema(schema, base)
+    _STREAM_SCHEMAS[id(schema)] = node
+    layers: tuple[StreamLayer, ...] = ()
+    if "$ref" in schema:
+        name, _, pointer = schema["$ref"].partition("#")
+        if not name and base is None:
+            raise SchemaRefError(f"cannot resolve {schema['$ref']!r} outside a schema file")
+        target = stream_schema(SCHEMAS.lookup(name or base, pointer), name or base)
+        if not target.layers:
+            # Only a reference still being expanded has no layers yet.
+            raise SchemaRefError(f"$ref {schema['$ref']!r} never reaches a schema")
+        layers = target.layers
+    if "$ref" not in schema or not REF_ANNOTATIONS.issuperset(schema):
+        additional = schema.get("additionalProperties", True)
+        layers += (
+            StreamLayer(
+                base=base,
+                has_enum="enum" in schema,
+                expected_type=schema.get("type"),
+                required=tuple(schema.get("required", [])),
+                properties=schema.get("properties", {}),
+                additional=additional,
+                items=schema.get("items"),
+                min_items=schema.get("minItems"),
+                max_items=schema.get("maxItems"),
+            ),
+        )
+    node.layers = layers
+    return node
+
+
+@dataclass
+class LayerCheck:
+    layer: StreamLayer
+    sink: list[ValidationError]
+    active: bool
+    buffer: list[ValidationError]
+    seen: set[str]
+
+
+@dataclass
+class StreamFrame:
+    path: str
+    is_object: bool
+    checks: list[LayerCheck]
+    count: int = 0
+    child_path: str = ""
+    child_contexts: list[tuple[StreamSchema, list[ValidationError]]] | None = None
+
+
+def open_frame(
+    path: str, is_object: bool, contexts: list[tuple[StreamSchema, list[ValidationError]]]
+) -> StreamFrame:
+    kind = "object" if is_object else "array"
+    checks = []
+    for node, sink in contexts:
+        for layer in node.layers:
+            type_error = layer.type_error(kind)
+            buffer = [ValidationError(path, type_error)] if type_error else []
+            checks.append(LayerCheck(layer, sink, type_error is None, buffer, set()))
+    return StreamFrame(path, is_object, checks)
+
+
+def close_frame(frame: StreamFrame) -> None:
+    for check in frame.checks:
+        if check.active:
+            check.sink.extend(check.layer.close_errors(frame.path, frame.is_object, frame.count, check.seen))
+        check.sink.extend(check.buffer)
+
+
+def member_contexts(
+    frame: StreamFrame, key: str | None
+) -> tuple[str, list[tuple[StreamSchema, list[ValidationError]]]]:
+    if not frame.checks:
+        return "", []
+    path = f"{frame.path}.{key}" if frame.is_object else f"{frame.path}[{frame.count}]"
+    contexts = []
+    for check in frame.checks:
+        if not check.active:
+            continue
+        if frame.is_object:
+            if key in check.layer.required:
+                check.seen.add(key)
+            child = check.layer.child(key, frame.path, check.buffer)
+        else:
+            child = check.layer.item()
+        if child is not None:
+            contexts.append((child, check.buffer))
+    return path, contexts
+
+
+def validate_events(events: Iterator[tuple[str, Any]], root: StreamSchema) -> list[ValidationError]:
+    """
+    Validate a document from its event stream with the same errors as the compiled validator.
+
+    Memory is one frame per open container. Each schema layer buffers its members'
+    errors until the container closes, so the reported order matches the tree walk.
+    Containers under an `enum` are the exception: they are materialized and checked whole.
+    """
+
+    errors: list[ValidationError] = []
+    frames: list[StreamFrame] = []
+    for event, value in events:
+        if event == "map_key":
+            frame = frames[-1]
+            frame.child_path, frame.child_contexts = member_contexts(frame, value)
+            continue
+        if event in ("end_map", "end_array"):
+            close_frame(frames.pop())
+            continue
+
+        if not frames:
+            path, contexts = "$", [(root, errors)]
+        elif frames[-1].is_object:
+            path, contexts = frames[-1].child_path, frames[-1].child_contexts or []
+        else:
+            path, contexts = member_contexts(frames[-1], None)
+            frames[-1].count += 1
+
+        if event == "value":
+            for node, sink in contexts:
+                node.validator(value, path, sink)
+        elif any(node.has_enum for node, _ in contexts):
+            document = build_value(event, events)
+            for node, sink in contexts:
+                node.validator(document, path, sink)
+        else:
+            frames.append(open_frame(path, event == "start_map", contexts))
+    return errors
+
+
+def validate_stream(stream: TextIO, schema_name: str) -> list[ValidationError]:
+    try:
+        root = stream_schema(SCHEMAS.lookup(schema_name, ""), schema_name)
+    except SchemaRefError as error:
+        return [ValidationError("$", str(error))]
+    try:
+        return validate_events(JsonEventReader(stream).events(), root)
+    except StreamSyntaxError as error:
+        return [ValidationError("$", f"invalid JSON: {error}")]
+
+
+def validate_node(value: Any, schema: dict[str, Any], path: str) -> list[ValidationError]:
+    errors: list[ValidationError] = []
+    compile_schema(schema)(value, path, errors)
     return errors
 
 
@@ -160,30 +918,687 @@ def validate_pair(schema_name: str, sample_name: str) -> tuple[bool, list[Valida
     if missing:
         return False, [ValidationError("$", f"missing file(s): {', '.join(missing)}")]
 
-    schema = parse_json(schema_path)
+    if sample_path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        with sample_path.open("r", encoding="utf-8") as stream:
+            errors = validate_stream(stream, schema_name)
+        return len(errors) == 0, errors
+
+    try:
+        validator = SCHEMAS.validator_for(schema_name)
+    except SchemaRefError as error:
+        return False, [ValidationError("$", str(error))]
     sample = parse_json(sample_path)
-    errors = validate_node(sample, schema, "$")
+    errors: list[ValidationError] = []
+    validator(sample, "$", errors)
     return len(errors) == 0, errors
 
 
-def main() -> int:
+def iter_pair_results(
+    pairs: list[tuple[str, str]], jobs: int
+) -> Iterator[tuple[bool, list[ValidationError]]]:
+    if jobs <= 1 or len(pairs) <= 1:
+        for schema_name, sample_name in pairs:
+            yield validate_pair(schema_name, sample_name)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(pairs))) as executor:
+        yield from executor.map(validate_pair, *zip(*pairs))
+
+
+def pair_cache_key(schema_name: str, sample_name: str) -> str | None:
+    schema_path = SCHEMAS_DIR / schema_name
+    sample_path = EXAMPLES_DIR / sample_name
+    if not schema_path.exists() or not sample_path.exists():
+        return None
+    try:
+        schema_files = SCHEMAS.referenced_files(schema_name)
+    except (SchemaRefError, json.JSONDecodeError):
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(VALIDATOR_VERSION.encode("utf-8"))
+    for path in (*(SCHEMAS_DIR / name for name in schema_files), sample_path):
+        content = path.read_bytes()
+        digest.update(b"\0" + str(len(content)).encode("ascii") + b"\0")
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def load_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        parsed = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(parsed, dict) or parsed.get("version") != CACHE_VERSION:
+        return {}
+    entries = parsed.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(cache_path: Path, entries: dict[str, Any]) -> None:
+    payload = {"version": CACHE_VERSION, "entries": entries}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        temp_path.replace(cache_path)
+    except OSError as error:
+        print(f"[WARN] could not write validation cache {cache_path}: {error}")
+
+
+def cache_entry(ok: bool, errors: list[ValidationError]) -> dict[str, Any]:
+    return {"ok": ok, "errors": [{"path": err.path, "message": err.message} for err in errors]}
+
+
+def read_cache_entry(entry: Any) -> tuple[bool, list[ValidationError]] | None:
+    if not isinstance(entry, dict) or not isinstance(entry.get("ok"), bool):
+        return None
+    errors = entry.get("errors")
+    if not isinstance(errors, list):
+        return None
+    return entry["ok"], [ValidationError(str(err.get("path")), str(err.get("message"))) for err in errors]
+
+
+def iter_jsonl_documents(stream: TextIO, source_name: str) -> Iterator[tuple[str, str]]:
+    for line_no, line in enumerate(stream, start=1):
+        if line.strip():
+            yield f"{source_name}:{line_no}", line
+
+
+def iter_corpus_documents(corpus: str) -> Iterator[tuple[str, str]]:
+    """Yield (label, raw JSON text) pairs one document at a time."""
+
+    if corpus == "-":
+        yield from iter_jsonl_documents(sys.stdin, "<stdin>")
+        return
+
+    corpus_path = Path(corpus)
+    if corpus_path.is_dir():
+        for document_path in sorted(corpus_path.rglob("*.json")):
+            yield document_path.relative_to(corpus_path).as_posix(), document_path.read_text(encoding="utf-8")
+        return
+
+    with corpus_path.open("r", encoding="utf-8") as stream:
+        yield from iter_jsonl_documents(stream, corpus_path.name)
+
+
+def validate_document_text(validator: Validator, text: str) -> list[ValidationError]:
+    try:
+        document = json.loads(text)
+    except json.JSONDecodeError as error:
+        return [ValidationError("$", f"invalid JSON: {error}")]
+
+    errors: list[ValidationError] = []
+    validator(document, "$", errors)
+    return errors
+
+
+def validate_corpus_chunk(
+    schema_name: str, chunk: list[tuple[str, str]]
+) -> list[tuple[str, list[ValidationError]]]:
+    validator = SCHEMAS.validator_for(schema_name)
+    return [(label, validate_document_text(validator, text)) for label, text in chunk]
+
+
+def iter_chunks(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ordered_pool_map(
+    executor: Executor, fn: Callable[..., T], arg_tuples: Iterable[tuple[Any, ...]], max_pending: int
+) -> Iterator[T]:
+    """
+    Like Executor.map, but submits lazily so at most `max_pending` tasks are in flight.
+
+    Results are yielded in submission order, which keeps output deterministic.
+    """
+
+    pending: deque[Future[T]] = deque()
+    for args in arg_tuples:
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def print_result(label: str, errors: list[ValidationError]) -> None:
+    if not errors:
+        print(f"[OK]   {label}")
+        return
+    print(f"[FAIL] {label}")
+    for err in errors:
+        print(f"       - {err.path}: {err.message}")
+
+
+def iter_corpus_results(corpus: str, schema_name: str, jobs: int) -> Iterator[tuple[str, list[ValidationError]]]:
+    if jobs <= 1:
+        validator = SCHEMAS.validator_for(schema_name)
+        for label, text in iter_corpus_documents(corpus):
+            yield label, validate_document_text(validator, text)
+        return
+
+    chunks = ((schema_name, chunk) for chunk in iter_chunks(iter_corpus_documents(corpus), CORPUS_CHUNK_SIZE))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for chunk_results in ordered_pool_map(executor, validate_corpus_chunk, chunks, jobs * 2):
+            yield from chunk_results
+
+
+def validate_corpus(corpus: str, schema_key: str, jobs: int = 1) -> int:
+    schema_name = CORPUS_SCHEMAS[schema_key]
+    if corpus != "-" and not Path(corpus).exists():
+        print(f"[FAIL] corpus {corpus} (missing file or directory)")
+        return 1
+    try:
+        SCHEMAS.validator_for(schema_name)
+    except SchemaRefError as error:
+        print(f"[FAIL] {schema_name}: {error}")
+        return 1
+
+    total = 0
+    failed = 0
+
+    print(f"Validating {schema_key} corpus {corpus} against {schema_name}...")
+    for label, errors in iter_corpus_results(corpus, schema_name, jobs):
+        total += 1
+        if errors:
+            failed += 1
+        print_result(label, errors)
+
+    print(f"\nCorpus summary: {total} document(s), {total - failed} passed, {failed} failed")
+    if total == 0:
+        print("Validation failed: corpus contains no documents")
+        return 1
+    if failed:
+        print(f"Validation failed: {failed}/{total} document(s)")
+        return 1
+
+    print("Validation passed: all documents are valid")
+    return 0
+
+
+@dataclass
+class IntegrityIssue:
+    level: str
+    rule_id: str
+    file: str
+    path: str
+    message: str
+    hint: str
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Ids collected from one sample; `unique` indexes report duplicates as IR-002."""
+
+    name: str
+    sample: str
+    pattern: str
+    label: str
+    unique: bool = True
+
+
+@dataclass(frozen=True)
+class ReferenceSpec:
+    rule_id: str
+    sample: str
+    pattern: str
+    index: str
+    level: str = "error"
+
+
+INDEX_SPECS = (
+    IndexSpec("units", "units.sample.json", "units[].id", "unit id"),
+    IndexSpec("unitTags", "units.sample.json", "units[].tags[]", "unit tag", unique=False),
+    IndexSpec("skills", "skills.sample.json", "skills[].id", "skill id"),
+    IndexSpec("synergies", "synergies.sample.json", "synergies[].id", "synergy id"),
+    IndexSpec("enemies", "enemies.sample.json", "enemies[].id", "enemy id"),
+    IndexSpec("relics", "relics.sample.json", "relics[].id", "relic id"),
+    IndexSpec("chapters", "chapter_presets.sample.json", "chapters.*", "chapter id"),
+)
+
+REFERENCE_SPECS = (
+    ReferenceSpec("IR-003", "units.sample.json", "units[].skillIds[]", "skills"),
+    ReferenceSpec("IR-004", "waves.sample.json", "waves[].spawns[].enemyId", "enemies"),
+    ReferenceSpec("IR-005", "skills.sample.json", "skills[].effects[].statusId", "statuses"),
+    ReferenceSpec("IR-006", "synergies.sample.json", "synergies[].thresholds[].effects[].statusId", "statuses"),
+    ReferenceSpec("IR-010", "relics.sample.json", "relics[].effects[].tag", "unitTags", level="warn"),
+    ReferenceSpec("IR-013", "enemies.sample.json", "enemies[].chapterId", "chapters", level="warn"),
+    ReferenceSpec("IR-013", "waves.sample.json", "waves[].chapterId", "chapters", level="warn"),
+    ReferenceSpec("IR-013", "economy.sample.json", "chapters.*", "chapters", level="warn"),
+    ReferenceSpec("IR-013", "chapter_presets.sample.json", "defaultChapterId", "chapters", level="warn"),
+    ReferenceSpec("IR-013", "profile.sample.json", "unlockedContent.chapters[]", "chapters", level="warn"),
+    ReferenceSpec("IR-013", "run_save.sample.json", "chapterId", "chapters", level="warn"),
+    ReferenceSpec("IR-013", "run_history.sample.json", "entries[].chapterId", "chapters", level="warn"),
+    ReferenceSpec("IR-014", "profile.sample.json", "unlockedContent.units[]", "units", level="warn"),
+    ReferenceSpec("IR-014", "profile.sample.json", "unlockedContent.relics[]", "relics", level="warn"),
+    ReferenceSpec("IR-014", "run_save.sample.json", "boardUnits[].unitId", "units", level="warn"),
+    ReferenceSpec("IR-014", "run_save.sample.json", "benchUnits[].unitId", "units", level="warn"),
+    ReferenceSpec("IR-014", "run_save.sample.json", "relics[]", "relics", level="warn"),
+    ReferenceSpec("IR-014", "run_save.sample.json", "activeSynergies[].synergyId", "synergies", level="warn"),
+    ReferenceSpec("IR-014", "run_history.sample.json", "entries[].highestDpsUnitId", "units", level="warn"),
+)
+
+# Status ids accepted by IR-005/IR-006 are the keys of STATUS_REGISTRY in this module.
+STATUS_SOURCE = "src/game/combat/statusRegistry.js"
+STATUS_REGISTRY_RE = re.compile(r"^const STATUS_REGISTRY = Object\.freeze\(\{\n(.*?)^\}\);", re.M | re.S)
+STATUS_ENTRY_RE = re.compile(r"^  ([A-Za-z_$][\w$]*): Object\.freeze\(", re.M)
+
+# Game content samples (as opposed to save samples); each needs a root `version` (IR-001).
+CONTENT_SAMPLES = (
+    "units.sample.json",
+    "skills.sample.json",
+    "synergies.sample.json",
+    "enemies.sample.json",
+    "waves.sample.json",
+    "relics.sample.json",
+    "economy.sample.json",
+    "chapter_presets.sample.json",
+)
+
+TIER_CHANCE_TOLERANCE = 1e-6
+
+PATTERN_STEP_RE = re.compile(r"\[\]|\{\}|[^.\[\]{}]+")
+
+
+def iter_pattern(node: Any, pattern: str, path: str = "$") -> Iterator[tuple[str, Any]]:
+    """
+    Yield (json path, value) for every node matched by `pattern`.
+
+    Steps are separated by dots: a key, `[]` (each array item), `{}` (each member value)
+    or `*` (each member name, yielded as the value).
+    """
+    matches: list[tuple[str, Any]] = [(path, node)]
+    for step in PATTERN_STEP_RE.findall(pattern):
+        next_matches: list[tuple[str, Any]] = []
+        for match_path, value in matches:
+            if step == "[]":
+                if isinstance(value, list):
+                    next_matches.extend((f"{match_path}[{idx}]", item) for idx, item in enumerate(value))
+            elif step in ("{}", "*"):
+                if isinstance(value, dict):
+                    next_matches.extend(
+                        (f"{match_path}.{key}", key if step == "*" else item) for key, item in value.items()
+                    )
+            elif isinstance(value, dict) and step in value:
+                next_matches.append((f"{match_path}.{step}", value[step]))
+        matches = next_matches
+    yield from matches
+
+
+def load_integrity_documents() -> dict[str, Any]:
+    """Parse every pair sample; missing or unparsable ones are left out (the schema pass reports them)."""
+
+    documents: dict[str, Any] = {}
+    for _, sample_name in PAIRS:
+        try:
+            documents[sample_name] = parse_json(EXAMPLES_DIR / sample_name)
+        except (OSError, json.JSONDecodeError):
+            continue
+    return documents
+
+
+def load_status_ids(path: Path = ROOT / STATUS_SOURCE) -> tuple[str, ...]:
+    """Top-level keys of STATUS_REGISTRY, read from the registry source; empty if it cannot be found."""
+
+    try:
+        match = STATUS_REGISTRY_RE.search(path.read_text(encoding="utf-8"))
+    except OSError:
+        return ()
+    return tuple(STATUS_ENTRY_RE.findall(match.group(1))) if match else ()
+
+
+def build_indexes(documents: dict[str, Any], issues: list[IntegrityIssue]) -> dict[str, dict[Any, str]]:
+    """Hash every indexed id to the path that defines it, in one scan per sample."""
+
+    status_ids = load_status_ids()
+    if not status_ids:
+        issues.append(
+            IntegrityIssue(
+                "error",
+                "IR-005",
+                STATUS_SOURCE,
+                "STATUS_REGISTRY",
+                "Could not read any status ids from STATUS_REGISTRY",
+                "Keep STATUS_REGISTRY as `const STATUS_REGISTRY = Object.freeze({` with one `<id>: Object.freeze({` entry per status.",
+            )
+        )
+    indexes: dict[str, dict[Any, str]] = {"statuses": {status: STATUS_SOURCE for status in status_ids}}
+    for spec in INDEX_SPECS:
+        if spec.sample not in documents:
+            continue
+        index = indexes.setdefault(spec.name, {})
+        for path, value in iter_pattern(documents[spec.sample], spec.pattern):
+            if not isinstance(value, str):
+                continue
+            if spec.unique and value in index:
+                issues.append(
+                    IntegrityIssue(
+                        "error",
+                        "IR-002",
+                        spec.sample,
+                        path,
+                        f"Duplicate {spec.label}: {value} (first defined at {index[value]})",
+                        "Rename or remove one of the duplicate definitions.",
+                    )
+                )
+                continue
+            index.setdefault(value, path)
+    return indexes
+
+
+def resolve_references(
+    documents: dict[str, Any], indexes: dict[str, dict[Any, str]], issues: list[IntegrityIssue]
+) -> int:
+    labels = {spec.name: (spec.label, spec.sample) for spec in INDEX_SPECS}
+    labels["statuses"] = ("status id", STATUS_SOURCE)
+
+    resolved = 0
+    for spec in REFERENCE_SPECS:
+        index = indexes.get(spec.index)
+        if spec.sample not in documents or index is None:
+            continue
+        label, source = labels[spec.index]
+        for path, value in iter_pattern(documents[spec.sample], spec.pattern):
+            if not isinstance(value, str):
+                continue
+            resolved += 1
+            if value not in index:
+                issues.append(
+                    IntegrityIssue(
+                        spec.level,
+                        spec.rule_id,
+                        spec.sample,
+                        path,
+                        f"Unknown {label}: {value}",
+                        f"Add {value} to {source} or remove the reference.",
+                    )
+                )
+    return resolved
+
+
+def check_content_versions(documents: dict[str, Any], issues: list[IntegrityIssue]) -> None:
+    for sample_name in CONTENT_SAMPLES:
+        document = documents.get(sample_name)
+        if isinstance(document, dict) and not document.get("version"):
+            issues.append(
+                IntegrityIssue(
+                    "error", "IR-001", sample_name, "$", "Missing content version", "Add a root `version` string."
+                )
+            )
+
+
+def check_tier_chances(documents: dict[str, Any], issues: list[IntegrityIssue]) -> None:
+    document = documents.get("economy.sample.json")
+    if document is None:
+        return
+    for pattern in ("runEconomy.tierChancesByWave[].chances", "chapters.{}.tierChancesByWave[].chances"):
+        for path, chances in iter_pattern(document, pattern):
+            if not isinstance(chances, dict) or not all(is_number(value) for value in chances.values()):
+                continue
+            total = sum(chances.values())
+            if abs(total - 1.0) > TIER_CHANCE_TOLERANCE:
+                issues.append(
+                    IntegrityIssue(
+                        "error",
+                        "IR-007",
+                        "economy.sample.json",
+                        path,
+                        f"Tier chances sum to {total:.6g}, expected 1.0",
+                        "Rebalance the tier chances so they add up to 1.0.",
+                    )
+                )
+
+
+def check_waves(documents: dict[str, Any], enemy_chapters: dict[str, str], issues: list[IntegrityIssue]) -> None:
+    """IR-008 (wave order per chapter), IR-009 (reward choices) and IR-011 (spawn enemy chapter)."""
+
+    sample_name = "waves.sample.json"
+    last_wave: dict[str, int] = {}
+    for path, wave in iter_pattern(documents.get(sample_name), "waves[]"):
+        if not isinstance(wave, dict):
+            continue
+        # Non-string ids already failed the schema pass; the chapter-scoped rules skip them.
+        chapter_id = wave.get("chapterId")
+        chapter_id = chapter_id if isinstance(chapter_id, str) else None
+        wave_number = wave.get("waveNumber")
+        if chapter_id is not None and is_integer(wave_number):
+            previous = last_wave.get(chapter_id)
+            if previous is not None and wave_number <= previous:
+                issues.append(
+                    IntegrityIssue(
+                        "error",
+                        "IR-008",
+                        sample_name,
+                        f"{path}.waveNumber",
+                        f"waveNumber {wave_number} of {chapter_id} is not greater than the previous wave {previous}",
+                        "List each chapter's waves in ascending waveNumber order without duplicates.",
+                    )
+                )
+            last_wave[chapter_id] = wave_number if previous is None else max(previous, wave_number)
+
+        reward = wave.get("reward")
+        if isinstance(reward, dict) and "choices" in reward and reward.get("type") != "RelicChoice":
+            issues.append(
+                IntegrityIssue(
+                    "error",
+                    "IR-009",
+                    sample_name,
+                    f"{path}.reward.choices",
+                    f"choices is only valid for RelicChoice rewards (type={reward.get('type')})",
+                    "Remove choices or change the reward type to RelicChoice.",
+                )
+            )
+
+        for spawn_path, enemy_id in iter_pattern(wave, "spawns[].enemyId", path):
+            if chapter_id is None or not isinstance(enemy_id, str):
+                continue
+            enemy_chapter = enemy_chapters.get(enemy_id)
+            if enemy_chapter is not None and enemy_chapter != chapter_id:
+                issues.append(
+                    IntegrityIssue(
+                        "warn",
+                        "IR-011",
+                        sample_name,
+                        spawn_path,
+                        f"Enemy {enemy_id} belongs to {enemy_chapter}, not {chapter_id}",
+                        f"Spawn a {chapter_id} enemy or move {enemy_id} to {chapter_id}.",
+                    )
+                )
+
+
+def check_preset_spawns(documents: dict[str, Any], issues: list[IntegrityIssue]) -> int:
+    """IR-012: preset spawn events must name an enemy in the same preset's enemyCatalog."""
+
+    sample_name = "chapter_presets.sample.json"
+    resolved = 0
+    for path, simulation in iter_pattern(documents.get(sample_name), "chapters.{}.simulation"):
+        if not isinstance(simulation, dict):
+            continue
+        catalog = simulation.get("enemyCatalog")
+        catalog = catalog if isinstance(catalog, dict) else {}
+        for spawn_path, enemy_id in iter_pattern(simulation, "spawnEvents[].enemyId", path):
+            if not isinstance(enemy_id, str):
+                continue
+            resolved += 1
+            if enemy_id not in catalog:
+                issues.append(
+                    IntegrityIssue(
+                        "warn",
+                        "IR-012",
+                        sample_name,
+                        spawn_path,
+                        f"Unknown preset enemy id: {enemy_id}",
+                        f"Add {enemy_id} to {path}.enemyCatalog or remove the spawn event.",
+                    )
+                )
+    return resolved
+
+
+def check_integrity(documents: dict[str, Any]) -> tuple[list[IntegrityIssue], int, int]:
+    """
+    Run the cross-file rules of docs/CONTENT_INTEGRITY_RULES.md over parsed samples.
+
+    Ids are hashed into per-kind indexes first, then every reference is a single
+    lookup, so the pass stays linear in the size of the content.
+    Returns (issues, references checked, ids indexed).
+    """
+
+    issues: list[IntegrityIssue] = []
+    check_content_versions(documents, issues)
+    indexes = build_indexes(documents, issues)
+    resolved = resolve_references(documents, indexes, issues)
+    resolved += check_preset_spawns(documents, issues)
+    check_tier_chances(documents, issues)
+
+    enemy_chapters = {
+        enemy.get("id"): enemy.get("chapterId")
+        for _, enemy in iter_pattern(documents.get("enemies.sample.json"), "enemies[]")
+        if isinstance(enemy, dict) and isinstance(enemy.get("id"), str) and isinstance(enemy.get("chapterId"), str)
+    }
+    check_waves(documents, enemy_chapters, issues)
+    issues.sort(key=lambda issue: issue.rule_id)
+
+    indexed = sum(len(index) for name, index in indexes.items() if name != "statuses")
+    return issues, resolved, indexed
+
+
+def print_integrity_result(issues: list[IntegrityIssue], resolved: int, indexed: int) -> None:
+    marker = "[FAIL]" if any(issue.level == "error" for issue in issues) else "[OK]  "
+    print(f"{marker} content integrity ({resolved} reference(s) against {indexed} indexed id(s))")
+    for issue in issues:
+        print(f"       - {issue.rule_id} {issue.level} {issue.file} {issue.path}: {issue.message}")
+        print(f"         hint: {issue.hint}")
+
+
+def validate_stream_document(document: str, schema_key: str) -> int:
+    schema_name = STREAM_SCHEMAS[schema_key]
+    if document != "-" and not Path(document).is_file():
+        print(f"[FAIL] {document} (missing file)")
+        return 1
+
+    print(f"Streaming {document} against {schema_name}...")
+    if document == "-":
+        errors = validate_stream(sys.stdin, schema_name)
+    else:
+        with open(document, "r", encoding="utf-8") as stream:
+            errors = validate_stream(stream, schema_name)
+    print_result(f"{schema_name} <= {document}", errors)
+
+    if errors:
+        print(f"\nValidation failed: {len(errors)} error(s)")
+        return 1
+    print("\nValidation passed: document is valid")
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate sample payloads (or a save corpus) against repo schemas.")
+    parser.add_argument(
+        "--corpus",
+        help="Directory of *.json documents or a JSON Lines file ('-' reads JSON Lines from stdin).",
+    )
+    parser.add_argument(
+        "--stream",
+        help="Validate one (possibly very large) JSON document from an event stream ('-' reads stdin).",
+    )
+    parser.add_argument(
+        "--schema",
+        choices=sorted(STREAM_SCHEMAS),
+        help="Schema used for --corpus documents (run_save|run_history) or the --stream document.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for validation (default: 1, no process pool).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every schema/sample pair without reading or writing the result cache.",
+    )
+    parser.add_argument(
+        "--no-integrity",
+        action="store_true",
+        help="Skip the cross-file reference/integrity pass over the samples.",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    if args.corpus is not None and args.stream is not None:
+        parser.error("--corpus and --stream are mutually exclusive")
+    if args.corpus is not None and args.schema not in CORPUS_SCHEMAS:
+        parser.error(f"--corpus requires --schema {'|'.join(sorted(CORPUS_SCHEMAS))}")
+    if args.stream is not None and args.schema is None:
+        parser.error("--stream requires --schema")
+    if args.schema is not None and args.corpus is None and args.stream is None:
+        parser.error("--schema is only valid together with --corpus or --stream")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    pattern_problems = PATTERNS.preload(SCHEMAS)
+    if pattern_problems:
+        print("[FAIL] schema pattern registry")
+        for schema_name, err in pattern_problems:
+            print(f"       - {schema_name} {err.path}: {err.message}")
+        print(f"\nValidation failed: {len(pattern_problems)} invalid schema pattern(s)")
+        return 1
+
+    if args.corpus is not None:
+        return validate_corpus(args.corpus, args.schema, args.jobs)
+    if args.stream is not None:
+        return validate_stream_document(args.stream, args.schema)
+
     total = len(PAIRS)
     failed = 0
 
-    print(f"Validating {total} schema/sample pair(s)...")
-    for schema_name, sample_name in PAIRS:
-        ok, errors = validate_pair(schema_name, sample_name)
+    print(f"Validating {total} schema/sample pair(s) ({len(PATTERNS)} compiled pattern(s))...")
+    use_cache = not args.no_cache
+    cached_entries = load_cache(CACHE_PATH) if use_cache else {}
+    keys = [pair_cache_key(schema_name, sample_name) if use_cache else None for schema_name, sample_name in PAIRS]
+    cached_results = [
+        read_cache_entry(cached_entries.get(key)) if key is not None else None for key in keys
+    ]
+    fresh_results = iter_pair_results(
+        [pair for pair, cached in zip(PAIRS, cached_results) if cached is None], args.jobs
+    )
+
+    next_entries: dict[str, Any] = {}
+    for (schema_name, sample_name), key, cached in zip(PAIRS, keys, cached_results):
         label = f"{schema_name} <= {sample_name}"
-        if ok:
-            print(f"[OK]   {label}")
-            continue
-        failed += 1
-        print(f"[FAIL] {label}")
-        for err in errors:
-            print(f"       - {err.path}: {err.message}")
+        if cached is None:
+            ok, errors = next(fresh_results)
+        else:
+            ok, errors = cached
+            label = f"{label} (cached)"
+        if key is not None:
+            next_entries[key] = cache_entry(ok, errors)
+        if not ok:
+            failed += 1
+        print_result(label, errors)
 
-    if failed:
-        print(f"\nValidation failed: {failed}/{total} pair(s)")
+    if use_cache:
+        save_cache(CACHE_PATH, next_entries)
+
+    integrity_errors = 0
+    if not args.no_integrity:
+        issues, resolved, indexed = check_integrity(load_integrity_documents())
+        print_integrity_result(issues, resolved, indexed)
+        integrity_errors = sum(1 for issue in issues if issue.level == "error")
+
+    if failed or integrity_errors:
+        print(f"\nValidation failed: {failed}/{total} pair(s), {integrity_errors} integrity error(s)")
         return 1
 
     print("\nValidation passed: all pairs are valid")